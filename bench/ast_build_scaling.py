@@ -0,0 +1,92 @@
+'''Benchmark skala AST building: waktu per node parse tree untuk tree yang makin besar.
+
+Jalankan dari root repo:  python bench/ast_build_scaling.py [ukuran ...]
+
+Tiap bentuk program dibangun dengan ukuran n yang naik 2x. ASTBuilder (di atas ParseNode tree) dan
+ASTParser (parse + AST sekaligus dari event parser, jadi termasuk waktu parsing) harus linear: kolom
+us/node kira-kira tetap saat n naik. Bentuk "parens" = nesting pass-through murni (<expression> -> ... -> <factor> -> "(")
+yang dulu bikin ASTBuilder build ulang subtree, kolom us/node-nya langsung naik 2x per level.
+'''
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.config_cache import ConfigCache
+from src.dfa.dfa_engine import DFAEngine
+from src.lexer.backends import create_lexer, DEFAULT_BACKEND
+from src.parser.parse_node import ParseNode
+from src.parser.parser import Parser
+from src.semantic.AST.ast_builder import ASTBuilder
+from src.semantic.AST.ast_parser import ASTParser
+
+CONFIG_DIR = ROOT / "src" / "config"
+DEFAULT_SIZES = [500, 1000, 2000, 4000, 8000]
+
+HEADER = "program Bench;\nvariabel x: integer; flag: boolean;\nmulai\n"
+
+
+def flat(n):
+    '''n assignment berurutan, tree lebar dan dangkal'''
+    return HEADER + ";\n".join(f"  x := x * {i} + (x - 1)" for i in range(n)) + "\nselesai.\n"
+
+def parens(n):
+    '''satu ekspresi dengan n kurung bersarang, tiap level 4 node pass-through'''
+    return HEADER + "  x := " + "(" * n + "x" + ")" * n + "\nselesai.\n"
+
+def statements(n):
+    '''n jika/selama/mulai bersarang'''
+    return (HEADER + "  jika flag maka selama flag lakukan mulai\n" * n + "  x := 1\n"
+            + "  selesai\n" * n + "selesai.\n")
+
+SHAPES = {"flat": flat, "parens": parens, "statements": statements}
+
+
+def count_nodes(root):
+    '''Jumlah node parse tree (produksi + token leaf), tanpa rekursi'''
+    count, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, ParseNode):
+            stack.extend(node.child)
+    return count
+
+def best_of(repeat, run):
+    '''Waktu tercepat dari beberapa run, GC dimatikan biar ga ikut terukur'''
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    config = ConfigCache.load(str(CONFIG_DIR / "states.json"), str(CONFIG_DIR / "transitions.json"),
+                              str(CONFIG_DIR / "token_maps.json"))
+    lexer = create_lexer(DFAEngine(config.dfa_config), config.lexer_config, DEFAULT_BACKEND, config)
+
+    print(f"{'shape':<11}{'n':>7}{'nodes':>10}{'ASTBuilder':>12}{'us/node':>9}{'ASTParser':>12}{'us/node':>9}")
+    for name, shape in SHAPES.items():
+        for n in sizes:
+            tokens = lexer.tokenize(shape(n))
+            root = Parser(iter(tokens)).parse()
+            nodes = count_nodes(root)
+            build = best_of(3, lambda: ASTBuilder(root).build())
+            direct = best_of(3, lambda: ASTParser(iter(tokens)).parse())
+            print(f"{name:<11}{n:>7}{nodes:>10}{build:>11.3f}s{build / nodes * 1e6:>9.2f}"
+                  f"{direct:>11.3f}s{direct / nodes * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
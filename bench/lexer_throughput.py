@@ -0,0 +1,104 @@
+'''Benchmark throughput lexer: DFAEngine.run dan tokenize per backend untuk beberapa bentuk input.
+
+Jalankan dari root repo:  python bench/lexer_throughput.py [jumlah statement]
+
+Kolom "table walk" = DFA jalan per karakter lewat class_map + tabel flat (cara DFAEngine.run
+sebelum ada rows/loops), dibandingkan dengan DFAEngine.run di posisi token yang sama. Bentuk
+"program" didominasi token pendek (overhead per token), "identifiers" dan "strings" token
+panjang (self-loop yang dilewati satu regex match).
+'''
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.config_cache import ConfigCache
+from src.dfa.dfa_config import NO_TRANSITION
+from src.dfa.dfa_engine import DFAEngine
+from src.lexer.backends import create_lexer, LEXER_BACKENDS
+
+CONFIG_DIR = ROOT / "src" / "config"
+DEFAULT_STATEMENTS = 20000
+
+
+def program(n):
+    '''Program biasa: assignment, if, call, while bergantian'''
+    lines = ["program Bench;", "variabel x, y, i: integer; r: real; flag: boolean;", "mulai"]
+    for i in range(n):
+        lines.append([f"  x := x + {i} * (y - 3) mod 7;",
+                      f"  jika x > {i} maka y := y + 1 selain_itu r := r * 1.5;",
+                      f"  writeln('baris ke', {i}, 'nilai', x);",
+                      f"  selama flag dan (i < {i}) lakukan i := i + 1;"][i % 4])
+    return "\n".join(lines + ["  x := 0", "selesai."]) + "\n"
+
+def identifiers(n):
+    return "\n".join(f"nama_variabel_yang_cukup_panjang_{i} := lainnya_juga_panjang_{i};" for i in range(n)) + "\n"
+
+def strings(n):
+    return "\n".join(f"writeln('string literal yang isinya lumayan panjang nomor {i}');" for i in range(n)) + "\n"
+
+SHAPES = {"program": program, "identifiers": identifiers, "strings": strings}
+
+
+def table_walk(compiled, text, start):
+    '''DFA per karakter lewat class_map + tabel flat, referensi buat DFAEngine.run'''
+    table, accepting, num_classes = compiled.table, compiled.accepting, compiled.num_classes
+    class_map, char_class = compiled.class_map, compiled.char_class
+    state, last_final, index, length = compiled.start, None, start, len(text)
+    while index < length:
+        cls = class_map.get(text[index])
+        if cls is None:
+            cls = char_class(text[index])
+        target = table[state * num_classes + cls]
+        if target == NO_TRANSITION:
+            break
+        state = target
+        if accepting[state]:
+            last_final = state
+        index += 1
+    return index, last_final
+
+def best_of(repeat, run):
+    '''Waktu tercepat dari beberapa run, GC dimatikan biar ga ikut terukur'''
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+def main(argv):
+    statements = int(argv[0]) if argv else DEFAULT_STATEMENTS
+    config = ConfigCache.load(str(CONFIG_DIR / "states.json"), str(CONFIG_DIR / "transitions.json"),
+                              str(CONFIG_DIR / "token_maps.json"))
+    engine = DFAEngine(config.dfa_config)
+    compiled = engine.compiled
+    lexers = {backend: create_lexer(engine, config.lexer_config, backend, config) for backend in LEXER_BACKENDS}
+
+    for name, shape in SHAPES.items():
+        text = shape(statements)
+        starts = list(lexers["dfa"].tokenize_buffer(text).starts)
+        assert all(table_walk(compiled, text, start) == engine.run(text, start) for start in starts[:1000])
+        walk = best_of(3, lambda: [table_walk(compiled, text, start) for start in starts])
+        run = best_of(3, lambda: [engine.run(text, start) for start in starts])
+        print(f"{name}: {len(text) / 1e6:.2f}M char, {len(starts)} token")
+        print(f"  {'table walk':<26}{walk:>8.3f}s{walk / len(starts) * 1e6:>8.2f} us/token")
+        print(f"  {'DFAEngine.run':<26}{run:>8.3f}s{run / len(starts) * 1e6:>8.2f} us/token  ({walk / run:.1f}x)")
+        for backend, lexer in lexers.items():
+            for method in ("tokenize_buffer", "tokenize"):
+                elapsed = best_of(3, lambda: getattr(lexer, method)(text))
+                label = f"{backend}.{method}"
+                print(f"  {label:<26}{elapsed:>8.3f}s{elapsed / len(starts) * 1e6:>8.2f} us/token")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
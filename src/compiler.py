@@ -1,30 +1,35 @@
+import io
 import os
 import sys
 import traceback
 
 from pathlib import Path
-from src.lexer.lexer import Lexer
+from src.lexer.backends import create_lexer, DEFAULT_BACKEND
+from src.lexer.parallel import tokenize_parallel
 from src.dfa.dfa_engine import DFAEngine
-from src.dfa.dfa_config import DFAConfigLoader
-from src.lexer.lexer_config import LexerConfigLoader
+from src.config_cache import ConfigCache
 from src.lexer.lexical_error import LexicalError
 from src.parser.parse_error import ParseError
-from src.utils import read_file, write_file, format_output, print_usage, symbol_table_to_str
+from src.source_file import SourceFile
+from src.utils import read_file, write_file, format_output, print_usage, symbol_table_to_str, parse_args
 from src.parser.parser import Parser
-from src.semantic.AST.ast_node import ASTNode
-from src.semantic.AST.ast_builder import ASTBuilder
-from src.semantic.symbol.symbol_table import SymbolTable
+from src.parser.parse_tree import ParseTreeBuilder
+from src.semantic.AST.ast_builder import ASTError
+from src.semantic.AST.ast_parser import ASTParser
+from src.semantic.AST.ast_printer import AST_WRITERS, ASTPrinter
 from src.semantic.semantic_analyzer import SemanticAnalyzer
 from src.semantic.errors import SemanticError
 
 def compiler():
     symbol_table_str = None
 
-    if len(sys.argv) != 2:
+    args, options = parse_args(sys.argv[1:])
+    if len(args) != 1:
         print_usage()
         sys.exit(1)
     else:
-        parts = sys.argv[1].replace("\\", "/").split("/")
+        source_arg = args[0]
+        parts = source_arg.replace("\\", "/").split("/")
         dir_output = parts[0]
         print(dir_output)
 
@@ -36,9 +41,12 @@ def compiler():
         TRANSITIONS_PATH = os.path.join(CONFIG_DIR, "transitions.json")
         LEXER_CONFIG_PATH = os.path.join(CONFIG_DIR, "token_maps.json")
 
-        # Load config
-        dfa_config = DFAConfigLoader.load(STATE_PATH, TRANSITIONS_PATH)
-        lexer_config = LexerConfigLoader.load(LEXER_CONFIG_PATH)
+        # Load config (compiled, dari cache kalau JSON ga berubah)
+        compiled_config = ConfigCache.load(STATE_PATH, TRANSITIONS_PATH, LEXER_CONFIG_PATH)
+        dfa_config = compiled_config.dfa_config
+        lexer_config = compiled_config.lexer_config
+        if "dfa-report" in options:
+            print(compiled_config.dfa_report)
 
     except FileNotFoundError as e:
         print(f"[Config Error] Config file not found: {e.filename}")
@@ -49,19 +57,42 @@ def compiler():
 
 	# Initialize engine & lexer
     dfa_engine = DFAEngine(dfa_config)
-    lexer = Lexer(dfa_engine, lexer_config)
+    try:
+        lexer = create_lexer(dfa_engine, lexer_config, options.get("lexer", DEFAULT_BACKEND), compiled_config)
+        jobs = options.get("jobs", "1")
+        if not jobs.isdigit() or int(jobs) < 1:
+            raise ValueError(f"Invalid --jobs value '{jobs}', expected a positive integer")
+        jobs = int(jobs)
+        ast_format = options.get("ast-format", "text")
+        if ast_format not in AST_WRITERS:
+            raise ValueError(f"Invalid --ast-format value '{ast_format}', expected one of {', '.join(AST_WRITERS)}")
+        # --no-echo: symbol table & decorated AST cuma ditulis ke file output
+        echo = "no-echo" not in options
+    except ValueError as e:
+        print(f"[Error] {e}")
+        print_usage()
+        sys.exit(1)
 
     # Input source file
-    source_path = BASE_DIR / "test" / sys.argv[1]
+    source_path = BASE_DIR / "test" / source_arg
     try:
         # Milestone 1: read pascal -> tokenize
         if dir_output == "milestone-1" or dir_output == "milestone-2" or dir_output == "milestone-3":
-            source_code = read_file(source_path)
-            tokens = lexer.tokenize(source_code)
+            source_file = SourceFile(read_file(source_path), str(source_path))
+            source_code = source_file.text
+            if jobs > 1:
+                tokens = tokenize_parallel(lexer, source_code, jobs)
+            elif dir_output != "milestone-3":
+                # milestone-1 ditulis dari kolom buffer, milestone-2 pakai buffer yang sama di Parser dan ParseTree
+                tokens = lexer.tokenize_buffer(source_code)
+            else:
+                # Parser narik token langsung dari lexer, token list ga pernah dibangun utuh
+                tokens = lexer.iter_tokens(io.StringIO(source_code))
         else:
             print("[Error] Unknown directory, expected milestone-1 or milestone-2")
             sys.exit(1)
     except LexicalError as e:
+        e.source = source_file
         print(str(e))
         sys.exit(1)
     except FileNotFoundError:
@@ -71,43 +102,56 @@ def compiler():
     try:
         # biar milestone-1 ga parse
         root = None
-        if dir_output == "milestone-2" or dir_output == "milestone-3":
-            parser = Parser(tokens)
+        ast_root = None
+        if dir_output == "milestone-2":
+            # parse tree langsung ditulis ke arena ParseTree di atas TokenBuffer yang sama dengan Parser
+            parser = Parser(tokens, source_file, ParseTreeBuilder(tokens))
             root = parser.parse()
+        elif dir_output == "milestone-3":
+            # AST langsung dari parser, parse tree cuma dibangun kalau di-output (milestone-2)
+            parser = ASTParser(tokens, source_file)
+            ast_root = parser.parse()
 
+    except LexicalError as e:
+        e.source = source_file
+        print(str(e))
+        sys.exit(1)
     except ParseError as e:
-        e.full_source_text = source_code
         print(str(e))
         sys.exit(1)
+    except ASTError as e:
+        print(f"[AST Builder Error] {str(e)}")
+        traceback.print_exc()
+        sys.exit(1)
 
     try:
-        ast_root = None
         if dir_output == "milestone-3":
-            keywords_path = Path("src/config/token_maps.json")
-            ast_builder = ASTBuilder(root)
-            ast_root = ast_builder.build()
-
-            print("\n============================= SEMANTIC ANALYSIS + SYMBOL TABLE =============================")
+            if echo:
+                print("\n============================= SEMANTIC ANALYSIS + SYMBOL TABLE =============================")
             analyzer = SemanticAnalyzer()
             success, errors = analyzer.analyze(ast_root)
 
-            analyzer.symbol_table.print_tables()
+            # tabel dirender sekali, dipakai untuk echo dan file output
             symbol_table_str = symbol_table_to_str(analyzer.symbol_table)
+            if echo:
+                sys.stdout.write(symbol_table_str)
 
-            print("\n================================= DECORATED AST =================================\n")
-            print(ast_root)
+                print("\n================================= DECORATED AST =================================\n")
+                ASTPrinter(sys.stdout).print(ast_root)
+                print()
 
             if not success:
                 print("Semantic errors found:")
                 for error in errors:
-                    print(f"  - {error}")
+                    # render = pesan + line konteks dari source (kalau error punya posisi)
+                    print("  - " + error.render(source_file).replace("\n", "\n    "))
                 sys.exit(1)
             else:
                 print("\n[OK] Semantic analysis passed!")
                 print(f"[OK] Symbol table created with {len(analyzer.symbol_table.tab)} entries")
 
     except SemanticError as e:
-        print(f"[Semantic Error] {str(e)}")
+        print(f"[Semantic Error] {e.render(source_file)}")
         sys.exit(1)
     except Exception as e:
         print(f"[AST Builder Error] {str(e)}")
@@ -115,10 +159,12 @@ def compiler():
         sys.exit(1)
 
     #output
-    output = format_output(ast_root, root, tokens, dir_output, symbol_table=symbol_table_str)
-    lexer_relative_path = '/'.join(['test',dir_output,'output','output.txt'])
+    output_name = "output.jsonl" if dir_output == "milestone-3" and ast_format == "jsonl" else "output.txt"
+    lexer_relative_path = '/'.join(['test',dir_output,'output',output_name])
     lexer_output_path = os.path.join(BASE_DIR, lexer_relative_path)
-    write_file(output,lexer_output_path)
+    write_file(lambda f: format_output(ast_root, root, tokens, dir_output, symbol_table=symbol_table_str, fp=f,
+                                       ast_format=ast_format),
+               lexer_output_path)
     print(f"SAVED => {lexer_relative_path}")
 
     # if dir_output == "milestone-3":
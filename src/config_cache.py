@@ -0,0 +1,114 @@
+import hashlib
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.dfa.dfa_config import DFAConfig, DFAConfigLoader
+from src.dfa.dfa_minimizer import DFAMinimizer, MinimizeReport
+from src.lexer.lexer_config import LexerConfig, LexerConfigLoader
+from src.lexer.regex_lexer import build_master_pattern
+from src.lexer.generated_lexer import generate_scanner_source
+
+# Naikkan kalau format file cache sendiri berubah biar cache lama dibuang
+CACHE_VERSION = 3
+
+CACHE_FILE = "compiled_config.pickle"
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    '''Semua hasil compile config JSON: DFA (sudah diminimisasi), token maps, master regex
+    (source + group), dan source module scanner hasil generate'''
+    dfa_config: DFAConfig
+    lexer_config: LexerConfig
+    regex_pattern: Tuple[str, Dict[str, str]]
+    dfa_report: MinimizeReport
+    scanner_source: str
+
+
+# Kode yang hasilnya ikut di-pickle (loader, minimizer, generator regex/scanner, layout CompiledConfig),
+# source module-nya masuk key jadi cache otomatis basi kalau salah satunya diubah
+GENERATORS = (DFAConfigLoader, DFAMinimizer, LexerConfigLoader, build_master_pattern, generate_scanner_source)
+
+
+class ConfigCache:
+    '''Cache on-disk untuk config compiled, key = hash isi ketiga file JSON + source module generator.
+
+    Cache disimpan di <config dir>/__pycache__ dan otomatis di-rebuild kalau salah satu
+    file JSON atau module di GENERATORS (termasuk module ini) berubah, CACHE_VERSION naik,
+    atau file cache rusak/ga kebaca.
+    '''
+    @staticmethod
+    def load(state_path: str, transitions_path: str, lexer_config_path: str,
+             cache_dir: Optional[str] = None) -> CompiledConfig:
+        paths = (state_path, transitions_path, lexer_config_path)
+        key = ConfigCache.key(paths)
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(state_path)), "__pycache__")
+        cache_path = os.path.join(cache_dir, CACHE_FILE)
+
+        compiled = ConfigCache._read(cache_path, key)
+        if compiled is None:
+            compiled = ConfigCache.build(*paths)
+            ConfigCache._write(cache_path, key, compiled)
+        return compiled
+
+    @staticmethod
+    def key(paths: Tuple[str, ...]) -> str:
+        '''sha256 dari isi file config dan source generator (FileNotFoundError diteruskan ke caller)'''
+        digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for path in (*paths, *ConfigCache.generator_sources()):
+            with open(path, "rb") as f:
+                data = f.read()
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def generator_sources() -> Tuple[str, ...]:
+        '''Path file source module generator + module ini, urut & tanpa duplikat'''
+        modules = {obj.__module__ for obj in GENERATORS} | {__name__}
+        return tuple(sorted(sys.modules[module].__file__ for module in modules))
+
+    @staticmethod
+    def build(state_path: str, transitions_path: str, lexer_config_path: str) -> CompiledConfig:
+        dfa_config = DFAConfigLoader.load(state_path, transitions_path)
+        lexer_config = LexerConfigLoader.load(lexer_config_path)
+        dfa_config, dfa_report = DFAMinimizer.minimize(dfa_config, lexer_config.state_token_map)
+        pattern, group_states = build_master_pattern(dfa_config.compiled)
+        return CompiledConfig(
+            dfa_config = dfa_config,
+            lexer_config = lexer_config,
+            regex_pattern = (pattern.pattern, group_states),
+            dfa_report = dfa_report,
+            scanner_source = generate_scanner_source(dfa_config.compiled)
+        )
+
+    @staticmethod
+    def _read(cache_path: str, key: str) -> Optional[CompiledConfig]:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, compiled = pickle.load(f)
+        except Exception:
+            # Belum ada, rusak, atau dari versi class yang beda -> rebuild
+            return None
+        if cached_key != key or not isinstance(compiled, CompiledConfig):
+            return None
+        return compiled
+
+    @staticmethod
+    def _write(cache_path: str, key: str, compiled: CompiledConfig):
+        # Tulis ke file sementara lalu rename biar proses paralel ga baca cache setengah jadi
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, compiled), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Direktori read-only dsb: jalan terus tanpa cache
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,9 +1,46 @@
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
 from src.utils import read_json
 
 StateTransitions = Dict[str,str]
 
+# Kelas karakter wildcard di transitions.json
+LETTER = "<LETTER>"
+DIGIT = "<DIGIT>"
+ANY = "<ANY>"
+
+NO_TRANSITION = -1
+
+@dataclass(frozen=True)
+class CompiledDFA:
+    '''DFA versi compiled: state id integer, tabel kelas karakter, dan tabel transisi flat
+
+    table[state * num_classes + char_class] = state tujuan (NO_TRANSITION kalau ga ada)
+    '''
+    state_names: Tuple[str, ...]
+    state_ids: Dict[str, int]
+    start: int
+    accepting: Tuple[bool, ...]
+    num_classes: int
+    class_map: Dict[str, int]
+    letter_class: int
+    digit_class: int
+    other_class: int
+    table: array
+
+    def char_class(self, char: str) -> int:
+        '''Kelas karakter, karakter non-literal dikelompokkan jadi letter/digit/other'''
+        cls = self.class_map.get(char)
+        if cls is not None:
+            return cls
+        if char.isalpha():
+            return self.letter_class
+        if char.isdigit():
+            return self.digit_class
+        return self.other_class
+
+
 @dataclass(frozen=True)
 class DFAConfig:
     '''Store states & transitions dari Json config'''
@@ -11,33 +48,90 @@ class DFAConfig:
     final_states: Set[str]
     states: Set[str]
     transitions: Dict[str,StateTransitions]
-    
+    compiled: CompiledDFA
+
 
-class DFAConfigLoader: 
+class DFAConfigLoader:
     '''DFA confiig loader'''
     @staticmethod
     def load(state_path: str, transitions_path: str) -> DFAConfig:
         state_data = read_json(state_path)
         transition_data = read_json(transitions_path)
-        
+
         missing = [k for k in ("start_state", "final_states") if k not in state_data]
         if missing:
             raise ValueError(f"Missing keys in DFA config: {', '.join(missing)}")
-        
+
         start_state = state_data["start_state"]
         final_states = set(state_data["final_states"])
         transitions: Dict[str, StateTransitions] = transition_data
-        
+
         states: Set[str] = set(transitions.keys())
         for mapping in transitions.values():
             states.update(mapping.values())
         states.update(final_states)
-        
+
         return DFAConfig(
             start_state = start_state,
             final_states = final_states,
             states = states,
-            transitions = transitions
+            transitions = transitions,
+            compiled = DFAConfigLoader.compile(start_state, final_states, states, transitions)
 		)
-     
-     
\ No newline at end of file
+
+    @staticmethod
+    def compile(start_state: str, final_states: Set[str], states: Set[str],
+                transitions: Dict[str, StateTransitions]) -> CompiledDFA:
+        '''Compile transitions jadi tabel integer, urutan prioritas sama dengan lookup lama:
+        literal -> <LETTER> -> <DIGIT> -> <ANY>'''
+        state_names: List[str] = [start_state] + sorted(states - {start_state})
+        state_ids = {name: i for i, name in enumerate(state_names)}
+
+        # Tiap karakter literal punya kelas sendiri, sisanya letter/digit/other
+        literals = sorted({c for mapping in transitions.values() for c in mapping
+                           if c not in (LETTER, DIGIT, ANY)})
+        for c in literals:
+            if len(c) != 1:
+                raise ValueError(f"Invalid transition symbol in DFA config: '{c}'")
+        class_map = {c: i for i, c in enumerate(literals)}
+        letter_class = len(literals)
+        digit_class = letter_class + 1
+        other_class = digit_class + 1
+        num_classes = other_class + 1
+
+        # Karakter ASCII di-resolve di awal biar lookup di hot loop cukup satu dict get
+        for code in range(128):
+            c = chr(code)
+            if c not in class_map:
+                class_map[c] = letter_class if c.isalpha() else digit_class if c.isdigit() else other_class
+
+        # (is_alpha, is_digit) contoh karakter per kelas buat resolve wildcard
+        class_props = [(c.isalpha(), c.isdigit()) for c in literals]
+        class_props += [(True, False), (False, True), (False, False)]
+
+        table = array('i', [NO_TRANSITION]) * (len(state_names) * num_classes)
+        for name, mapping in transitions.items():
+            base = state_ids[name] * num_classes
+            for cls, (is_alpha, is_digit) in enumerate(class_props):
+                target = mapping.get(literals[cls]) if cls < letter_class else None
+                if target is None and is_alpha:
+                    target = mapping.get(LETTER)
+                if target is None and is_digit:
+                    target = mapping.get(DIGIT)
+                if target is None:
+                    target = mapping.get(ANY)
+                if target is not None:
+                    table[base + cls] = state_ids[target]
+
+        return CompiledDFA(
+            state_names = tuple(state_names),
+            state_ids = state_ids,
+            start = state_ids[start_state],
+            accepting = tuple(name in final_states for name in state_names),
+            num_classes = num_classes,
+            class_map = class_map,
+            letter_class = letter_class,
+            digit_class = digit_class,
+            other_class = other_class,
+            table = table
+        )
@@ -1,34 +1,75 @@
-from .dfa_config import DFAConfig
+import re
+from typing import Optional, Tuple
+from .dfa_config import CompiledDFA, DFAConfig, NO_TRANSITION
 
 class DFAEngine:
-    '''Runtime state transition'''
+    '''Runtime state transition (pakai tabel compiled dari DFAConfig).
+
+    Engine ga punya state sendiri: state DFA selalu dioper & dikembalikan lewat argumen,
+    jadi satu engine aman dipakai bareng banyak lexer/thread/file sekaligus.
+    '''
     def __init__(self, config: DFAConfig):
         self.config = config
-        self.current_state = config.start_state
-        self.last_final_state = None
-
-    def reset_state(self):
-        self.current_state = self.config.start_state
-        self.last_final_state = None
-
-    def next_state(self, char):
-        trans = self.config.transitions.get(self.current_state, {})
-
-        if char in trans:
-            self.current_state = trans[char]
-        elif "<LETTER>" in trans and char.isalpha():
-            self.current_state = trans["<LETTER>"]
-        elif "<DIGIT>" in trans and char.isdigit():
-            self.current_state = trans["<DIGIT>"]
-        elif "<ANY>" in trans:
-            self.current_state = trans["<ANY>"]
-        else:
-            return False
-
-        if self.current_state in self.config.final_states:
-            self.last_final_state = self.current_state
-
-        return True
-
-    def is_accepting(self):
-        return self.current_state in self.config.final_states
+        self.compiled = config.compiled
+        self.rows, self.loops = self._fast_tables(self.compiled)
+        self.accepting = self.compiled.accepting
+        self.start_state = self.compiled.start
+
+    @staticmethod
+    def _fast_tables(compiled: CompiledDFA) -> Tuple[tuple, tuple]:
+        '''Tabel hot loop run: per state dict char -> state tujuan (semua char di class_map, jadi
+        satu lookup tanpa hitung kelas), dan matcher regex untuk self-loop ASCII biar run
+        identifier/angka/isi string dilewati sekaligus'''
+        num_classes = compiled.num_classes
+        table = compiled.table
+        rows, loops = [], []
+        for state in range(len(compiled.state_names)):
+            base = state * num_classes
+            row = {c: table[base + cls] for c, cls in compiled.class_map.items()}
+            rows.append(row)
+            looping = "".join(sorted(c for c, target in row.items() if target == state and c < "\x80"))
+            loops.append(re.compile(f"[{re.escape(looping)}]*").match if looping else None)
+        return tuple(rows), tuple(loops)
+
+    def next_state(self, state: int, char: str) -> int:
+        '''State tujuan dari state lewat char, NO_TRANSITION kalau stuck'''
+        compiled = self.compiled
+        return compiled.table[state * compiled.num_classes + compiled.char_class(char)]
+
+    def is_accepting(self, state: int) -> bool:
+        return self.compiled.accepting[state]
+
+    def state_name(self, state: int) -> str:
+        return self.compiled.state_names[state]
+
+    def run(self, text: str, start: int) -> Tuple[int, Optional[int]]:
+        '''Jalankan DFA dari text[start] sampai stuck / akhir text (tanpa side effect).
+        Return (index berhenti, final state terakhir yang dilewati atau None).
+
+        Hasil sama dengan jalan per karakter lewat table/char_class, cuma lookup-nya langsung
+        per char (rows) dan self-loop ASCII dilewati satu regex match'''
+        rows = self.rows
+        state = self.start_state
+        row = rows[state]
+        last_final = None
+        index = start
+        length = len(text)
+        while index < length:
+            target = row.get(text[index])
+            if target is None:
+                # Karakter di luar class_map (non-ASCII)
+                target = self.next_state(state, text[index])
+            if target == NO_TRANSITION:
+                break
+            index += 1
+            if target == state:
+                skip = self.loops[state]
+                if skip is not None:
+                    index = skip(text, index).end()
+                continue
+            state = target
+            row = rows[state]
+            if self.accepting[state]:
+                last_final = state
+
+        return index, last_final
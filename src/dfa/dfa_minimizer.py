@@ -0,0 +1,213 @@
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from .dfa_config import CompiledDFA, DFAConfig, NO_TRANSITION
+
+@dataclass(frozen=True)
+class MinimizeReport:
+    '''Hasil analisis DFA waktu config di-load'''
+    merged: Dict[str, Tuple[str, ...]]      # state representative -> state lain yang digabung ke dia
+    unreachable: Tuple[str, ...]            # dibuang, ga bisa dicapai dari start state
+    dead: Tuple[str, ...]                   # ga bisa mencapai final state (tetap disimpan, lihat minimize)
+    unused_token_states: Tuple[str, ...]    # ada di state_token_map tapi bukan final state
+    states_before: int
+    states_after: int
+    classes_before: int
+    classes_after: int
+
+    def __str__(self) -> str:
+        lines = [f"DFA states: {self.states_before} -> {self.states_after}, "
+                 f"char classes: {self.classes_before} -> {self.classes_after}"]
+        for state, others in self.merged.items():
+            lines.append(f"  merged: {state} <- {', '.join(others)}")
+        if self.unreachable:
+            lines.append(f"  unreachable (removed): {', '.join(self.unreachable)}")
+        if self.dead:
+            lines.append(f"  dead (kept): {', '.join(self.dead)}")
+        if self.unused_token_states:
+            lines.append(f"  state_token_map entries without final state: {', '.join(self.unused_token_states)}")
+        return "\n".join(lines)
+
+
+class DFAMinimizer:
+    '''Minimisasi DFA compiled (Hopcroft) dengan tetap menjaga semantik lexer run-until-stuck.
+
+    - Final state cuma boleh digabung kalau token type-nya (state_token_map) sama.
+    - "Ga ada transisi" (stuck) dianggap beda dengan pindah ke state yang ga bisa mencapai final,
+      karena lexer tetap mengkonsumsi karakter di state tersebut. Jadi dead state dilaporkan
+      dan boleh digabung sesamanya, tapi tidak dibuang (membuangnya mengubah batas token).
+    - State yang ga reachable dari start dibuang.
+    - Kelas karakter yang kolom transisinya identik digabung.
+    '''
+    @staticmethod
+    def minimize(config: DFAConfig, state_token_map: Dict[str, str]) -> Tuple[DFAConfig, MinimizeReport]:
+        compiled = config.compiled
+        names = compiled.state_names
+        num_classes = compiled.num_classes
+        table = compiled.table
+
+        missing = [names[s] for s in range(len(names)) if compiled.accepting[s] and names[s] not in state_token_map]
+        if missing:
+            raise ValueError(f"Final states without token type in state_token_map: {', '.join(sorted(missing))}")
+        unused = tuple(sorted(state for state in state_token_map if state not in config.final_states))
+
+        reachable = DFAMinimizer._reachable(compiled)
+        dead = DFAMinimizer._dead(compiled, reachable)
+        blocks = DFAMinimizer._hopcroft(compiled, reachable, state_token_map)
+
+        # Representative = state id terkecil di block, start state (id 0) selalu jadi state 0 baru
+        blocks.sort(key=min)
+        block_of: Dict[int, int] = {}
+        for i, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = i
+        reps = [min(block) for block in blocks]
+
+        new_table = array('i', [NO_TRANSITION]) * (len(reps) * num_classes)
+        for i, rep in enumerate(reps):
+            for cls in range(num_classes):
+                target = table[rep * num_classes + cls]
+                if target != NO_TRANSITION:
+                    new_table[i * num_classes + cls] = block_of[target]
+
+        new_table, class_remap, new_num_classes = DFAMinimizer._merge_classes(new_table, len(reps), num_classes)
+        state_names = tuple(names[rep] for rep in reps)
+        minimized = CompiledDFA(
+            state_names = state_names,
+            state_ids = {name: i for i, name in enumerate(state_names)},
+            start = block_of[compiled.start],
+            accepting = tuple(compiled.accepting[rep] for rep in reps),
+            num_classes = new_num_classes,
+            class_map = {c: class_remap[cls] for c, cls in compiled.class_map.items()},
+            letter_class = class_remap[compiled.letter_class],
+            digit_class = class_remap[compiled.digit_class],
+            other_class = class_remap[compiled.other_class],
+            table = new_table
+        )
+
+        rep_name = {names[state]: names[reps[block_of[state]]] for state in block_of}
+        transitions = {rep_name[name]: {symbol: rep_name[target] for symbol, target in mapping.items()}
+                       for name, mapping in config.transitions.items() if name in rep_name and rep_name[name] == name}
+        minimized_config = DFAConfig(
+            start_state = config.start_state,
+            final_states = {name for name in config.final_states if rep_name.get(name) == name},
+            states = set(state_names),
+            transitions = transitions,
+            compiled = minimized
+        )
+
+        report = MinimizeReport(
+            merged = {names[rep]: tuple(names[s] for s in sorted(block) if s != rep)
+                      for rep, block in zip(reps, blocks) if len(block) > 1},
+            unreachable = tuple(names[s] for s in range(len(names)) if s not in reachable),
+            dead = tuple(names[s] for s in sorted(dead)),
+            unused_token_states = unused,
+            states_before = len(names),
+            states_after = len(reps),
+            classes_before = num_classes,
+            classes_after = new_num_classes
+        )
+        return minimized_config, report
+
+    @staticmethod
+    def _reachable(compiled: CompiledDFA) -> Set[int]:
+        num_classes = compiled.num_classes
+        seen = {compiled.start}
+        pending = [compiled.start]
+        while pending:
+            state = pending.pop()
+            for cls in range(num_classes):
+                target = compiled.table[state * num_classes + cls]
+                if target != NO_TRANSITION and target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        return seen
+
+    @staticmethod
+    def _dead(compiled: CompiledDFA, reachable: Set[int]) -> Set[int]:
+        '''State reachable yang ga bisa mencapai final state manapun'''
+        num_classes = compiled.num_classes
+        inverse: Dict[int, List[int]] = {state: [] for state in reachable}
+        for state in reachable:
+            for cls in range(num_classes):
+                target = compiled.table[state * num_classes + cls]
+                if target != NO_TRANSITION:
+                    inverse[target].append(state)
+        alive = {state for state in reachable if compiled.accepting[state]}
+        pending = list(alive)
+        while pending:
+            for source in inverse[pending.pop()]:
+                if source not in alive:
+                    alive.add(source)
+                    pending.append(source)
+        return reachable - alive
+
+    @staticmethod
+    def _hopcroft(compiled: CompiledDFA, reachable: Set[int], state_token_map: Dict[str, str]) -> List[Set[int]]:
+        num_classes = compiled.num_classes
+        sink = -1  # state virtual untuk "stuck", block sendiri
+
+        # inverse[cls][target] = state yang pindah ke target lewat cls (stuck -> sink)
+        inverse: List[Dict[int, List[int]]] = [{} for _ in range(num_classes)]
+        for state in reachable:
+            for cls in range(num_classes):
+                target = compiled.table[state * num_classes + cls]
+                inverse[cls].setdefault(sink if target == NO_TRANSITION else target, []).append(state)
+        for cls in range(num_classes):
+            inverse[cls].setdefault(sink, []).append(sink)
+
+        # Partisi awal: sink, non-final, final per token type
+        groups: Dict[Optional[str], Set[int]] = {}
+        for state in reachable:
+            key = state_token_map[compiled.state_names[state]] if compiled.accepting[state] else None
+            groups.setdefault(key, set()).add(state)
+        partition: List[Set[int]] = [{sink}] + [group for _, group in sorted(groups.items(), key=lambda g: str(g[0]))]
+        block_of = {state: i for i, block in enumerate(partition) for state in block}
+
+        work = list(range(len(partition)))
+        in_work = set(work)
+        while work:
+            index = work.pop()
+            in_work.discard(index)
+            splitter = partition[index]
+            for cls in range(num_classes):
+                sources: Set[int] = set()
+                for target in splitter:
+                    sources.update(inverse[cls].get(target, ()))
+                touched: Dict[int, Set[int]] = {}
+                for state in sources:
+                    touched.setdefault(block_of[state], set()).add(state)
+                for i, inside in touched.items():
+                    block = partition[i]
+                    if len(inside) == len(block):
+                        continue
+                    outside = block - inside
+                    partition[i] = inside
+                    partition.append(outside)
+                    new = len(partition) - 1
+                    for state in outside:
+                        block_of[state] = new
+                    if i in in_work or len(outside) <= len(inside):
+                        work.append(new)
+                        in_work.add(new)
+                    else:
+                        work.append(i)
+                        in_work.add(i)
+        return [block for block in partition if sink not in block]
+
+    @staticmethod
+    def _merge_classes(table: array, num_states: int, num_classes: int) -> Tuple[array, List[int], int]:
+        '''Gabung kelas karakter yang kolom transisinya sama persis'''
+        columns: Dict[Tuple[int, ...], int] = {}
+        remap: List[int] = []
+        for cls in range(num_classes):
+            column = tuple(table[state * num_classes + cls] for state in range(num_states))
+            remap.append(columns.setdefault(column, len(columns)))
+
+        new_num_classes = len(columns)
+        new_table = array('i', [NO_TRANSITION]) * (num_states * new_num_classes)
+        for column, new_cls in columns.items():
+            for state, target in enumerate(column):
+                new_table[state * new_num_classes + new_cls] = target
+        return new_table, remap, new_num_classes
@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING, Optional
+
+from .lexer import Lexer
+from .lexer_config import LexerConfig
+from .regex_lexer import RegexLexer
+from .generated_lexer import GeneratedLexer
+from src.dfa.dfa_engine import DFAEngine
+
+if TYPE_CHECKING:
+    from src.config_cache import CompiledConfig
+
+LEXER_BACKENDS = {
+    "dfa": Lexer,
+    "regex": RegexLexer,
+    "generated": GeneratedLexer,
+}
+
+DEFAULT_BACKEND = "dfa"
+
+def create_lexer(dfa_engine: DFAEngine, config: LexerConfig, backend: str = DEFAULT_BACKEND,
+                 compiled_config: Optional["CompiledConfig"] = None) -> Lexer:
+    '''Pilih backend lexer, semua backend menghasilkan token stream yang sama.
+    compiled_config (hasil ConfigCache) dipakai biar regex/scanner ga di-generate ulang'''
+    lexer_class = LEXER_BACKENDS.get(backend)
+    if lexer_class is None:
+        raise ValueError(f"Unknown lexer backend '{backend}', expected one of: {', '.join(LEXER_BACKENDS)}")
+    if compiled_config is not None:
+        if lexer_class is RegexLexer:
+            return RegexLexer(dfa_engine, config, compiled_config.regex_pattern)
+        if lexer_class is GeneratedLexer:
+            return GeneratedLexer(dfa_engine, config, compiled_config.scanner_source)
+    return lexer_class(dfa_engine, config)
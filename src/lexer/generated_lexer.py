@@ -0,0 +1,225 @@
+from typing import Dict, List, Optional, Set
+
+from .lexer import Lexer
+from .lexer_config import LexerConfig
+from src.dfa.dfa_config import CompiledDFA, NO_TRANSITION
+from src.dfa.dfa_engine import DFAEngine
+
+# Transisi berantai di-inline sampai kedalaman ini, lebih dari itu lompat lewat dispatcher
+MAX_INLINE_DEPTH = 8
+
+# State dengan target sebanyak ini atau lebih pakai tabel byte per karakter ASCII + if biner,
+# bukan rantai if/elif (misal start state yang bercabang ke semua jenis token)
+WIDE_DISPATCH = 6
+
+HEADER = """\
+# Generated dari DFA config oleh src/lexer/generated_lexer.py, jangan diedit manual.
+# Semantik sama dengan DFAEngine.run: jalan sampai stuck, return (index berhenti, final state terakhir / None).
+"""
+
+
+class _Emitter:
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+
+
+def _class_chars(compiled: CompiledDFA) -> List[str]:
+    '''Kelas karakter -> string semua karakter di class_map yang masuk kelas itu'''
+    chars: List[List[str]] = [[] for _ in range(compiled.num_classes)]
+    for c, cls in sorted(compiled.class_map.items()):
+        chars[cls].append(c)
+    return ["".join(c) for c in chars]
+
+
+def _condition(compiled: CompiledDFA, classes: Set[int], class_chars: List[str], expr: str) -> str:
+    '''Ekspresi python "karakter expr masuk salah satu kelas", tanpa dict lookup.
+    expr dievaluasi paling awal (boleh berupa walrus, misal "(c := text[i])"), setelahnya pakai c'''
+    letter = compiled.letter_class in classes
+    digit = compiled.digit_class in classes
+    other = compiled.other_class in classes
+    literals = "".join(c for c in compiled.class_map if ord(c) > 0x7f)
+
+    # Hampir semua karakter (misal isi string literal): cukup test komplemennya
+    if letter and digit and other and not literals:
+        complement = "".join(sorted(c for c, cls in compiled.class_map.items() if cls not in classes))
+        if not complement:
+            return f"{expr} == c"
+        return f"{expr} not in {complement!r}" if len(complement) > 1 else f"{expr} != {complement!r}"
+
+    parts = []
+    chars = "".join(sorted("".join(class_chars[cls] for cls in classes)))
+    if chars:
+        parts.append(f"{expr} in {chars!r}" if len(chars) > 1 else f"{expr} == {chars!r}")
+        expr = "c"
+
+    # Karakter di luar class_map (non-ASCII) jatuh ke letter/digit/other
+    if letter or digit or other:
+        if letter and digit and other:
+            predicate = ""
+        elif letter and digit:
+            predicate = "(c.isalpha() or c.isdigit())"
+        elif letter and other:
+            predicate = "not (not c.isalpha() and c.isdigit())"
+        elif digit and other:
+            predicate = "not c.isalpha()"
+        elif letter:
+            predicate = "c.isalpha()"
+        elif digit:
+            predicate = "(not c.isalpha() and c.isdigit())"
+        else:
+            predicate = "not (c.isalpha() or c.isdigit())"
+        outside = f"{expr} > '\\x7f'"
+        if literals:
+            outside += f" and c not in {literals!r}"
+        parts.append(f"({outside} and {predicate})" if predicate else f"({outside})")
+    return " or ".join(parts) if parts else "False"
+
+
+def generate_scanner_source(compiled: CompiledDFA) -> str:
+    '''Generate module python standalone berisi fungsi scan(text, index) untuk DFA compiled.
+
+    Tiap state jadi kode lurus: self-loop jadi while loop, transisi lain jadi if/elif dengan
+    test kelas karakter inline (str containment, isalpha/isdigit buat non-ASCII). Transisi ke
+    state berikutnya di-inline; cuma siklus (atau rantai yang terlalu dalam) yang lewat dispatcher.
+    '''
+    num_classes = compiled.num_classes
+    table = compiled.table
+    class_chars = _class_chars(compiled)
+
+    def transitions(state: int) -> Dict[int, Set[int]]:
+        targets: Dict[int, Set[int]] = {}
+        for cls in range(num_classes):
+            target = table[state * num_classes + cls]
+            if target != NO_TRANSITION:
+                targets.setdefault(target, set()).add(cls)
+        return targets
+
+    constants: List[str] = []
+    jump_targets: Set[int] = set()
+    pending = [compiled.start]
+    emitted: Set[int] = set()
+
+    def block(out: _Emitter, state: int, indent: int, path: List[int]):
+        targets = transitions(state)
+        loop = targets.pop(state, None)
+        out.emit(indent, f"# {compiled.state_names[state]}")
+        if loop is not None:
+            out.emit(indent, f"while i < length and ({_condition(compiled, loop, class_chars, '(c := text[i])')}):")
+            out.emit(indent + 1, "i += 1")
+        if not targets:
+            out.emit(indent, "return i, last")
+            return
+        out.emit(indent, "if i >= length:")
+        out.emit(indent + 1, "return i, last")
+        if loop is None:
+            out.emit(indent, "c = text[i]")
+
+        # Kelas terbanyak duluan (huruf/angka paling sering muncul)
+        ordered = sorted(targets.items(), key=lambda t: (-sum(len(class_chars[cls]) for cls in t[1]), t[0]))
+        if len(ordered) >= WIDE_DISPATCH:
+            wide_dispatch(out, state, indent, path, ordered)
+            return
+        for n, (target, classes) in enumerate(ordered):
+            keyword = "if" if n == 0 else "elif"
+            out.emit(indent, f"{keyword} {_condition(compiled, classes, class_chars, 'c')}:")
+            step(out, target, indent + 1, path)
+        out.emit(indent, "return i, last")
+
+    def step(out: _Emitter, target: int, indent: int, path: List[int]):
+        out.emit(indent, "i += 1")
+        if compiled.accepting[target]:
+            out.emit(indent, f"last = {target}")
+        if target in path or len(path) >= MAX_INLINE_DEPTH:
+            jump_targets.add(target)
+            if target not in emitted:
+                pending.append(target)
+            out.emit(indent, f"state = {target}")
+            out.emit(indent, "continue")
+        else:
+            block(out, target, indent, path + [target])
+
+    def wide_dispatch(out: _Emitter, state: int, indent: int, path: List[int], ordered):
+        # Nomor cabang per karakter ASCII (0 = stuck), non-ASCII lewat isalpha/isdigit
+        branch_of_class = {cls: n + 1 for n, (_, classes) in enumerate(ordered) for cls in classes}
+        name = f"DISPATCH_{state}"
+        ascii_branches = bytes(branch_of_class.get(compiled.class_map[chr(code)], 0) for code in range(128))
+        constants.append(f"{name} = {ascii_branches!r}")
+        letter = branch_of_class.get(compiled.letter_class, 0)
+        digit = branch_of_class.get(compiled.digit_class, 0)
+        other = branch_of_class.get(compiled.other_class, 0)
+        fallback = f"{letter} if c.isalpha() else {digit} if c.isdigit() else {other}"
+        for c, cls in compiled.class_map.items():
+            if ord(c) > 0x7f:
+                fallback = f"{branch_of_class.get(cls, 0)} if c == {c!r} else " + fallback
+        out.emit(indent, f"k = {name}[ord(c)] if c < '\\x80' else ({fallback})")
+
+        def tree(low: int, high: int, indent: int):
+            if low == high:
+                if low == 0:
+                    out.emit(indent, "return i, last")
+                else:
+                    step(out, ordered[low - 1][0], indent, path)
+                return
+            mid = (low + high + 1) // 2
+            out.emit(indent, f"if k < {mid}:")
+            tree(low, mid - 1, indent + 1)
+            out.emit(indent, "else:")
+            tree(mid, high, indent + 1)
+        tree(0, len(ordered), indent)
+
+    # State yang jadi target lompatan ditaruh di dispatcher loop, sisanya inline
+    blocks: Dict[int, List[str]] = {}
+    while pending:
+        state = pending.pop()
+        if state in emitted:
+            continue
+        emitted.add(state)
+        out = _Emitter()
+        block(out, state, 0, [state])
+        blocks[state] = out.lines
+
+    lines = [HEADER, f"STATE_NAMES = {compiled.state_names!r}"] + constants + ["", "",
+             "def scan(text, index):",
+             "    '''Jalankan DFA dari text[index] sampai stuck. Return (index berhenti, final state id / None)'''",
+             "    length = len(text)",
+             "    i = index",
+             "    last = None",
+             "    c = ''"]
+    if not jump_targets:
+        lines.extend("    " + line for line in blocks[compiled.start])
+    else:
+        lines.append(f"    state = {compiled.start}")
+        lines.append("    while True:")
+        for n, state in enumerate([compiled.start] + sorted(jump_targets - {compiled.start})):
+            keyword = "if" if n == 0 else "elif"
+            lines.append(f"        {keyword} state == {state}:")
+            lines.extend("            " + line for line in blocks[state])
+    return "\n".join(lines) + "\n"
+
+
+def load_scanner(source: str):
+    '''Compile source hasil generate_scanner_source, return fungsi scan-nya'''
+    namespace: Dict[str, object] = {}
+    exec(compile(source, "<generated dfa scanner>", "exec"), namespace)
+    return namespace["scan"]
+
+
+class GeneratedLexer(Lexer):
+    '''Lexer backend pakai scanner python hasil generate dari DFA (kode lurus per state),
+    scanner-nya jadi Lexer.scan jadi dipakai semua jalur lexing.
+
+    scanner_source = source module hasil generate_scanner_source (misal dari ConfigCache),
+    kalau None di-generate ulang dari DFA.
+    '''
+    def __init__(self, dfa_engine: DFAEngine, config: LexerConfig, scanner_source: Optional[str] = None):
+        super().__init__(dfa_engine, config)
+        if scanner_source is None:
+            scanner_source = generate_scanner_source(dfa_engine.compiled)
+        self.scanner_source = scanner_source
+        self.scan = load_scanner(scanner_source)
+
+    def _init_args(self) -> tuple:
+        return self.dfa, self.config, self.scanner_source
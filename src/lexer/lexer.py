@@ -1,78 +1,319 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+
 from .token import Token
+from .token_kind import TokenKind, Keyword
+from .token_buffer import TokenBuffer
 from .lexical_error import LexicalError
 from .lexer_config import LexerConfig
 from src.dfa.dfa_engine import DFAEngine
-from typing import List
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+# Ukuran chunk default iter_tokens (karakter)
+CHUNK_SIZE = 1 << 16
+
+# Char pemisah antar token (bahasa ini ga punya komentar), di-skip satu run sekaligus
+WHITESPACE = " \t\n"
+_whitespace_run = re.compile(r"[ \t\n]+").match
+_newline = re.compile(r"\n")
+
+
+def skip_whitespace(text: str, index: int, line_starts: array) -> Tuple[int, int]:
+    '''Lewati run spasi/tab/newline mulai text[index] (harus whitespace), awal tiap line baru
+    dicatat ke line_starts. Return (index setelah run, jumlah newline yang dilewati)'''
+    end = _whitespace_run(text, index).end()
+    newlines = text.count('\n', index, end)
+    if newlines == 1:
+        line_starts.append(text.find('\n', index, end) + 1)
+    elif newlines:
+        line_starts.extend(m.end() for m in _newline.finditer(text, index, end))
+    return end, newlines
+
 
 class Lexer:
-    '''Core class buat lexical analyzer'''
+    '''Core class buat lexical analyzer.
+
+    Setelah __init__ semua tabel read-only dan posisi (index, line, column) cuma jadi variabel
+    lokal per pemanggilan, jadi satu instance bisa dipakai ulang untuk banyak file,
+    dari banyak thread sekaligus, atau di-share ke worker process.
+    '''
     def __init__(self, dfa_engine: DFAEngine, config: LexerConfig):
         self.dfa = dfa_engine
         self.config = config
-        self.line = 1
-        self.column = 1
-        self.text = ""
-        self.index = 0
+        # Scanner satu token: scan(text, index) -> (index DFA stuck, final state id terakhir / None).
+        # Semua jalur lexing (tokenize_buffer, iter_tokens, relex, tokenize_parallel) lewat sini,
+        # backend lain cukup ganti scan (GeneratedLexer: scanner hasil generate, RegexLexer: master regex)
+        self.scan = dfa_engine.run
+
+        # final state -> kode token, di-resolve sekali di awal
+        self.state_kinds = MappingProxyType({state: TokenKind.intern(token_type)
+                                             for state, token_type in config.state_token_map.items()})
+        # final state id -> kode token, biar hot loop ga perlu lewat nama state
+        self.final_kinds = tuple(self.state_kinds.get(name, TokenKind.UNKNOWN)
+                                 for name in dfa_engine.compiled.state_names)
+
+        # lowercase word -> (kind, keyword id), keyword menang kalau ada yang dobel di operators_map
+        words = {word: (TokenKind.intern(token_type), Keyword.intern(word))
+                 for word, token_type in config.operators_map.items()}
+        words.update((word, (TokenKind.KEYWORD, Keyword.intern(word))) for word in config.keywords)
+        self.words = MappingProxyType(words)
+
+    def __reduce__(self):
+        # Tabel di-build ulang dari argumen konstruktor (mappingproxy/fungsi generate ga bisa di-pickle)
+        return type(self), self._init_args()
+
+    def _init_args(self) -> tuple:
+        return self.dfa, self.config
 
     def tokenize(self, text: str) -> List[Token]:
-        self.text = text
+        '''Tokenize langsung ke list Token (tanpa lewat TokenBuffer), literal di-decode waktu dibaca'''
         tokens: List[Token] = []
+        add = tokens.append
+        scan = self.scan
+        final_kinds = self.final_kinds
+        names = TokenKind.NAMES
+        words = self.words
+        identifier = TokenKind.IDENTIFIER
+        not_word = (TokenKind.UNKNOWN, Keyword.NONE)
+        length = len(text)
 
-        while self.index < len(self.text):
-            char = self.text[self.index]
+        index, line, line_start = 0, 1, 0
+        while index < length:
+            if text[index] in WHITESPACE:
+                end = _whitespace_run(text, index).end()
+                newline = text.rfind('\n', index, end)
+                if newline != -1:
+                    line += text.count('\n', index, newline + 1)
+                    line_start = newline + 1
+                index = end
+                continue
+
+            end, final_state = scan(text, index)
+            if final_state is None:
+                raise self._invalid_character(text, index, line, index - line_start + 1, text)
+            value = text[index:end]
+            kind = final_kinds[final_state]
+            if kind == identifier:
+                kind, keyword = words.get(value.lower(), (kind, Keyword.NONE))
+            else:
+                keyword = words.get(value, not_word)[1]
+            add(Token(names[kind], value, line, index - line_start + 1, kind, keyword))
+            index = end
+
+        return tokens
+
+    def tokenize_buffer(self, text: str) -> TokenBuffer:
+        '''Tokenize ke TokenBuffer (columnar), tanpa bikin object Token per token'''
+        buffer = TokenBuffer(text)
+        line_starts = buffer.line_starts
+        # Per token cuma append ke 5 array, _classify di-inline pakai final_kinds
+        add_kind, add_keyword = buffer.kinds.append, buffer.keywords.append
+        add_start, add_length, add_line = buffer.starts.append, buffer.lengths.append, buffer.lines.append
+        scan = self.scan
+        final_kinds = self.final_kinds
+        words = self.words
+        identifier = TokenKind.IDENTIFIER
+        not_word = (TokenKind.UNKNOWN, Keyword.NONE)
+        length = len(text)
+
+        index, line = 0, 1
+        while index < length:
+            char = text[index]
             if char in ' \t':
-                self.column += 1
-                self.index += 1
+                # Spasi tunggal antar token paling sering, run yang lebih panjang di-skip sekaligus
+                index += 1
+                if index < length and text[index] in WHITESPACE:
+                    index, newlines = skip_whitespace(text, index, line_starts)
+                    line += newlines
                 continue
             elif char == '\n':
-                self.line += 1
-                self.column = 1
-                self.index += 1
+                index, newlines = skip_whitespace(text, index, line_starts)
+                line += newlines
                 continue
 
-            self.dfa.reset_state() 
-            current_value = ""
-            temp_token = (None, None, -1, -1) # type, value, line, column
-            start_col = self.column
-            start_line = self.line
-            
-            temp_index = self.index
-            while temp_index < len(self.text):
-                char_to_check = self.text[temp_index]
-                if not self.dfa.next_state(char_to_check):
+            end, final_state = scan(text, index)
+            if final_state is None:
+                raise self._invalid_character(text, index, line, index - line_starts[-1] + 1, text)
+            kind = final_kinds[final_state]
+            if kind == identifier:
+                kind, keyword = words.get(text[index:end].lower(), (kind, Keyword.NONE))
+            else:
+                keyword = words.get(text[index:end], not_word)[1]
+            add_kind(kind)
+            add_keyword(keyword)
+            add_start(index)
+            add_length(end - index)
+            add_line(line)
+            index = end
+
+        return buffer
+
+    def iter_tokens(self, fileobj: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Token]:
+        '''Tokenize dari file handle per chunk, token di-yield satu-satu (memory terbatas).
+
+        Token yang nyambung ke chunk berikutnya (termasuk string literal) ditahan dulu
+        sampai DFA stuck sebelum ujung buffer atau file habis.
+        '''
+        scan = self.scan
+        buffer = fileobj.read(chunk_size)
+        eof = not buffer
+        index = 0
+        line, column = 1, 1
+
+        while True:
+            length = len(buffer)
+            while index < length:
+                if buffer[index] in WHITESPACE:
+                    end = _whitespace_run(buffer, index).end()
+                    newline = buffer.rfind('\n', index, end)
+                    if newline == -1:
+                        column += end - index
+                    else:
+                        line += buffer.count('\n', index, newline + 1)
+                        column = end - newline
+                    index = end
+                    continue
+
+                end, final_state = scan(buffer, index)
+                if end == length and not eof:
+                    # Token mungkin masih lanjut di chunk berikutnya
                     break
-                
-                current_value += char_to_check
-                
-                if self.dfa.last_final_state:
-                    temp_token = (current_value, self.dfa.last_final_state, start_line, start_col)
-                    
-                temp_index += 1
-
-            value, final_state, line, col = temp_token
-            if value is None:
-                invalid_char = self.text[self.index]
-                message = f"Invalid character: '{invalid_char}'"
-                error_token = Token("UNKNOWN", invalid_char, self.line, self.column)
-                raise LexicalError(error_token, message, self.text)
-            
-            token = self._create_token(value, final_state, line, col)
-            tokens.append(token)
-            self.index += len(value)
-            self.column += len(value)
-            
-        return tokens
+                if final_state is None:
+                    raise self._invalid_character(buffer, index, line, column, None)
+
+                value = buffer[index:end]
+                yield self._create_token(value, final_state, line, column)
+                index = end
+                column += len(value)
+
+            if eof:
+                return
+
+            chunk = fileobj.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[index:] + chunk
+            index = 0
+
+    def relex(self, old_tokens: TokenBuffer, old_text: str, edit_range: Tuple[int, int],
+              new_text: str) -> TokenBuffer:
+        '''Tokenize ulang setelah old_text[start:end] (edit_range) diganti new_text.
 
+        old_tokens = TokenBuffer hasil tokenize_buffer(old_text). Lexing mulai dari akhir token
+        terakhir yang ga tersentuh edit dan berhenti begitu token baru mulai di offset yang sama
+        dengan token lama setelah area edit; sisa token lama disambung dengan offset & line digeser.
+        Hasilnya identik dengan tokenize_buffer(text baru).
+        '''
+        edit_start, edit_end = edit_range
+        if not 0 <= edit_start <= edit_end <= len(old_text):
+            raise ValueError(f"Invalid edit range {edit_range} for text of length {len(old_text)}")
 
-    def _create_token(self, value: str, final_state: str, line: int, col: int) -> Token:
-        token_type = self.config.state_token_map.get(final_state)
-        value_lower = value.lower()
+        text = old_text[:edit_start] + new_text + old_text[edit_end:]
+        delta = len(new_text) - (edit_end - edit_start)
+        edited_end = edit_start + len(new_text)
+        old_starts, old_lengths, old_lines = old_tokens.starts, old_tokens.lengths, old_tokens.lines
+
+        # Token lama aman kalau char tempat DFA stuck (index end) masih sebelum edit
+        low, high = 0, len(old_tokens)
+        while low < high:
+            mid = (low + high) // 2
+            if old_starts[mid] + old_lengths[mid] < edit_start:
+                low = mid + 1
+            else:
+                high = mid
+        keep = low
+
+        buffer = TokenBuffer(text)
+        buffer.kinds = old_tokens.kinds[:keep]
+        buffer.keywords = old_tokens.keywords[:keep]
+        buffer.starts = old_starts[:keep]
+        buffer.lengths = old_lengths[:keep]
+        buffer.lines = old_lines[:keep]
+        if keep:
+            index = old_starts[keep - 1] + old_lengths[keep - 1]
+            line = old_lines[keep - 1]
+        else:
+            index, line = 0, 1
+        buffer.line_starts = old_tokens.line_starts[:bisect_right(old_tokens.line_starts, index)]
+
+        append = buffer.append
+        line_starts = buffer.line_starts
+        length = len(text)
+        while index < length:
+            char = text[index]
+            if char in ' \t':
+                index += 1
+                if index < length and text[index] in WHITESPACE:
+                    index, newlines = skip_whitespace(text, index, line_starts)
+                    line += newlines
+                continue
+            elif char == '\n':
+                index, newlines = skip_whitespace(text, index, line_starts)
+                line += newlines
+                continue
+
+            # Sinkron lagi: sisa text identik, jadi sisa token juga identik (cuma bergeser)
+            if index >= edited_end:
+                old_index = index - delta
+                j = bisect_left(old_starts, old_index, keep)
+                if j < len(old_starts) and old_starts[j] == old_index:
+                    self._splice_tail(buffer, old_tokens, j, delta, line - old_lines[j], old_index)
+                    return buffer
+
+            kind, keyword, end = self._scan_token(text, index, line, index - line_starts[-1] + 1)
+            append(kind, keyword, index, end - index, line)
+            index = end
+
+        return buffer
+
+    @staticmethod
+    def _splice_tail(buffer: TokenBuffer, old_tokens: TokenBuffer, first: int, delta: int,
+                     line_delta: int, old_index: int):
+        '''Sambung token lama mulai index first ke buffer, offset digeser delta dan line digeser line_delta'''
+        buffer.kinds.extend(old_tokens.kinds[first:])
+        buffer.keywords.extend(old_tokens.keywords[first:])
+        buffer.lengths.extend(old_tokens.lengths[first:])
+        old_line_starts = old_tokens.line_starts[bisect_right(old_tokens.line_starts, old_index):]
+        if delta:
+            buffer.starts.extend(start + delta for start in old_tokens.starts[first:])
+            buffer.line_starts.extend(offset + delta for offset in old_line_starts)
+        else:
+            buffer.starts.extend(old_tokens.starts[first:])
+            buffer.line_starts.extend(old_line_starts)
+        if line_delta:
+            buffer.lines.extend(line + line_delta for line in old_tokens.lines[first:])
+        else:
+            buffer.lines.extend(old_tokens.lines[first:])
+
+    def _scan_token(self, text: str, index: int, line: int, column: int) -> Tuple[int, int, int]:
+        '''DFA jalan sampai stuck, token = semua char yang kebaca selama pernah lewat final state.
+        Return (kind, keyword id, index akhir token)'''
+        end, final_state = self.scan(text, index)
+        if final_state is None:
+            raise self._invalid_character(text, index, line, column, text)
+        kind, keyword = self._classify(text[index:end], final_state)
+        return kind, keyword, end
+
+    def _invalid_character(self, text: str, index: int, line: int, column: int,
+                           source: Optional[str]) -> LexicalError:
+        invalid_char = text[index]
+        message = f"Invalid character: '{invalid_char}'"
+        error_token = Token("UNKNOWN", invalid_char, line, column)
+        return LexicalError(error_token, message, source)
+
+    def _classify(self, value: str, final_state: int) -> Tuple[int, int]:
+        '''Kode token + keyword id, dihitung sekali di sini biar parser cukup compare integer'''
+        kind = self.final_kinds[final_state]
 
 		# keyword & operators case insensitive pake lower value buat comparisson
-        if token_type == "IDENTIFIER":
-            if value_lower in self.config.keywords:
-                token_type = "KEYWORD"
-            elif value_lower in self.config.operators_map:
-                token_type = self.config.operators_map[value_lower]
+        if kind == TokenKind.IDENTIFIER:
+            return self.words.get(value.lower(), (kind, Keyword.NONE))
+
+        # operator simbol (":=", "<=", ...) tetap dapat keyword id
+        word = self.words.get(value)
+        return kind, word[1] if word else Keyword.NONE
 
-        return Token(token_type, value, line, col)
\ No newline at end of file
+    def _create_token(self, value: str, final_state: int, line: int, col: int) -> Token:
+        kind, keyword = self._classify(value, final_state)
+        return Token(TokenKind.name(kind), value, line, col, kind, keyword)
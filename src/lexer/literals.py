@@ -0,0 +1,26 @@
+import sys
+from typing import Union
+
+from .token_kind import TokenKind
+
+# Nilai hasil decode lexeme literal (None kalau bukan literal / ga bisa dikonversi)
+LiteralValue = Union[int, float, str, None]
+
+LITERAL_KINDS = frozenset((TokenKind.NUMBER, TokenKind.STRING_LITERAL, TokenKind.CHAR_LITERAL))
+
+
+def decode_literal(kind: int, text: str) -> LiteralValue:
+    '''int/float buat NUMBER, isi tanpa quote (di-intern) buat STRING_LITERAL/CHAR_LITERAL.
+
+    DFA juga menerima angka seperti "1.2.3" atau digit unicode non-desimal, untuk itu hasilnya None
+    dan caller tetap bisa pakai lexeme mentahnya.
+    '''
+    if kind == TokenKind.NUMBER:
+        try:
+            return float(text) if '.' in text else int(text)
+        except ValueError:
+            return None
+    if kind == TokenKind.STRING_LITERAL or kind == TokenKind.CHAR_LITERAL:
+        # Bahasa ini ga punya escape quote di dalam string, cukup buang quote pembuka & penutup
+        return sys.intern(text[1:-1])
+    return None
@@ -0,0 +1,138 @@
+import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .lexer import Lexer, WHITESPACE, skip_whitespace
+from .token_buffer import TokenBuffer
+
+# Di bawah ukuran ini (karakter) overhead process pool lebih mahal dari lexing-nya
+PARALLEL_THRESHOLD = 1 << 20
+
+# Hasil lex satu chunk (semua offset relatif ke awal chunk):
+# (kinds, keywords, starts, lengths, lines, line_starts, stop index, stop line, error index / -1)
+ChunkResult = Tuple
+
+_worker_lexer: Optional[Lexer] = None
+
+
+def _init_worker(lexer: Lexer):
+    global _worker_lexer
+    _worker_lexer = lexer
+
+
+def _lex_chunk(chunk: str, last: bool) -> ChunkResult:
+    '''Lex satu chunk dengan anggapan chunk mulai di batas token, line 1 column 1.
+
+    Berhenti di token yang DFA-nya nyentuh ujung chunk (mungkin lanjut ke chunk berikutnya),
+    atau di char invalid pertama. Valid/tidaknya hasil ini dicek waktu merge.
+    '''
+    lexer = _worker_lexer
+    scan = lexer.scan
+    buffer = TokenBuffer(chunk)
+    append = buffer.append
+    line_starts = buffer.line_starts
+    length = len(chunk)
+
+    index, line, error = 0, 1, -1
+    while index < length:
+        char = chunk[index]
+        if char in ' \t':
+            index += 1
+            if index < length and chunk[index] in WHITESPACE:
+                index, newlines = skip_whitespace(chunk, index, line_starts)
+                line += newlines
+            continue
+        elif char == '\n':
+            index, newlines = skip_whitespace(chunk, index, line_starts)
+            line += newlines
+            continue
+
+        end, final_state = scan(chunk, index)
+        if end == length and not last:
+            break
+        if final_state is None:
+            error = index
+            break
+        kind, keyword = lexer._classify(chunk[index:end], final_state)
+        append(kind, keyword, index, end - index, line)
+        index = end
+
+    return (buffer.kinds, buffer.keywords, buffer.starts, buffer.lengths, buffer.lines,
+            buffer.line_starts, index, line, error)
+
+
+def split_chunks(text: str, count: int) -> List[int]:
+    '''Offset awal tiap chunk, selalu tepat setelah newline (chunk pertama mulai di 0)'''
+    bounds = [0]
+    size = max(1, len(text) // count)
+    while len(bounds) < count:
+        cut = text.find('\n', bounds[-1] + size)
+        if cut == -1 or cut + 1 >= len(text):
+            break
+        bounds.append(cut + 1)
+    return bounds
+
+
+def tokenize_parallel(lexer: Lexer, text: str, max_workers: Optional[int] = None,
+                      chunks: Optional[int] = None) -> TokenBuffer:
+    '''Tokenize text di process pool, hasilnya identik dengan lexer.tokenize_buffer(text)
+    termasuk LexicalError pertama (line & column).
+
+    Text dipotong di awal line lalu tiap chunk di-lex terpisah. Waktu merge, chunk cuma dipakai
+    mulai token yang posisinya (offset, line start) cocok dengan lexing sequential; token yang
+    nyebrang batas chunk (misal string literal multi-line) di-lex ulang di process utama.
+    '''
+    if len(text) < PARALLEL_THRESHOLD or max_workers == 1:
+        return lexer.tokenize_buffer(text)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    bounds = split_chunks(text, chunks or max_workers * 4)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(lexer,)) as pool:
+        ends = bounds[1:] + [len(text)]
+        futures = [pool.submit(_lex_chunk, text[start:end], end == len(text))
+                   for start, end in zip(bounds, ends)]
+        buffer = TokenBuffer(text)
+        index, line = 0, 1
+        for start, end, future in zip(bounds, ends, futures):
+            index, line = _merge_chunk(lexer, buffer, text, index, line, start, end, future.result())
+    return buffer
+
+
+def _merge_chunk(lexer: Lexer, buffer: TokenBuffer, text: str, index: int, line: int,
+                 start: int, end: int, result: ChunkResult) -> Tuple[int, int]:
+    '''Lanjutkan lexing sequential dari index sampai sinkron dengan hasil chunk, lalu sambung sisanya.
+    Return (index, line) lexer setelah chunk ini'''
+    kinds, keywords, starts, lengths, lines, line_starts, stop, stop_line, error = result
+    line_starts_buffer = buffer.line_starts
+
+    while index < end:
+        if text[index] in WHITESPACE:
+            index, newlines = skip_whitespace(text, index, line_starts_buffer)
+            line += newlines
+            continue
+
+        # Sinkron: token chunk mulai di offset yang sama dan line-nya mulai di offset yang sama
+        if index >= start:
+            j = bisect_left(starts, index - start)
+            if j < len(starts) and starts[j] == index - start and \
+                    line_starts[lines[j] - 1] + start == line_starts_buffer[-1]:
+                line_delta = line - lines[j]
+                buffer.kinds.extend(kinds[j:])
+                buffer.keywords.extend(keywords[j:])
+                buffer.starts.extend(offset + start for offset in starts[j:])
+                buffer.lengths.extend(lengths[j:])
+                buffer.lines.extend(token_line + line_delta for token_line in lines[j:])
+                line_starts_buffer.extend(offset + start for offset in line_starts[lines[j]:])
+                index, line = stop + start, stop_line + line_delta
+                if error != -1:
+                    column = index - line_starts_buffer[-1] + 1
+                    raise lexer._invalid_character(text, index, line, column, text)
+                continue
+
+        column = index - line_starts_buffer[-1] + 1
+        kind, keyword, token_end = lexer._scan_token(text, index, line, column)
+        buffer.append(kind, keyword, index, token_end - index, line)
+        index = token_end
+
+    return index, line
@@ -0,0 +1,227 @@
+import re
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
+
+from .token_buffer import TokenBuffer
+from .token_kind import TokenKind, Keyword
+from .lexer import Lexer
+from .lexer_config import LexerConfig
+from src.dfa.dfa_config import CompiledDFA, NO_TRANSITION
+from src.dfa.dfa_engine import DFAEngine
+
+NEWLINE_GROUP = "_NL"
+FALLBACK_GROUP = "_FALLBACK"
+
+# Node product automaton: (state DFA, final state terakhir yang dilewati atau None)
+Node = Tuple[int, Optional[int]]
+
+
+def _char_set(chars: Set[str]) -> str:
+    if len(chars) == 1:
+        return re.escape(next(iter(chars)))
+
+    # Karakter berurutan digabung jadi range a-z
+    codes = sorted(ord(c) for c in chars)
+    parts = []
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        if j - i >= 2:
+            parts.append(f"{re.escape(chr(codes[i]))}-{re.escape(chr(codes[j]))}")
+        else:
+            parts.extend(re.escape(chr(c)) for c in codes[i:j + 1])
+        i = j + 1
+    return "[" + "".join(parts) + "]"
+
+
+def _union(a: Optional[str], b: str) -> str:
+    return b if a is None else f"(?:{a}|{b})"
+
+
+def _star(a: str) -> str:
+    if len(a) == 1 or (a.startswith("\\") and len(a) == 2):
+        return a + "*"
+    return f"(?:{a})*"
+
+
+def build_master_pattern(compiled: CompiledDFA) -> Tuple["re.Pattern", Dict[str, str]]:
+    '''Generate satu master regex (named group per final state) dari DFA compiled.
+
+    Semantik sama persis dengan Lexer.tokenize: DFA jalan sampai stuck, token = seluruh
+    karakter yang kebaca, tipenya dari final state terakhir yang dilewati. Tiap alternatif
+    ditutup negative lookahead "DFA stuck di sini" jadi cuma satu group yang bisa match.
+    Regex cuma mencakup ASCII; token yang menyentuh karakter non-ASCII ga akan match dan
+    ditangani fallback DFA di RegexLexer.
+    '''
+    num_classes = compiled.num_classes
+    table = compiled.table
+
+    # Kelas karakter -> karakter ASCII anggotanya
+    class_chars: List[Set[str]] = [set() for _ in range(num_classes)]
+    for c, cls in compiled.class_map.items():
+        if ord(c) < 128:
+            class_chars[cls].add(c)
+    non_ascii_classes = {compiled.letter_class, compiled.digit_class, compiled.other_class}
+    non_ascii_classes.update(cls for c, cls in compiled.class_map.items() if ord(c) >= 128)
+
+    def transitions(state: int) -> Dict[int, Set[str]]:
+        targets: Dict[int, Set[str]] = {}
+        for cls in range(num_classes):
+            target = table[state * num_classes + cls]
+            if target != NO_TRANSITION and class_chars[cls]:
+                targets.setdefault(target, set()).update(class_chars[cls])
+        return targets
+
+    def stuck_lookahead(state: int) -> str:
+        blocked = set()
+        for chars in transitions(state).values():
+            blocked.update(chars)
+        parts = []
+        if blocked:
+            parts.append(_char_set(blocked))
+        if any(table[state * num_classes + cls] != NO_TRANSITION for cls in non_ascii_classes):
+            parts.append("[^\\x00-\\x7f]")
+        return f"(?!{'|'.join(parts)})" if parts else ""
+
+    # Bangun product automaton yang reachable dari start
+    start: Node = (compiled.start, None)
+    edges: Dict[object, Dict[object, Optional[str]]] = {}
+    pending = [start]
+    while pending:
+        node = pending.pop()
+        if node in edges:
+            continue
+        state, last_final = node
+        edges[node] = {}
+        for target, chars in transitions(state).items():
+            next_node = (target, target if compiled.accepting[target] else last_final)
+            edges[node][next_node] = _char_set(chars)
+            pending.append(next_node)
+        if last_final is not None:
+            edges[node][("SINK", last_final)] = stuck_lookahead(state)
+
+    initial = ("INIT", None)
+    edges[initial] = {start: ""}
+    sinks = sorted({n for targets in edges.values() for n in targets if n[0] == "SINK"}, key=lambda n: n[1])
+    for sink in sinks:
+        edges[sink] = {}
+
+    # State elimination, node dengan derajat terkecil dieliminasi duluan
+    inner = [n for n in edges if n is not initial and n[0] != "SINK"]
+    while inner:
+        def degree(n):
+            incoming = sum(1 for src in edges if n in edges[src] and src != n)
+            return incoming * len(edges[n])
+        node = min(inner, key=lambda n: (degree(n), str(n)))
+        inner.remove(node)
+
+        outgoing = edges.pop(node)
+        loop = outgoing.pop(node, None)
+        loop_re = _star(loop) if loop else ""
+        for src, targets in edges.items():
+            if node not in targets:
+                continue
+            head = targets.pop(node) + loop_re
+            for dst, label in outgoing.items():
+                targets[dst] = _union(targets.get(dst), head + label)
+
+    group_states: Dict[str, str] = {}
+    alternatives = [f"(?P<{NEWLINE_GROUP}>\\n)"]
+    for sink in sinks:
+        body = edges[initial].get(sink)
+        if body is None:
+            continue
+        state_name = compiled.state_names[sink[1]]
+        group = "T_" + re.sub(r"\W", "_", state_name)
+        while group in group_states:
+            group += "_"
+        group_states[group] = state_name
+        alternatives.append(f"(?P<{group}>{body})")
+    alternatives.append(f"(?P<{FALLBACK_GROUP}>[^ \\t])")
+
+    # Spasi/tab di depan token langsung di-skip di match yang sama
+    return re.compile("[ \\t]*(?:" + "|".join(alternatives) + ")"), group_states
+
+
+class RegexLexer(Lexer):
+    '''Lexer backend pakai master regex hasil generate dari DFA config (C regex engine)
+
+    regex_pattern = (source regex, group -> state) yang sudah di-generate sebelumnya
+    (misal dari ConfigCache), kalau None di-generate ulang dari DFA.
+    '''
+    def __init__(self, dfa_engine: DFAEngine, config: LexerConfig,
+                 regex_pattern: Optional[Tuple[str, Dict[str, str]]] = None):
+        super().__init__(dfa_engine, config)
+        if regex_pattern is None:
+            self.pattern, self.group_states = build_master_pattern(dfa_engine.compiled)
+        else:
+            source, group_states = regex_pattern
+            self.pattern, self.group_states = re.compile(source), dict(group_states)
+        self.group_states = MappingProxyType(self.group_states)
+        self.group_kinds = MappingProxyType({group: self.state_kinds.get(state, TokenKind.UNKNOWN)
+                                             for group, state in self.group_states.items()})
+        # group -> final state id, buat scan per token
+        state_ids = dfa_engine.compiled.state_ids
+        self.group_finals = MappingProxyType({group: state_ids[state] for group, state in self.group_states.items()})
+        self.scan = self._scan_regex
+
+    def _init_args(self) -> tuple:
+        return self.dfa, self.config, (self.pattern.pattern, dict(self.group_states))
+
+    def _scan_regex(self, text: str, index: int) -> Tuple[int, Optional[int]]:
+        '''Lexer.scan lewat master regex (iter_tokens, relex, tokenize_parallel): text[index] bukan whitespace,
+        jadi match-nya satu group token, atau fallback (non-ASCII / error) yang diserahkan ke DFA'''
+        match = self.pattern.match(text, index)
+        final_state = self.group_finals.get(match.lastgroup)
+        if final_state is None:
+            return self.dfa.run(text, index)
+        return match.end(), final_state
+
+    def tokenize_buffer(self, text: str) -> TokenBuffer:
+        buffer = TokenBuffer(text)
+        append = buffer.append
+        length = len(text)
+        group_kinds = self.group_kinds
+        words = self.words
+        identifier = TokenKind.IDENTIFIER
+        not_word = (TokenKind.UNKNOWN, Keyword.NONE)
+
+        index, line, column = 0, 1, 1
+        while index < length:
+            for m in self.pattern.finditer(text, index):
+                group = m.lastgroup
+                if group == FALLBACK_GROUP:
+                    column += m.start(group) - index
+                    index = m.start(group)
+                    break
+                start, end = m.span(group)
+                column += start - index
+                index = end
+                if group == NEWLINE_GROUP:
+                    line += 1
+                    column = 1
+                    buffer.new_line(end)
+                else:
+                    kind = group_kinds[group]
+                    value = text[start:end]
+                    if kind == identifier:
+                        kind, keyword = words.get(value.lower(), (kind, Keyword.NONE))
+                    else:
+                        keyword = words.get(value, not_word)[1]
+                    append(kind, keyword, start, end - start, line)
+                    column += end - start
+            else:
+                # Sisa text cuma spasi/tab
+                column += length - index
+                index = length
+                break
+
+            # Non-ASCII / error: serahkan ke DFA biar hasil & pesan error identik
+            kind, keyword, end = self._scan_token(text, index, line, column)
+            append(kind, keyword, index, end - index, line)
+            column += end - index
+            index = end
+
+        return buffer
@@ -1,8 +1,17 @@
 from dataclasses import dataclass
+from .token_kind import TokenKind, Keyword
+from .literals import LiteralValue, decode_literal
 
 @dataclass
 class Token:
 	type: str
 	value: str
 	line: int
-	column: int
\ No newline at end of file
+	column: int
+	kind: int = TokenKind.UNKNOWN
+	keyword: int = Keyword.NONE
+
+	@property
+	def literal(self) -> LiteralValue:
+		'''Nilai literal (int/float, isi string tanpa quote), di-decode waktu dibaca, None kalau bukan literal'''
+		return decode_literal(self.kind, self.value)
\ No newline at end of file
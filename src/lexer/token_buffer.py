@@ -0,0 +1,87 @@
+from array import array
+from typing import Dict, Iterator, List
+
+from .token import Token
+from .token_kind import TokenKind
+from .literals import LiteralValue, decode_literal
+
+class TokenBuffer:
+    '''Token disimpan columnar: array('i') paralel buat kind, keyword id, start offset, length, dan line.
+
+    Value di-slice dari source saat dibutuhkan, column dihitung dari tabel awal line
+    (offset setelah newline yang dilewati lexer), jadi per token cuma 20 byte.
+    Indexing buffer[i] menghasilkan Token biasa, jadi bisa langsung dipakai Parser.
+    Nilai literal (angka, isi string) baru di-decode waktu dibaca lewat literal_of, lalu disimpan di literals.
+    '''
+    def __init__(self, source: str):
+        self.source = source
+        self.kinds = array('i')
+        self.keywords = array('i')
+        self.starts = array('i')
+        self.lengths = array('i')
+        self.lines = array('i')
+        # line_starts[line - 1] = offset awal line tersebut
+        self.line_starts = array('i', [0])
+        # token index -> nilai literal hasil decode
+        self.literals: Dict[int, LiteralValue] = {}
+
+    def append(self, kind: int, keyword: int, start: int, length: int, line: int):
+        self.kinds.append(kind)
+        self.keywords.append(keyword)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.lines.append(line)
+
+    def new_line(self, offset: int):
+        '''Catat awal line baru (offset tepat setelah newline)'''
+        self.line_starts.append(offset)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+        kind = self.kinds[index]
+        return Token(TokenKind.name(kind), self.value_of(index), self.lines[index], self.column_of(index),
+                     kind, self.keywords[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        source = self.source
+        names = TokenKind.NAMES
+        line_starts = self.line_starts
+        for kind, keyword, start, length, line in zip(self.kinds, self.keywords, self.starts, self.lengths, self.lines):
+            yield Token(names[kind], source[start:start + length], line, start - line_starts[line - 1] + 1,
+                        kind, keyword)
+
+    def type_of(self, index: int) -> str:
+        return TokenKind.name(self.kinds[index])
+
+    def kind_of(self, index: int) -> int:
+        return self.kinds[index]
+
+    def keyword_of(self, index: int) -> int:
+        return self.keywords[index]
+
+    def value_of(self, index: int) -> str:
+        start = self.starts[index]
+        return self.source[start:start + self.lengths[index]]
+
+    def literal_of(self, index: int) -> LiteralValue:
+        '''Nilai literal token (None kalau bukan literal), decode cuma di akses pertama'''
+        literals = self.literals
+        if index in literals:
+            return literals[index]
+        value = literals[index] = decode_literal(self.kinds[index], self.value_of(index))
+        return value
+
+    def line_of(self, index: int) -> int:
+        return self.lines[index]
+
+    def column_of(self, index: int) -> int:
+        return self.starts[index] - self.line_starts[self.lines[index] - 1] + 1
+
+    def to_list(self) -> List[Token]:
+        return list(self)
@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional
+
+class TokenKind:
+    '''Kode integer untuk tipe token (Token.type versi integer)'''
+    UNKNOWN             = 0
+    KEYWORD             = 1
+    IDENTIFIER          = 2
+    NUMBER              = 3
+    STRING_LITERAL      = 4
+    CHAR_LITERAL        = 5
+    ARITHMETIC_OPERATOR = 6
+    RELATIONAL_OPERATOR = 7
+    LOGICAL_OPERATOR    = 8
+    ASSIGN_OPERATOR     = 9
+    SEMICOLON           = 10
+    COMMA               = 11
+    COLON               = 12
+    DOT                 = 13
+    RANGE_OPERATOR      = 14
+    LPARENTHESIS        = 15
+    RPARENTHESIS        = 16
+    LBRACKET            = 17
+    RBRACKET            = 18
+
+    NAMES: List[str] = [
+        "UNKNOWN", "KEYWORD", "IDENTIFIER", "NUMBER", "STRING_LITERAL", "CHAR_LITERAL",
+        "ARITHMETIC_OPERATOR", "RELATIONAL_OPERATOR", "LOGICAL_OPERATOR", "ASSIGN_OPERATOR",
+        "SEMICOLON", "COMMA", "COLON", "DOT", "RANGE_OPERATOR",
+        "LPARENTHESIS", "RPARENTHESIS", "LBRACKET", "RBRACKET",
+    ]
+    IDS: Dict[str, int] = {name: i for i, name in enumerate(NAMES)}
+
+    @staticmethod
+    def intern(name: Optional[str]) -> int:
+        '''Kode untuk nama tipe token, tipe baru dari config dapat kode baru'''
+        if name is None:
+            return TokenKind.UNKNOWN
+        kind = TokenKind.IDS.get(name)
+        if kind is None:
+            kind = len(TokenKind.NAMES)
+            TokenKind.NAMES.append(name)
+            TokenKind.IDS[name] = kind
+        return kind
+
+    @staticmethod
+    def name(kind: int) -> str:
+        return TokenKind.NAMES[kind]
+
+
+class Keyword:
+    '''Id integer untuk keyword & operator (selalu lowercase), NONE = bukan keyword/operator'''
+    NONE       = 0
+    PROGRAM    = 1
+    VARIABEL   = 2
+    MULAI      = 3
+    SELESAI    = 4
+    JIKA       = 5
+    MAKA       = 6
+    SELAIN_ITU = 7
+    SELAMA     = 8
+    LAKUKAN    = 9
+    UNTUK      = 10
+    KE         = 11
+    TURUN_KE   = 12
+    INTEGER    = 13
+    REAL       = 14
+    BOOLEAN    = 15
+    CHAR       = 16
+    LARIK      = 17
+    DARI       = 18
+    TRUE       = 19
+    FALSE      = 20
+    PROSEDUR   = 21
+    FUNGSI     = 22
+    KONSTANTA  = 23
+    TIPE       = 24
+    SAMPAI     = 25
+    ULANGI     = 26
+    REKAMAN    = 27
+    KASUS      = 28
+    BAGI       = 29
+    MOD        = 30
+    DAN        = 31
+    ATAU       = 32
+    TIDAK      = 33
+    PLUS       = 34
+    MINUS      = 35
+    TIMES      = 36
+    DIVIDE     = 37
+    ASSIGN     = 38
+    EQ         = 39
+    LT         = 40
+    GT         = 41
+    LE         = 42
+    GE         = 43
+    NE         = 44
+
+    WORDS: List[str] = [
+        "", "program", "variabel", "mulai", "selesai", "jika", "maka", "selain_itu",
+        "selama", "lakukan", "untuk", "ke", "turun_ke", "integer", "real", "boolean",
+        "char", "larik", "dari", "true", "false", "prosedur", "fungsi", "konstanta",
+        "tipe", "sampai", "ulangi", "rekaman", "kasus", "bagi", "mod", "dan", "atau",
+        "tidak", "+", "-", "*", "/", ":=", "=", "<", ">", "<=", ">=", "<>",
+    ]
+    IDS: Dict[str, int] = {word: i for i, word in enumerate(WORDS) if word}
+
+    @staticmethod
+    def intern(word: str) -> int:
+        '''Id untuk keyword/operator (case insensitive), kata baru dari config dapat id baru'''
+        word = word.lower()
+        keyword = Keyword.IDS.get(word)
+        if keyword is None:
+            keyword = len(Keyword.WORDS)
+            Keyword.WORDS.append(word)
+            Keyword.IDS[word] = keyword
+        return keyword
+
+    @staticmethod
+    def word(keyword: int) -> str:
+        return Keyword.WORDS[keyword]
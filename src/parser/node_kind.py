@@ -0,0 +1,72 @@
+from typing import Dict, List
+
+class NodeKind:
+    '''Kode integer untuk tipe node parse tree (ParseNode.type versi integer), TOKEN = leaf'''
+    TOKEN                     = 0
+    PROGRAM                   = 1
+    PROGRAM_HEADER            = 2
+    DECLARATION_PART          = 3
+    CONST_DECLARATION         = 4
+    TYPE_DECLARATION          = 5
+    VAR_DECLARATION           = 6
+    PROCEDURE_DECLARATION     = 7
+    FUNCTION_DECLARATION      = 8
+    BLOCK                     = 9
+    FORMAL_PARAMETER_LIST     = 10
+    PARAMETER_GROUP           = 11
+    IDENTIFIER_LIST           = 12
+    TYPE_DEFINITION           = 13
+    TYPE                      = 14
+    ARRAY_TYPE                = 15
+    RECORD_TYPE               = 16
+    RANGE                     = 17
+    COMPOUND_STATEMENT        = 18
+    STATEMENT_LIST            = 19
+    EMPTY_STATEMENT           = 20
+    ASSIGNMENT_STATEMENT      = 21
+    IF_STATEMENT              = 22
+    WHILE_STATEMENT           = 23
+    FOR_STATEMENT             = 24
+    REPEAT_STATEMENT          = 25
+    CASE_STATEMENT            = 26
+    CASE_LIST                 = 27
+    PROCEDURE_FUNCTION_CALL   = 28
+    PARAMETER_LIST            = 29
+    EXPRESSION                = 30
+    SIMPLE_EXPRESSION         = 31
+    TERM                      = 32
+    FACTOR                    = 33
+    VARIABLE                  = 34
+    VARIABLE_INDEX            = 35
+
+    NAMES: List[str] = [
+        "TOKEN", "<program>", "<program-header>", "<declaration-part>", "<const-declaration>",
+        "<type-declaration>", "<var-declaration>", "<procedure-declaration>", "<function-declaration>",
+        "<block>", "<formal-parameter-list>", "<parameter-group>", "<identifier-list>",
+        "<type-definition>", "<type>", "<array-type>", "<record-type>", "<range>",
+        "<compound-statement>", "<statement-list>", "<empty-statement>", "<assignment-statement>",
+        "<if-statement>", "<while-statement>", "<for-statement>", "<repeat-statement>",
+        "<case-statement>", "<case-list>", "<procedure/function-call>", "<parameter-list>",
+        "<expression>", "<simple-expression>", "<term>", "<factor>", "<variable>", "<variable-index>",
+    ]
+    IDS: Dict[str, int] = {name: i for i, name in enumerate(NAMES)}
+
+    @staticmethod
+    def intern(name: str) -> int:
+        '''Kode untuk tipe node, tipe baru dapat kode baru'''
+        kind = NodeKind.IDS.get(name)
+        if kind is None:
+            kind = len(NodeKind.NAMES)
+            NodeKind.NAMES.append(name)
+            NodeKind.IDS[name] = kind
+        return kind
+
+    @staticmethod
+    def name(kind: int) -> str:
+        return NodeKind.NAMES[kind]
+
+    @staticmethod
+    def method_suffix(kind: int) -> str:
+        '''"<procedure/function-call>" -> "procedure_function_call", TOKEN -> "token"'''
+        name = NodeKind.NAMES[kind].strip("<>").lower()
+        return name.replace("-", "_").replace("/", "_")
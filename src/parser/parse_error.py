@@ -5,26 +5,9 @@ class ParseError(Exception):
         self.column = token.column
         self.value = token.value
         self.type = token.type
-        self.full_source_text = None  
+        self.source = None
 
     def __str__(self):
-        if not self.full_source_text:
+        if not self.source or not self.source.text:
             return f"SyntaxError at line {self.line}, column {self.column}: {self.message} (Token: {self.value})"
-
-        lines = self.full_source_text.split('\n')
-        error_line = lines[self.line - 1] if 0 < self.line <= len(lines) else ""
-        error_line = error_line.rstrip()
-        
-        line_num_str = str(self.line)
-        code_prefix = f" {line_num_str} | "
-        empty_prefix = f" {' ' * len(line_num_str)} |"
-        caret_prefix = f" {' ' * len(line_num_str)} | "
-        caret_padding = " " * max(0, self.column - 1)
-        
-        return (
-			f"SyntaxError: {self.message}\n"
-			f"  --> (line {self.line}, column {self.column})\n"
-			f"{empty_prefix}\n"
-			f"{code_prefix}{error_line}\n"
-			f"{caret_prefix}{caret_padding}^"
-		)
\ No newline at end of file
+        return self.source.render("SyntaxError", self.message, self.line, self.column)
\ No newline at end of file
@@ -1,3 +1,7 @@
+import io
+
+from .node_kind import NodeKind
+from .tree_builder import TreeBuilder
 
 class ParseNode:
     def __init__(self, type: str):
@@ -7,30 +11,72 @@ class ParseNode:
     def add_child(self, node: "ParseNode"):
         self.child.append(node)        
         
-    def __str__(self, level=0, prefix=""):
+    def __str__(self):
         '''Parse Tree Output'''
-        lines = []
-        if level == 0:
-            lines.append(f"{self.type}")
-        else:
-            lines.append(f"{prefix}└── {self.type}")
-            
-        child_count = len(self.child)
-        for i, c in enumerate(self.child):
-            is_last = (i == child_count - 1)
+        buffer = io.StringIO()
+        self.write_tree(buffer)
+        return buffer.getvalue()
+
+    def write_tree(self, fp):
+        '''Tulis parse tree ke file handle, format sama persis dengan str(node).
+
+        Tree dijalani sekali pakai stack eksplisit dan tiap line langsung di-write,
+        jadi linear di ukuran tree dan aman untuk nesting sedalam apapun.
+        '''
+        write = fp.write
+        write(self.type)
+        # [node, index child berikutnya, prefix child]
+        stack = [[self, 0, ""]]
+        while stack:
+            frame = stack[-1]
+            node, i, prefix = frame
+            children = node.child
+            if i == len(children):
+                stack.pop()
+                continue
+            frame[1] = i + 1
+
+            c = children[i]
+            is_last = (i == len(children) - 1)
             connector = "└── " if is_last else "├── "
-            next_prefix = prefix + ("    " if is_last else "│   ")
-            
+
             if isinstance(c, ParseNode):
-                lines.append(f"{prefix}{connector}{c.type}")
-                child_lines = c.__str__(level + 1, next_prefix).splitlines()
-                lines.extend(child_lines[1:]) 
+                write(f"\n{prefix}{connector}{c.type}")
+                if c.child:
+                    stack.append([c, 0, prefix + ("    " if is_last else "│   ")])
+                continue
+
+            if hasattr(c, "type") and hasattr(c, "value"):
+                line = f"{prefix}{connector}{c.type}({c.value})"
             else:
-                if hasattr(c, "type") and hasattr(c, "value"):
-                    lines.append(f"{prefix}{connector}{c.type}({c.value})")
-                else:
-                    lines.append(f"{prefix}{connector}{str(c)}")
-                    
-        return "\n".join(lines)
+                line = f"{prefix}{connector}{str(c)}"
+            # Format lama me-splitlines() output tiap subtree, jadi line break di value
+            # (string literal multi-line) di bawah root dinormalisasi jadi '\n'
+            if len(stack) > 1 and not line.isprintable():
+                line = "\n".join(line.splitlines())
+            write("\n" + line)
+
+
+class ParseNodeBuilder(TreeBuilder):
+    '''Builder default Parser: satu ParseNode per produksi, token jadi leaf apa adanya'''
+    def __init__(self):
+        self.stack = []
+        self.root = None
+
+    def open(self, kind):
+        node = ParseNode(NodeKind.NAMES[kind])
+        if self.stack:
+            self.stack[-1].child.append(node)
+        self.stack.append(node)
+
+    def token(self, token, index):
+        self.stack[-1].child.append(token)
 
+    def close(self):
+        node = self.stack.pop()
+        if not self.stack:
+            self.root = node
+        return node
 
+    def result(self):
+        return self.root
@@ -0,0 +1,199 @@
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .node_kind import NodeKind
+from .parse_node import ParseNode
+from .tree_builder import TreeBuilder
+from src.lexer.token import Token
+
+class ParseTree:
+    '''Parse tree versi arena: node disimpan columnar di array paralel, bukan object per node.
+
+    Node diberi id urut preorder dari root (id 0), jadi subtree tiap node selalu range id contiguous
+    node .. end(node). refs[node] = id setelah subtree untuk node produksi, index token di tokens
+    untuk leaf (NodeKind.TOKEN), jadi per node cukup 6 byte dan tree murah di-pickle ke worker.
+    Dibangun langsung oleh Parser lewat ParseTreeBuilder.
+    '''
+    def __init__(self, tokens: Sequence[Token]):
+        # TokenBuffer yang di-parse, atau list Token yang dikumpulkan ParseTreeBuilder
+        self.tokens = tokens
+        self.kinds = array('h')
+        self.refs = array('i')
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    # ========== Akses per node ==========
+    def kind(self, node: int) -> int:
+        return self.kinds[node]
+
+    def type_of(self, node: int) -> str:
+        '''Nama produksi ("<program>") atau tipe token untuk leaf, sama dengan ParseNode.type/Token.type'''
+        kind = self.kinds[node]
+        if kind == NodeKind.TOKEN:
+            return self.tokens[self.refs[node]].type
+        return NodeKind.NAMES[kind]
+
+    def is_leaf(self, node: int) -> bool:
+        return self.kinds[node] == NodeKind.TOKEN
+
+    def end(self, node: int) -> int:
+        '''Id setelah node terakhir di subtree node'''
+        return node + 1 if self.kinds[node] == NodeKind.TOKEN else self.refs[node]
+
+    def children(self, node: int) -> Iterator[int]:
+        kinds, refs = self.kinds, self.refs
+        end = self.end(node)
+        child = node + 1
+        while child < end:
+            yield child
+            child = child + 1 if kinds[child] == NodeKind.TOKEN else refs[child]
+
+    def token_index(self, node: int) -> int:
+        if self.kinds[node] != NodeKind.TOKEN:
+            raise ValueError(f"Node {node} ({self.type_of(node)}) is not a token leaf")
+        return self.refs[node]
+
+    def token(self, node: int) -> Token:
+        return self.tokens[self.token_index(node)]
+
+    # ========== Traversal ==========
+    def walk(self, node: int = 0) -> Iterator[Tuple[int, int]]:
+        '''Preorder (node, depth): subtree = range id contiguous, cukup stack end ancestor'''
+        kinds, refs = self.kinds, self.refs
+        ends: List[int] = []
+        for current in range(node, self.end(node)):
+            while ends and current >= ends[-1]:
+                ends.pop()
+            yield current, len(ends)
+            if kinds[current] != NodeKind.TOKEN:
+                ends.append(refs[current])
+
+    def leaves(self, node: int = 0) -> Iterator[int]:
+        '''Index token semua leaf di bawah node, urut source'''
+        kinds, refs = self.kinds, self.refs
+        for current in range(node, self.end(node)):
+            if kinds[current] == NodeKind.TOKEN:
+                yield refs[current]
+
+    def to_node(self, node: int = 0):
+        '''View ParseNode (token leaf jadi Token dari tokens), untuk kode yang masih pakai ParseNode'''
+        kinds, refs, tokens = self.kinds, self.refs, self.tokens
+        if kinds[node] == NodeKind.TOKEN:
+            return tokens[refs[node]]
+        root = ParseNode(NodeKind.NAMES[kinds[node]])
+        # (end subtree, ParseNode) ancestor yang masih terbuka
+        stack = [(refs[node], root)]
+        for current in range(node + 1, refs[node]):
+            while current >= stack[-1][0]:
+                stack.pop()
+            parent = stack[-1][1]
+            kind = kinds[current]
+            if kind == NodeKind.TOKEN:
+                parent.add_child(tokens[refs[current]])
+            else:
+                child = ParseNode(NodeKind.NAMES[kind])
+                parent.add_child(child)
+                stack.append((refs[current], child))
+        return root
+
+    def write_tree(self, fp, node: int = 0):
+        '''Tulis tree ke file handle, format sama persis dengan ParseNode.write_tree'''
+        kinds, refs, tokens = self.kinds, self.refs, self.tokens
+        names = NodeKind.NAMES
+        write = fp.write
+        write(self.type_of(node))
+        # [end subtree, prefix child] ancestor yang masih terbuka, child terakhir = end subtree-nya sama
+        stack = [(self.end(node), "")]
+        for current in range(node + 1, self.end(node)):
+            while current >= stack[-1][0]:
+                stack.pop()
+            parent_end, prefix = stack[-1]
+
+            kind = kinds[current]
+            if kind != NodeKind.TOKEN:
+                end = refs[current]
+                is_last = (end == parent_end)
+                write(f"\n{prefix}{'└── ' if is_last else '├── '}{names[kind]}")
+                if end > current + 1:
+                    stack.append((end, prefix + ("    " if is_last else "│   ")))
+                continue
+
+            token = tokens[refs[current]]
+            is_last = (current + 1 == parent_end)
+            line = f"{prefix}{'└── ' if is_last else '├── '}{token.type}({token.value})"
+            # sama dengan ParseNode.write_tree: line break di value di bawah root dinormalisasi
+            if len(stack) > 1 and not line.isprintable():
+                line = "\n".join(line.splitlines())
+            write("\n" + line)
+
+
+class ParseTreeBuilder(TreeBuilder):
+    '''Builder Parser yang menulis langsung ke ParseTree, tanpa ParseNode di tengah.
+
+    tokens = TokenBuffer/list yang di-parse, leaf langsung pakai index token dari Parser.
+    Tanpa tokens (Parser narik dari generator lexer.iter_tokens), token yang masuk ke tree
+    dikumpulkan sendiri di list.
+    '''
+    def __init__(self, tokens: Optional[Sequence[Token]] = None):
+        self.collect = tokens is None
+        self.tree = ParseTree([] if tokens is None else tokens)
+        self.kinds, self.refs = self.tree.kinds, self.tree.refs
+        self.stack: List[int] = []  # id produksi yang sedang terbuka
+
+    def open(self, kind):
+        self.stack.append(len(self.kinds))
+        self.kinds.append(kind)
+        self.refs.append(0)
+
+    def token(self, token, index):
+        if self.collect:
+            index = len(self.tree.tokens)
+            self.tree.tokens.append(token)
+        self.kinds.append(NodeKind.TOKEN)
+        self.refs.append(index)
+
+    def close(self):
+        node = self.stack.pop()
+        self.refs[node] = len(self.kinds)
+        return node
+
+    def result(self):
+        return self.tree
+
+
+class ParseTreeVisitor:
+    '''Visitor untuk ParseTree: visit_<produksi>(tree, node) dipanggil preorder dan
+    leave_<produksi>(tree, node) setelah semua child, mis. visit_if_statement / leave_expression,
+    leaf lewat visit_token. Method yang ga ada dilewati, child tetap dikunjungi kecuali
+    visit_* return False. Jalan urut id (preorder) tanpa rekursi.
+    '''
+    def visit(self, tree: ParseTree, node: int = 0):
+        kinds = tree.kinds
+        handlers: Dict[int, Tuple[Optional[Callable], Optional[Callable]]] = {}
+        # (end subtree, node, leave) yang leave-nya belum dipanggil
+        leaving: List[Tuple[int, int, Callable]] = []
+        current, end = node, tree.end(node)
+        while current < end:
+            while leaving and current >= leaving[-1][0]:
+                _, done, leave = leaving.pop()
+                leave(tree, done)
+
+            kind = kinds[current]
+            handler = handlers.get(kind)
+            if handler is None:
+                suffix = NodeKind.method_suffix(kind)
+                handler = handlers[kind] = (getattr(self, f"visit_{suffix}", None),
+                                            getattr(self, f"leave_{suffix}", None))
+            enter, leave = handler
+
+            if enter is not None and enter(tree, current) is False:
+                current = tree.end(current)
+                continue
+            if leave is not None:
+                leaving.append((tree.end(current), current, leave))
+            current += 1
+
+        while leaving:
+            _, done, leave = leaving.pop()
+            leave(tree, done)
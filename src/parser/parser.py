@@ -1,673 +1,778 @@
+from collections import deque
+
+from .node_kind import NodeKind
 from .parse_error import ParseError
-from .parse_node import ParseNode
+from .parse_node import ParseNodeBuilder
+from src.lexer.token import Token
+from src.lexer.token_kind import TokenKind, Keyword
+from src.semantic.traversal import run_traversal
+
+# Peek terjauh yang dipakai grammar (peek(1): IDENTIFIER diikuti "(", range "..")
+LOOKAHEAD = 1
+
+# FIRST set tiap produksi, token = (kind, keyword id). Keyword.NONE = semua token dengan kind tsb
+# (keyword id spesifik tetap dicek duluan, lihat Parser.dispatch)
+LITERAL_FIRST = frozenset((
+    (TokenKind.NUMBER, Keyword.NONE), (TokenKind.STRING_LITERAL, Keyword.NONE), (TokenKind.CHAR_LITERAL, Keyword.NONE),
+))
+BOOLEAN_FIRST = frozenset(((TokenKind.KEYWORD, Keyword.TRUE), (TokenKind.KEYWORD, Keyword.FALSE)))
+BUILTIN_TYPE_FIRST = frozenset((
+    (TokenKind.KEYWORD, Keyword.INTEGER), (TokenKind.KEYWORD, Keyword.REAL),
+    (TokenKind.KEYWORD, Keyword.BOOLEAN), (TokenKind.KEYWORD, Keyword.CHAR),
+))
+
+STATEMENT_FIRST = {
+    "<empty-statement>": {(TokenKind.SEMICOLON, Keyword.NONE), (TokenKind.KEYWORD, Keyword.SELESAI)},
+    "<if-statement>": {(TokenKind.KEYWORD, Keyword.JIKA)},
+    "<while-statement>": {(TokenKind.KEYWORD, Keyword.SELAMA)},
+    "<for-statement>": {(TokenKind.KEYWORD, Keyword.UNTUK)},
+    "<repeat-statement>": {(TokenKind.KEYWORD, Keyword.ULANGI)},
+    "<compound-statement>": {(TokenKind.KEYWORD, Keyword.MULAI)},
+    "<case-statement>": {(TokenKind.KEYWORD, Keyword.KASUS)},
+    # IDENTIFIER: call kalau diikuti "(", selain itu assignment
+    "<identifier-statement>": {(TokenKind.IDENTIFIER, Keyword.NONE)},
+    # keyword lain diikuti "(" = builtin procedure/function
+    "<builtin-call>": {(TokenKind.KEYWORD, Keyword.NONE)},
+}
+
+FACTOR_FIRST = {
+    "<literal>": LITERAL_FIRST | BOOLEAN_FIRST,
+    "<not>": {(TokenKind.LOGICAL_OPERATOR, Keyword.TIDAK), (TokenKind.KEYWORD, Keyword.TIDAK)},
+    "<parenthesized>": {(TokenKind.LPARENTHESIS, Keyword.NONE)},
+    "<identifier>": {(TokenKind.IDENTIFIER, Keyword.NONE)},
+}
+
+TYPE_FIRST = {
+    "<array-type>": {(TokenKind.KEYWORD, Keyword.LARIK)},
+    "<record-type>": {(TokenKind.KEYWORD, Keyword.REKAMAN)},
+    "<builtin-type>": BUILTIN_TYPE_FIRST,
+    "<custom-type>": {(TokenKind.IDENTIFIER, Keyword.NONE)},
+}
+
+# Jenis operand (hasil FACTOR_DISPATCH), state & frame stack parse_expression_tree
+_LITERAL, _NOT, _PARENTHESIZED, _IDENTIFIER = range(4)
+_OPERAND, _OPERATOR, _VARIABLE, _CALL = range(4)
+_CLOSE_PAREN, _NEXT_ARGUMENT, _CLOSE_INDEX = range(3)
+
+
+def build_dispatch(first_sets, handlers):
+    '''(kind, keyword id) -> handler dari FIRST set tiap produksi, FIRST set yang overlap = grammar ga LL(1)'''
+    table = {}
+    for production, first in first_sets.items():
+        handler = handlers[production]
+        for token in first:
+            if token in table:
+                raise ValueError(f"FIRST set conflict on {TokenKind.name(token[0])}/{Keyword.word(token[1])}: {production}")
+            table[token] = handler
+    return table
+
+# Operator yang boleh muncul di tiap level ekspresi (keyword id)
+RELATIONAL_KEYWORDS = frozenset((Keyword.LT, Keyword.GT, Keyword.LE, Keyword.GE, Keyword.EQ, Keyword.NE))
+ADDITIVE_KEYWORDS = frozenset((Keyword.PLUS, Keyword.MINUS))
+MULTIPLICATIVE_KEYWORDS = frozenset((Keyword.TIMES, Keyword.DIVIDE, Keyword.BAGI, Keyword.MOD))
+
+# Level operator biner (makin besar makin kuat mengikat), key (kind, keyword id)
+_RELATIONAL, _ADDITIVE, _MULTIPLICATIVE = 1, 2, 3
+BINARY_OPERATORS = {(TokenKind.RELATIONAL_OPERATOR, keyword): _RELATIONAL for keyword in RELATIONAL_KEYWORDS}
+BINARY_OPERATORS.update(((TokenKind.ARITHMETIC_OPERATOR, keyword), _ADDITIVE) for keyword in ADDITIVE_KEYWORDS)
+BINARY_OPERATORS[(TokenKind.LOGICAL_OPERATOR, Keyword.ATAU)] = _ADDITIVE
+BINARY_OPERATORS.update(((TokenKind.ARITHMETIC_OPERATOR, keyword), _MULTIPLICATIVE) for keyword in MULTIPLICATIVE_KEYWORDS)
+BINARY_OPERATORS[(TokenKind.LOGICAL_OPERATOR, Keyword.DAN)] = _MULTIPLICATIVE
 
 class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
+    '''Recursive descent parser, token ditarik dari iterable satu-satu (list, TokenBuffer,
+    atau generator lexer.iter_tokens) jadi parsing bisa jalan sambil lexing.
+
+    Grammar cuma ada di sini: tiap produksi kirim event open/token/close ke builder (TreeBuilder),
+    builder yang menentukan hasil parse() (default ParseNode tree).
+    '''
+    def __init__(self, tokens, source=None, builder=None):
+        self.tokens = iter(tokens)
+        self.source = source  # SourceFile, dipakai ParseError buat render konteks
+        self.builder = builder if builder is not None else ParseNodeBuilder()
+        self.open = self.builder.open
+        self.close = self.builder.close
+        self.emit = self.builder.token
         self.pos = 0
-        self.current_token = self.tokens[self.pos]
+        # Ring buffer token setelah current_token, ukurannya = peek terjauh grammar
+        self.lookahead = deque(maxlen=LOOKAHEAD)
+        self.last_token = None
+        self.current_token = next(self.tokens, None)
 
     # ========== Utility ==========
     def advance(self):
-        '''Advance 1 offset dari tokens list'''
+        '''Advance 1 token, ambil dari lookahead dulu sebelum tarik dari iterator'''
         self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
+        self.last_token = self.current_token
+        if self.lookahead:
+            self.current_token = self.lookahead.popleft()
         else:
-            self.current_token = None
+            self.current_token = next(self.tokens, None)
 
     def peek(self, offset=1):
         '''Melihat token selanjutnya tanpa consume'''
-        peek_pos = self.pos + offset
-        if peek_pos < len(self.tokens):
-            return self.tokens[peek_pos]
-        return None
-
-    def expect(self, expected_type, expected_value=None):
-        '''Expected token untuk suatu aturan produksi'''
+        if not 0 < offset <= LOOKAHEAD:
+            raise ValueError(f"peek offset {offset} out of lookahead range 1..{LOOKAHEAD}")
+        lookahead = self.lookahead
+        while len(lookahead) < offset:
+            token = next(self.tokens, None)
+            if token is None:
+                return None
+            lookahead.append(token)
+        return lookahead[offset - 1]
+
+    def expect(self, expected_kind, expected_keyword=Keyword.NONE):
+        '''Expected token untuk suatu aturan produksi (kind dari TokenKind, keyword id dari Keyword)'''
         token = self.current_token
         if token is None:
-            raise ParseError(f"Unexpected end of input, expected {expected_type}", self.tokens[-1])
+            raise ParseError(f"Unexpected end of input, expected {TokenKind.name(expected_kind)}", self.end_token())
 
-        if token.type != expected_type:
-            raise ParseError(f"Unexpected token {token.type}({token.value}), expected {expected_type}", token)
+        if token.kind != expected_kind:
+            raise ParseError(f"Unexpected token {token.type}({token.value}), expected {TokenKind.name(expected_kind)}", token)
 
-        if expected_value and token.value.lower() != expected_value.lower():
-            raise ParseError(f"Unexpected value '{token.value}', expected '{expected_value}'", token)
+        if expected_keyword and token.keyword != expected_keyword:
+            raise ParseError(f"Unexpected value '{token.value}', expected '{Keyword.word(expected_keyword)}'", token)
 
         self.advance()
         return token
 
-    def check(self, expected_type, expected_value=None):
-        '''Compare current token with type and/or value'''
+    def consume(self, expected_kind, expected_keyword=Keyword.NONE):
+        '''expect, lalu token masuk ke produksi yang sedang terbuka di builder'''
+        token = self.current_token
+        if token is None or token.kind != expected_kind or (expected_keyword and token.keyword != expected_keyword):
+            self.expect(expected_kind, expected_keyword)  # raise ParseError yang sesuai
+        self.emit(token, self.pos)
+        self.advance()
+        return token
+
+    def end_token(self):
+        '''Token terakhir input buat posisi error end of input (input kosong -> line 1 column 1)'''
+        return self.last_token or Token("UNKNOWN", "", 1, 1)
+
+    def dispatch(self, table):
+        '''Handler produksi buat current token: cocokkan (kind, keyword id) lalu (kind, semua keyword)'''
+        token = self.current_token
+        if token is None:
+            return None
+        handler = table.get((token.kind, token.keyword))
+        if handler is None and token.keyword:
+            handler = table.get((token.kind, Keyword.NONE))
+        return handler
+
+    def check(self, expected_kind, expected_keyword=Keyword.NONE):
+        '''Compare current token with kind and/or keyword id'''
         if self.current_token is None:
             return False
-        if self.current_token.type != expected_type:
+        if self.current_token.kind != expected_kind:
             return False
-        if expected_value and self.current_token.value.lower() != expected_value.lower():
+        if expected_keyword and self.current_token.keyword != expected_keyword:
             return False
         return True
 
     # ========= Parse rules =========
     def parse(self):
         '''Main function caller'''
-        node = self.parse_program()
-        if self.current_token is not None:
-            raise ParseError(f"Unexpected token {self.current_token.type}({self.current_token.value})", self.current_token)
-        return node
+        try:
+            self.parse_program()
+            if self.current_token is not None:
+                raise ParseError(f"Unexpected token {self.current_token.type}({self.current_token.value})", self.current_token)
+        except ParseError as e:
+            e.source = self.source
+            # Sisa token tetap ditarik sampai habis: LexicalError di belakang menang atas syntax error,
+            # sama seperti waktu seluruh file di-lex dulu sebelum parse
+            for _ in self.tokens:
+                pass
+            raise
+        return self.builder.result()
 
 	# Root
     def parse_program(self):
         '''Root node parse: header + declaration + compound statement + ending dot'''
-        node = ParseNode("<program>")
-        node.add_child(self.parse_program_header())
-        node.add_child(self.parse_declaration_part())
-        node.add_child(self.parse_compound_statement())
-        node.add_child(self.expect("DOT"))
-        return node
+        self.open(NodeKind.PROGRAM)
+        self.parse_program_header()
+        self.parse_declaration_part()
+        self.run_statements(self.parse_compound_statement)
+        self.consume(TokenKind.DOT)
+        return self.close()
 
 	# Header
     def parse_program_header(self):
         '''Header node parser'''
-        node = ParseNode("<program-header>")
-        node.add_child(self.expect("KEYWORD","program"))
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("SEMICOLON"))
-        return node
+        self.open(NodeKind.PROGRAM_HEADER)
+        self.consume(TokenKind.KEYWORD, Keyword.PROGRAM)
+        self.consume(TokenKind.IDENTIFIER)
+        self.consume(TokenKind.SEMICOLON)
+        return self.close()
 
 	# Declaration rules
     def parse_declaration_part(self):
         '''Strict urutan initialization dari pascal-s: const -> type -> var -> subprogram'''
-        node = ParseNode("<declaration-part>")
-        while self.check("KEYWORD", "konstanta"):
-            node.add_child(self.parse_const_declaration())
-        while self.check("KEYWORD", "tipe"):
-            node.add_child(self.parse_type_declaration())
-        while self.check("KEYWORD", "variabel"):
-            node.add_child(self.parse_var_declaration())
-        while self.check("KEYWORD", "prosedur") or self.check("KEYWORD", "fungsi"):
-            node.add_child(self.parse_subprogram_declaration())
-        return node
+        self.open(NodeKind.DECLARATION_PART)
+        while self.check(TokenKind.KEYWORD, Keyword.KONSTANTA):
+            self.parse_const_declaration()
+        while self.check(TokenKind.KEYWORD, Keyword.TIPE):
+            self.parse_type_declaration()
+        while self.check(TokenKind.KEYWORD, Keyword.VARIABEL):
+            self.parse_var_declaration()
+        while self.check(TokenKind.KEYWORD, Keyword.PROSEDUR) or self.check(TokenKind.KEYWORD, Keyword.FUNGSI):
+            self.parse_subprogram_declaration()
+        return self.close()
 
     def parse_const_declaration(self):
         '''Parse const declaration'''
-        node = ParseNode("<const-declaration>")
-        node.add_child(self.expect("KEYWORD", "konstanta"))
+        self.open(NodeKind.CONST_DECLARATION)
+        self.consume(TokenKind.KEYWORD, Keyword.KONSTANTA)
 
         while True:
-            node.add_child(self.expect("IDENTIFIER"))
+            self.consume(TokenKind.IDENTIFIER)
 
-            if self.check("RELATIONAL_OPERATOR") and self.current_token.value == "=":
-                node.add_child(self.expect("RELATIONAL_OPERATOR"))
+            if self.check(TokenKind.RELATIONAL_OPERATOR, Keyword.EQ):
+                self.consume(TokenKind.RELATIONAL_OPERATOR)
             else:
                 raise ParseError(f"Expected '=' in constant declaration", self.current_token)
 
-            node.add_child(self.parse_expression())
-            node.add_child(self.expect("SEMICOLON"))
+            self.parse_expression()
+            self.consume(TokenKind.SEMICOLON)
 
-            if not self.check("IDENTIFIER"):
+            if not self.check(TokenKind.IDENTIFIER):
                 break
-        return node
+        return self.close()
 
     def parse_type_declaration(self):
         '''Parse type declaration'''
-        node = ParseNode("<type-declaration>")
-        node.add_child(self.expect("KEYWORD", "tipe"))
+        self.open(NodeKind.TYPE_DECLARATION)
+        self.consume(TokenKind.KEYWORD, Keyword.TIPE)
 
         while True:
-            node.add_child(self.expect("IDENTIFIER"))
+            self.consume(TokenKind.IDENTIFIER)
 
-            if self.check("RELATIONAL_OPERATOR") and self.current_token.value == "=":
-                node.add_child(self.expect("RELATIONAL_OPERATOR"))
+            if self.check(TokenKind.RELATIONAL_OPERATOR, Keyword.EQ):
+                self.consume(TokenKind.RELATIONAL_OPERATOR)
             else:
                 raise ParseError(f"Expected '=' in type declaration", self.current_token)
-            node.add_child(self.parse_type_definition())
-            node.add_child(self.expect("SEMICOLON"))
+            self.parse_type_definition()
+            self.consume(TokenKind.SEMICOLON)
 
-            if not self.check("IDENTIFIER"):
+            if not self.check(TokenKind.IDENTIFIER):
                 break
-        return node
+        return self.close()
 
     def parse_var_declaration(self):
         '''Parse variable declaration'''
-        node = ParseNode("<var-declaration>")
-        node.add_child(self.expect("KEYWORD", "variabel"))
+        self.open(NodeKind.VAR_DECLARATION)
+        self.consume(TokenKind.KEYWORD, Keyword.VARIABEL)
 
         while True:
-            node.add_child(self.parse_identifier_list())
-            node.add_child(self.expect("COLON"))
-            node.add_child(self.parse_type())
-            node.add_child(self.expect("SEMICOLON"))
+            self.parse_identifier_list()
+            self.consume(TokenKind.COLON)
+            self.parse_type()
+            self.consume(TokenKind.SEMICOLON)
 
-            if not self.check("IDENTIFIER"):
+            if not self.check(TokenKind.IDENTIFIER):
                 break
-        return node
+        return self.close()
 
     def parse_subprogram_declaration(self):
-        if self.check("KEYWORD", "prosedur"):
+        if self.check(TokenKind.KEYWORD, Keyword.PROSEDUR):
             return self.parse_procedure_declaration()
-        elif self.check("KEYWORD", "fungsi"):
+        elif self.check(TokenKind.KEYWORD, Keyword.FUNGSI):
             return self.parse_function_declaration()
         else:
             raise ParseError(f"Expected 'prosedur' or 'fungsi'", self.current_token)
 
     def parse_procedure_declaration(self):
-        node = ParseNode("<procedure-declaration>")
-        node.add_child(self.expect("KEYWORD", "prosedur"))
-        node.add_child(self.expect("IDENTIFIER"))
+        self.open(NodeKind.PROCEDURE_DECLARATION)
+        self.consume(TokenKind.KEYWORD, Keyword.PROSEDUR)
+        self.consume(TokenKind.IDENTIFIER)
         #parse parameter list
-        if self.check("LPARENTHESIS"):
-            node.add_child(self.parse_formal_parameter_list())
-        node.add_child(self.expect("SEMICOLON"))
+        if self.check(TokenKind.LPARENTHESIS):
+            self.parse_formal_parameter_list()
+        self.consume(TokenKind.SEMICOLON)
         #parse block
-        node.add_child(self.parse_block())
-        node.add_child(self.expect("SEMICOLON"))
-        return node
+        self.parse_block()
+        self.consume(TokenKind.SEMICOLON)
+        return self.close()
 
     def parse_function_declaration(self):
-        node = ParseNode("<function-declaration>")
-        node.add_child(self.expect("KEYWORD", "fungsi"))
-        node.add_child(self.expect("IDENTIFIER"))
+        self.open(NodeKind.FUNCTION_DECLARATION)
+        self.consume(TokenKind.KEYWORD, Keyword.FUNGSI)
+        self.consume(TokenKind.IDENTIFIER)
         #parse parameter list
-        if self.check("LPARENTHESIS"):
-            node.add_child(self.parse_formal_parameter_list())
+        if self.check(TokenKind.LPARENTHESIS):
+            self.parse_formal_parameter_list()
         #parse return type
-        node.add_child(self.expect("COLON"))
-        node.add_child(self.parse_type())
-        node.add_child(self.expect("SEMICOLON"))
+        self.consume(TokenKind.COLON)
+        self.parse_type()
+        self.consume(TokenKind.SEMICOLON)
         #parse block
-        node.add_child(self.parse_block())
-        node.add_child(self.expect("SEMICOLON"))
-        return node
+        self.parse_block()
+        self.consume(TokenKind.SEMICOLON)
+        return self.close()
 
     def parse_block(self):
-        node = ParseNode("<block>")
-        node.add_child(self.parse_declaration_part())
-        node.add_child(self.parse_compound_statement())
-        return node
+        self.open(NodeKind.BLOCK)
+        self.parse_declaration_part()
+        self.run_statements(self.parse_compound_statement)
+        return self.close()
 
     def parse_formal_parameter_list(self):
-        node = ParseNode("<formal-parameter-list>")
-        node.add_child(self.expect("LPARENTHESIS"))
+        self.open(NodeKind.FORMAL_PARAMETER_LIST)
+        self.consume(TokenKind.LPARENTHESIS)
 
-        node.add_child(self.parse_parameter_group())
+        self.parse_parameter_group()
 
-        while self.check("SEMICOLON"):
-            node.add_child(self.expect("SEMICOLON"))
-            node.add_child(self.parse_parameter_group())
-        node.add_child(self.expect("RPARENTHESIS"))
-        return node
+        while self.check(TokenKind.SEMICOLON):
+            self.consume(TokenKind.SEMICOLON)
+            self.parse_parameter_group()
+        self.consume(TokenKind.RPARENTHESIS)
+        return self.close()
 
     def parse_parameter_group(self):
         '''Helper function for formal-parameter-list'''
-        node = ParseNode("<parameter-group>")
+        self.open(NodeKind.PARAMETER_GROUP)
 
         # (Changes MST 3): cek kalo ada 'variabel' parameter as reference
-        if self.check('KEYWORD', 'variabel'):
-            node.add_child(self.expect("KEYWORD", 'variabel'))
+        if self.check(TokenKind.KEYWORD, Keyword.VARIABEL):
+            self.consume(TokenKind.KEYWORD, Keyword.VARIABEL)
 
 
-        node.add_child(self.parse_identifier_list())
-        node.add_child(self.expect("COLON"))
-        node.add_child(self.parse_type())
-        return node
+        self.parse_identifier_list()
+        self.consume(TokenKind.COLON)
+        self.parse_type()
+        return self.close()
 
     # Type / Identifier
     def parse_identifier_list(self):
         '''Identifier, Identifier, Identifier'''
-        node = ParseNode("<identifier-list>")
-        node.add_child(self.expect("IDENTIFIER"))
+        self.open(NodeKind.IDENTIFIER_LIST)
+        self.consume(TokenKind.IDENTIFIER)
 
-        while self.check("COMMA"):
-            node.add_child(self.expect("COMMA"))
-            node.add_child(self.expect("IDENTIFIER"))
-        return node
+        while self.check(TokenKind.COMMA):
+            self.consume(TokenKind.COMMA)
+            self.consume(TokenKind.IDENTIFIER)
+        return self.close()
 
     def parse_type_definition(self):
         '''tipe di type-declaration saja, supports range'''
-        node = ParseNode("<type-definition>")
+        self.open(NodeKind.TYPE_DEFINITION)
 
         # RANGE TYPE (expression '..' expression)
         if self.lookahead_is_range():
-            left_expr = self.parse_expression()
-            node.add_child(left_expr)
-            node.add_child(self.expect("RANGE_OPERATOR"))
-            node.add_child(self.parse_expression())
-            return node
-
-        # ARRAY TYPE
-        if self.check("KEYWORD", "larik"):
-            node.add_child(self.parse_array_type())
-            return node
-
-        # RECORD TYPE
-        if self.check("KEYWORD", "rekaman"):
-            node.add_child(self.parse_record_type())
-            return node
-
-        # BUILTIN TYPE
-        if self.check("KEYWORD", "integer") or self.check("KEYWORD", "real") or \
-        self.check("KEYWORD", "boolean") or self.check("KEYWORD", "char"):
-            node.add_child(self.expect("KEYWORD"))
-            return node
-
-        # CUSTOM TYPE
-        if self.check("IDENTIFIER"):
-            node.add_child(self.expect("IDENTIFIER"))
-            return node
-
-        raise ParseError("Invalid type-definition", self.current_token)
+            self.parse_expression()
+            self.consume(TokenKind.RANGE_OPERATOR)
+            self.parse_expression()
+            return self.close()
+
+        # ARRAY / RECORD / BUILTIN / CUSTOM TYPE
+        handler = self.dispatch(self.TYPE_DISPATCH)
+        if handler is None:
+            raise ParseError("Invalid type-definition", self.current_token)
+        handler(self)
+        return self.close()
 
     def parse_type(self):
         '''parse type di variable declaration or function return type (ga ada range)'''
-        node = ParseNode("<type>")
+        self.open(NodeKind.TYPE)
 
-        #array type
-        if self.check("KEYWORD", "larik"):
-            node.add_child(self.parse_array_type())
-            return node
+        # array, rekaman, builtin type, custom type (identifier)
+        handler = self.dispatch(self.TYPE_DISPATCH)
+        if handler is None:
+            raise ParseError(f"Expected type", self.current_token)
+        handler(self)
+        return self.close()
 
-        #rekaman
-        elif self.check("KEYWORD", "rekaman"):
-            node.add_child(self.parse_record_type())
-            return node
+    def parse_builtin_type(self):
+        return self.consume(TokenKind.KEYWORD)
 
-        #builtin type
-        elif self.check("KEYWORD", "integer") or self.check("KEYWORD", "real") or \
-             self.check("KEYWORD", "boolean") or self.check("KEYWORD", "char"):
-            node.add_child(self.expect("KEYWORD"))
-            return node
-
-        #custom type (identifier)
-        if self.check("IDENTIFIER"):
-            node.add_child(self.expect("IDENTIFIER"))
-            return node
-
-        raise ParseError(f"Expected type", self.current_token)
+    def parse_custom_type(self):
+        return self.consume(TokenKind.IDENTIFIER)
 
 
     def parse_array_type(self):
-        node = ParseNode("<array-type>")
-        node.add_child(self.expect("KEYWORD", "larik"))
-        node.add_child(self.expect("LBRACKET"))
-        node.add_child(self.parse_range())
-        node.add_child(self.expect("RBRACKET"))
-        node.add_child(self.expect("KEYWORD", "dari"))
-        node.add_child(self.parse_type())
-        return node
+        self.open(NodeKind.ARRAY_TYPE)
+        self.consume(TokenKind.KEYWORD, Keyword.LARIK)
+        self.consume(TokenKind.LBRACKET)
+        self.parse_range()
+        self.consume(TokenKind.RBRACKET)
+        self.consume(TokenKind.KEYWORD, Keyword.DARI)
+        self.parse_type()
+        return self.close()
 
     def parse_record_type(self):
-        node = ParseNode("<record-type>")
-        node.add_child(self.expect("KEYWORD", "rekaman"))
-        node.add_child(self.parse_parameter_group())
+        self.open(NodeKind.RECORD_TYPE)
+        self.consume(TokenKind.KEYWORD, Keyword.REKAMAN)
+        self.parse_parameter_group()
 
-        while self.check("SEMICOLON"):
-            node.add_child(self.expect("SEMICOLON"))
-            if self.check("KEYWORD", "selesai"):
+        while self.check(TokenKind.SEMICOLON):
+            self.consume(TokenKind.SEMICOLON)
+            if self.check(TokenKind.KEYWORD, Keyword.SELESAI):
                 break
-            node.add_child(self.parse_parameter_group())
+            self.parse_parameter_group()
 
-        node.add_child(self.expect("KEYWORD", "selesai"))
-        return node
+        self.consume(TokenKind.KEYWORD, Keyword.SELESAI)
+        return self.close()
 
     def parse_variable(self):
         '''parse variable, dot chaining + indexing '''
-        node = ParseNode("<variable>")
-        # print("DEBUG VARIABLE TOKEN:", self.current_token.type, self.current_token.value)
-
-        identifier = self.expect("IDENTIFIER")
-        node.add_child(identifier)
-
-        while True:
-            if self.check("DOT"):
-                node.add_child(self.expect("DOT"))
-                node.add_child(self.expect("IDENTIFIER"))
-
-            elif self.check("LBRACKET"):
-                node.add_child(self.parse_variable_index())
-
-            else:
-                break
-
-        return node
-
-    def parse_variable_index(self):
-        '''Array index access: [expr]'''
-        node = ParseNode("<variable-index>")
-
-        node.add_child(self.expect("LBRACKET"))
-        node.add_child(self.parse_expression())
-        node.add_child(self.expect("RBRACKET"))
-
-        return node
+        return self.parse_expression_tree(NodeKind.VARIABLE)
 
 
     def parse_range(self):
-        node = ParseNode("<range>")
-        node.add_child(self.parse_expression())
+        self.open(NodeKind.RANGE)
+        self.parse_expression()
 
-        if self.check("RANGE_OPERATOR"):
-            node.add_child(self.expect("RANGE_OPERATOR"))
+        if self.check(TokenKind.RANGE_OPERATOR):
+            self.consume(TokenKind.RANGE_OPERATOR)
         else:
             raise ParseError("Expected '..' for range", self.current_token)
 
-        node.add_child(self.parse_expression())
-        return node
+        self.parse_expression()
+        return self.close()
 
     # Compound & Statements
+    # Produksi yang berisi statement lain (compound, case, if, while, for, repeat) berupa generator
+    # yang men-yield produksi anaknya (yield self.parse_statement), dijalankan lewat run_statements
     def parse_compound_statement(self):
-        node = ParseNode("<compound-statement>")
-        node.add_child(self.expect("KEYWORD", "mulai"))
-        node.add_child(self.parse_statement_list())
-        node.add_child(self.expect("KEYWORD", "selesai"))
-        return node
+        self.open(NodeKind.COMPOUND_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.MULAI)
+        yield self.parse_statement_list
+        self.consume(TokenKind.KEYWORD, Keyword.SELESAI)
+        return self.close()
 
     def parse_case_statement(self):
-        node = ParseNode("<case-statement>")
-        node.add_child(self.expect("KEYWORD", "kasus"))
-        node.add_child(self.parse_expression())
-        node.add_child(self.expect("KEYWORD", "dari"))
+        self.open(NodeKind.CASE_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.KASUS)
+        self.parse_expression()
+        self.consume(TokenKind.KEYWORD, Keyword.DARI)
 
-        case_list = ParseNode("<case-list>")
+        self.open(NodeKind.CASE_LIST)
 
         while True:
-            if (self.check("NUMBER") or self.check("CHAR_LITERAL") or self.check("STRING_LITERAL") or \
-                self.check("KEYWORD", "true") or self.check("KEYWORD", "false")):
-                case_list.add_child(self.expect(self.current_token.type))
+            if self.dispatch(self.CASE_LABEL_DISPATCH):
+                self.consume(self.current_token.kind)
             else:
                 raise ParseError("Expected constant in 'kasus' statement", self.current_token)
 
-            if self.check("COMMA"):
-                self.expect("COMMA")
+            if self.check(TokenKind.COMMA):
+                self.expect(TokenKind.COMMA)
             else:
-                case_list.add_child(self.expect("COLON"))
-                case_list.add_child(self.parse_statement())
+                self.consume(TokenKind.COLON)
+                yield self.parse_statement
 
-                if self.check("SEMICOLON"):
-                    case_list.add_child(self.expect("SEMICOLON"))
-                    if not (self.check("NUMBER") or self.check("CHAR_LITERAL") or self.check("STRING_LITERAL") or \
-                            self.check("KEYWORD", "true") or self.check("KEYWORD", "false")):
+                if self.check(TokenKind.SEMICOLON):
+                    self.consume(TokenKind.SEMICOLON)
+                    if not self.dispatch(self.CASE_LABEL_DISPATCH):
                         break
                 else:
                     break
 
-        node.add_child(case_list)
-        return node
+        self.close()
+        return self.close()
 
     def parse_statement_list(self):
         '''List of statements parser'''
-        node = ParseNode("<statement-list>")
-        node.add_child(self.parse_statement())
+        self.open(NodeKind.STATEMENT_LIST)
+        yield self.parse_statement
 
-        while self.check("SEMICOLON"):
-            node.add_child(self.expect("SEMICOLON"))
-            if self.check("KEYWORD", "selesai"):
+        while self.check(TokenKind.SEMICOLON):
+            self.consume(TokenKind.SEMICOLON)
+            if self.check(TokenKind.KEYWORD, Keyword.SELESAI):
                 break
-            node.add_child(self.parse_statement())
-        return node
+            yield self.parse_statement
+        return self.close()
 
     def parse_statement(self):
-        '''Indivdual statement parser'''
-        # Statement kosong
-        if self.check("SEMICOLON") or self.check("KEYWORD", "selesai"):
-            return ParseNode("<empty-statement>")
-        # If statement
-        if self.check("KEYWORD", "jika"):
-            return self.parse_if_statement()
-        # While statement
-        if self.check("KEYWORD", "selama"):
-            return self.parse_while_statement()
-        # For statement
-        if self.check("KEYWORD", "untuk"):
-            return self.parse_for_statement()
-        # Repeat statement
-        if self.check("KEYWORD", "ulangi"):
-            return self.parse_repeat_statement()
-        # Compound statement
-        if self.check("KEYWORD", "mulai"):
-            return self.parse_compound_statement()
-        # Case statement
-        if self.check("KEYWORD", "kasus"):
-            return self.parse_case_statement()
-        # Caller / Assignment statement
-        if self.check("IDENTIFIER"):
-            next_token = self.peek()
-            if next_token and next_token.type == "LPARENTHESIS":
-                return self.parse_procedure_function_call()
-            else:
-                return self.parse_assignment_statement()
-        # Built-in procedure/function
-        if self.check("KEYWORD") and self.peek() and self.peek().type == "LPARENTHESIS":
+        '''Indivdual statement parser, produksi dipilih dari FIRST set token sekarang'''
+        handler = self.dispatch(self.STATEMENT_DISPATCH)
+        if handler is None:
+            raise ParseError(f"Unexpected token in statement", self.current_token)
+        return handler(self)
+
+    def run_statements(self, production):
+        '''Jalankan produksi statement lewat run_traversal: frame generator di stack eksplisit, bukan
+        call stack Python (seperti parse_expression_tree), jadi jika/selama/mulai bersarang sedalam
+        apapun ga kena RecursionError'''
+        return run_traversal(production, lambda parse: parse())
+
+    def parse_empty_statement(self):
+        '''Statement kosong (sebelum ";" atau "selesai"), ga consume token'''
+        self.open(NodeKind.EMPTY_STATEMENT)
+        return self.close()
+
+    def parse_identifier_statement(self):
+        '''Caller / Assignment statement'''
+        next_token = self.peek()
+        if next_token and next_token.kind == TokenKind.LPARENTHESIS:
             return self.parse_procedure_function_call()
+        return self.parse_assignment_statement()
 
+    def parse_builtin_call_statement(self):
+        '''Built-in procedure/function'''
+        next_token = self.peek()
+        if next_token and next_token.kind == TokenKind.LPARENTHESIS:
+            return self.parse_procedure_function_call()
         raise ParseError(f"Unexpected token in statement", self.current_token)
 
     # Specific statement
     def parse_assignment_statement(self):
         '''Assignment statement parser'''
-        node = ParseNode("<assignment-statement>")
-        node.add_child(self.parse_variable())
-        node.add_child(self.expect("ASSIGN_OPERATOR"))
-        node.add_child(self.parse_expression())
-        return node
+        self.open(NodeKind.ASSIGNMENT_STATEMENT)
+        self.parse_variable()
+        self.consume(TokenKind.ASSIGN_OPERATOR)
+        self.parse_expression()
+        return self.close()
 
     def parse_if_statement(self):
-        node = ParseNode("<if-statement>")
-        node.add_child(self.expect("KEYWORD", "jika"))
-        node.add_child(self.parse_expression())
-        node.add_child(self.expect("KEYWORD", "maka"))
-        node.add_child(self.parse_statement())
+        self.open(NodeKind.IF_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.JIKA)
+        self.parse_expression()
+        self.consume(TokenKind.KEYWORD, Keyword.MAKA)
+        yield self.parse_statement
 
 		# parse else
-        if self.check("KEYWORD", "selain_itu") or self.check("KEYWORD", "selain-itu"):
-            node.add_child(self.expect("KEYWORD"))
-            node.add_child(self.parse_statement())
-        return node
+        if self.check(TokenKind.KEYWORD, Keyword.SELAIN_ITU):
+            self.consume(TokenKind.KEYWORD)
+            yield self.parse_statement
+        return self.close()
 
     def parse_while_statement(self):
-        node = ParseNode("<while-statement>")
-        node.add_child(self.expect("KEYWORD", "selama"))
-        node.add_child(self.parse_expression())
-        node.add_child(self.expect("KEYWORD", "lakukan"))
-        node.add_child(self.parse_statement())
-        return node
+        self.open(NodeKind.WHILE_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.SELAMA)
+        self.parse_expression()
+        self.consume(TokenKind.KEYWORD, Keyword.LAKUKAN)
+        yield self.parse_statement
+        return self.close()
 
     def parse_for_statement(self):
-        node = ParseNode("<for-statement>")
-        node.add_child(self.expect("KEYWORD", "untuk"))
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("ASSIGN_OPERATOR"))
-        node.add_child(self.parse_expression())
-
-        if self.check("KEYWORD", "ke"):
-            node.add_child(self.expect("KEYWORD", "ke"))
-        elif self.check("KEYWORD", "turun_ke"):
-            node.add_child(self.expect("KEYWORD", "turun_ke"))
+        self.open(NodeKind.FOR_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.UNTUK)
+        self.consume(TokenKind.IDENTIFIER)
+        self.consume(TokenKind.ASSIGN_OPERATOR)
+        self.parse_expression()
+
+        if self.check(TokenKind.KEYWORD, Keyword.KE):
+            self.consume(TokenKind.KEYWORD, Keyword.KE)
+        elif self.check(TokenKind.KEYWORD, Keyword.TURUN_KE):
+            self.consume(TokenKind.KEYWORD, Keyword.TURUN_KE)
         else:
             raise ParseError("Expected 'ke' or 'turun_ke' in for-statement", self.current_token)
 
-        node.add_child(self.parse_expression())
-        node.add_child(self.expect("KEYWORD", "lakukan"))
-        node.add_child(self.parse_statement())
-        return node
+        self.parse_expression()
+        self.consume(TokenKind.KEYWORD, Keyword.LAKUKAN)
+        yield self.parse_statement
+        return self.close()
 
     def parse_repeat_statement(self):
-        node = ParseNode("<repeat-statement>")
-        node.add_child(self.expect("KEYWORD", "ulangi"))
-        stmt_list_node = ParseNode("<statement-list>")
-        stmt_list_node.add_child(self.parse_statement())
-
-        while self.check("SEMICOLON"):
-            stmt_list_node.add_child(self.expect("SEMICOLON"))
-            if self.check("KEYWORD", "sampai"):
+        self.open(NodeKind.REPEAT_STATEMENT)
+        self.consume(TokenKind.KEYWORD, Keyword.ULANGI)
+        self.open(NodeKind.STATEMENT_LIST)
+        yield self.parse_statement
+
+        while self.check(TokenKind.SEMICOLON):
+            self.consume(TokenKind.SEMICOLON)
+            if self.check(TokenKind.KEYWORD, Keyword.SAMPAI):
                 break
-            stmt_list_node.add_child(self.parse_statement())
+            yield self.parse_statement
 
-        node.add_child(stmt_list_node)
-        node.add_child(self.expect("KEYWORD", "sampai"))
-        node.add_child(self.parse_expression())
-        return node
+        self.close()
+        self.consume(TokenKind.KEYWORD, Keyword.SAMPAI)
+        self.parse_expression()
+        return self.close()
 
     def parse_procedure_function_call(self):
         '''Procedure/function call parser: name(args), name bisa identifier atau builtin keyword'''
-        node = ParseNode("<procedure/function-call>")
-
-        if self.check("IDENTIFIER"):
-            node.add_child(self.expect("IDENTIFIER"))
-        elif self.check("KEYWORD"):
-            node.add_child(self.expect("KEYWORD"))
-        else:
-            raise ParseError(f"Expected procedure/function name", self.current_token)
-
-        if not self.check("LPARENTHESIS"):
-            raise ParseError("Expected '(' after procedure/function name", self.current_token)
-
-        # Parse parameter list (kalo ada args)
-        node.add_child(self.expect("LPARENTHESIS"))
-        if not self.check("RPARENTHESIS"):
-            node.add_child(self.parse_parameter_list())
-        node.add_child(self.expect("RPARENTHESIS"))
-
-        return node
-
-    # Parameters
-    def parse_parameter_list(self):
-        node = ParseNode("<parameter-list>")
-        node.add_child(self.parse_expression())
-
-        while self.check("COMMA"):
-            node.add_child(self.expect("COMMA"))
-            node.add_child(self.parse_expression())
-        return node
+        return self.parse_expression_tree(NodeKind.PROCEDURE_FUNCTION_CALL)
 
     # Expressions
     def parse_expression(self):
         '''Expression parser'''
-        node = ParseNode("<expression>")
-
-        node.add_child(self.parse_simple_expression())
-
-        if self.is_relational_operator():
-            node.add_child(self.parse_relational_operator())
-            node.add_child(self.parse_simple_expression())
-        return node
-
-    def parse_simple_expression(self):
-        '''parse simple expression'''
-        node = ParseNode("<simple-expression>")
-
-
-        if self.check("ARITHMETIC_OPERATOR") and (self.current_token.value == "+" or self.current_token.value == "-"):
-            node.add_child(self.expect("ARITHMETIC_OPERATOR"))
-
-        node.add_child(self.parse_term())
-
-        while self.is_additive_operator():
-            node.add_child(self.parse_additive_operator())
-            node.add_child(self.parse_term())
-
-        return node
-
-    def parse_term(self):
-        '''Multiplicatio operations chain (* / mod dan)'''
-        node = ParseNode("<term>")
-
-        node.add_child(self.parse_factor())
-
-        while self.is_multiplicative_operator():
-            node.add_child(self.parse_multiplicative_operator())
-            node.add_child(self.parse_factor())
-        return node
+        return self.parse_expression_tree(NodeKind.EXPRESSION)
 
     def parse_factor(self):
         '''parse factor'''
-        node = ParseNode("<factor>")
-
-        # Number literal
-        if self.check("NUMBER"):
-            node.add_child(self.expect("NUMBER"))
-
-        # String literal
-        elif self.check("STRING_LITERAL"):
-            node.add_child(self.expect("STRING_LITERAL"))
-
-        # Character literal
-        elif self.check("CHAR_LITERAL"):
-            node.add_child(self.expect("CHAR_LITERAL"))
-
-        # Boolean literal (true/false)
-        elif self.check("KEYWORD", "true") or self.check("KEYWORD", "false"):
-            node.add_child(self.expect("KEYWORD"))
-
-        # NOT operator
-        elif self.check("LOGICAL_OPERATOR", "tidak") or self.check("KEYWORD", "tidak"):
-            if self.check("LOGICAL_OPERATOR"):
-                node.add_child(self.expect("LOGICAL_OPERATOR"))
-            else:
-                node.add_child(self.expect("KEYWORD"))
-            node.add_child(self.parse_factor())
-
-        # Ekspresi dalam tanda kurung
-        elif self.check("LPARENTHESIS"):
-            node.add_child(self.expect("LPARENTHESIS"))
-            node.add_child(self.parse_expression())
-            node.add_child(self.expect("RPARENTHESIS"))
-
-        # Identifier (variable atau function/procedure call)
-        elif self.check("IDENTIFIER"):
-            next_token = self.peek()
-
-            if next_token and next_token.type == "LPARENTHESIS":
-                node.add_child(self.parse_procedure_function_call())
-            else:
-                node.add_child(self.parse_variable())
+        return self.parse_expression_tree(NodeKind.FACTOR)
+
+    def parse_expression_tree(self, root):
+        '''Precedence climbing dengan stack eksplisit (tanpa rekursi), event ke builder tetap bentuk CST grammar:
+        <expression> -> <simple-expression> [relop <simple-expression>]
+        <simple-expression> -> [sign] <term> {addop <term>}
+        <term> -> <factor> {mulop <factor>}
+
+        root = NodeKind.EXPRESSION, atau FACTOR/VARIABLE/PROCEDURE_FUNCTION_CALL yang cuma parse satu operand.
+        Node yang sedang terbuka ada di builder; kurung, argumen call, dan index array yang membuka
+        expression baru cuma menyimpan state level luar (sudah ada relop?, jumlah "tidak" yang belum
+        ditutup) di stack, jadi nesting sedalam apapun ga kena RecursionError.
+        '''
+        stack = []
+        value = None
+        relational = False
+        nots = 0  # <factor> "tidak" yang terbuka di depan operand sekarang
+
+        self.open(root)
+        if root == NodeKind.EXPRESSION:
+            self.open_simple_expression()
+            state = _OPERAND
+        elif root == NodeKind.VARIABLE:
+            self.consume(TokenKind.IDENTIFIER)
+            state = _VARIABLE
+        elif root == NodeKind.PROCEDURE_FUNCTION_CALL:
+            state = _CALL
         else:
-            raise ParseError(f"Unexpected token in factor", self.current_token)
-
-        return node
+            state = _OPERAND
 
+        while True:
+            if state == _OPERAND:
+                operand = self.dispatch(self.FACTOR_DISPATCH)
+                if operand is None:
+                    raise ParseError(f"Unexpected token in factor", self.current_token)
+
+                # Number, string, character, atau boolean literal
+                if operand == _LITERAL:
+                    self.consume(self.current_token.kind)
+                    state = _OPERATOR
+
+                # NOT operator: factor -> tidak <factor>
+                elif operand == _NOT:
+                    self.consume(self.current_token.kind)
+                    self.open(NodeKind.FACTOR)
+                    nots += 1
+
+                # Ekspresi dalam tanda kurung
+                elif operand == _PARENTHESIZED:
+                    self.consume(TokenKind.LPARENTHESIS)
+                    stack.append((_CLOSE_PAREN, relational, nots))
+                    relational, nots = False, 0
+                    self.open(NodeKind.EXPRESSION)
+                    self.open_simple_expression()
+
+                # Identifier (variable atau function/procedure call)
+                else:
+                    next_token = self.peek()
+                    if next_token and next_token.kind == TokenKind.LPARENTHESIS:
+                        self.open(NodeKind.PROCEDURE_FUNCTION_CALL)
+                        state = _CALL
+                    else:
+                        self.open(NodeKind.VARIABLE)
+                        self.consume(TokenKind.IDENTIFIER)
+                        state = _VARIABLE
+
+            elif state == _OPERATOR:
+                # Operand selesai: tutup <factor> "tidak" di depannya
+                while nots:
+                    self.close()
+                    nots -= 1
+                if not stack and root != NodeKind.EXPRESSION:
+                    # Root cuma satu operand
+                    return self.close() if root == NodeKind.FACTOR else value
+
+                token = self.current_token
+                level = BINARY_OPERATORS.get((token.kind, token.keyword)) if token else None
+                if level == _MULTIPLICATIVE:
+                    self.close()
+                    self.advance()
+                    self.emit(token, self.pos - 1)
+                    self.open(NodeKind.FACTOR)
+                    state = _OPERAND
+                elif level == _ADDITIVE:
+                    self.close()
+                    self.close()
+                    self.advance()
+                    self.emit(token, self.pos - 1)
+                    self.open(NodeKind.TERM)
+                    self.open(NodeKind.FACTOR)
+                    state = _OPERAND
+                elif level == _RELATIONAL and not relational:
+                    self.close()
+                    self.close()
+                    self.close()
+                    self.advance()
+                    self.emit(token, self.pos - 1)
+                    relational = True
+                    self.open_simple_expression()
+                    state = _OPERAND
+                else:
+                    # <factor> <term> <simple-expression> <expression> selesai
+                    self.close()
+                    self.close()
+                    self.close()
+                    value = self.close()
+                    if not stack:
+                        return value
+
+                    # Expression di dalam kurung/argumen/index selesai, lanjut ke level luar
+                    closing, relational, nots = stack.pop()
+                    if closing == _CLOSE_PAREN:
+                        self.consume(TokenKind.RPARENTHESIS)
+                    elif closing == _NEXT_ARGUMENT:
+                        if self.check(TokenKind.COMMA):
+                            self.consume(TokenKind.COMMA)
+                            stack.append((closing, relational, nots))
+                            relational, nots = False, 0
+                            self.open(NodeKind.EXPRESSION)
+                            self.open_simple_expression()
+                            state = _OPERAND
+                        else:
+                            self.close()
+                            self.consume(TokenKind.RPARENTHESIS)
+                            value = self.close()
+                    else:
+                        self.consume(TokenKind.RBRACKET)
+                        self.close()
+                        state = _VARIABLE
+
+            elif state == _VARIABLE:
+                # dot chaining + indexing
+                if self.check(TokenKind.DOT):
+                    self.consume(TokenKind.DOT)
+                    self.consume(TokenKind.IDENTIFIER)
+                elif self.check(TokenKind.LBRACKET):
+                    self.open(NodeKind.VARIABLE_INDEX)
+                    self.consume(TokenKind.LBRACKET)
+                    stack.append((_CLOSE_INDEX, relational, nots))
+                    relational, nots = False, 0
+                    self.open(NodeKind.EXPRESSION)
+                    self.open_simple_expression()
+                    state = _OPERAND
+                else:
+                    value = self.close()
+                    state = _OPERATOR
 
-    # Operators
-    def parse_relational_operator(self):
-        if self.check("RELATIONAL_OPERATOR"):
-            return self.expect("RELATIONAL_OPERATOR")
-        else:
-            raise ParseError(f"Expected relational operator", self.current_token)
+            else:
+                # Call: name bisa identifier atau builtin keyword
+                if self.check(TokenKind.IDENTIFIER):
+                    self.consume(TokenKind.IDENTIFIER)
+                elif self.check(TokenKind.KEYWORD):
+                    self.consume(TokenKind.KEYWORD)
+                else:
+                    raise ParseError(f"Expected procedure/function name", self.current_token)
 
-    def parse_additive_operator(self):
-        if self.check("ARITHMETIC_OPERATOR"):
-            return self.expect("ARITHMETIC_OPERATOR")
-        elif self.check("LOGICAL_OPERATOR", "atau"):
-            return self.expect("LOGICAL_OPERATOR")
-        else:
-            raise ParseError(f"Expected additive operator", self.current_token)
+                if not self.check(TokenKind.LPARENTHESIS):
+                    raise ParseError("Expected '(' after procedure/function name", self.current_token)
 
-    def parse_multiplicative_operator(self):
-        if self.check("ARITHMETIC_OPERATOR"):
-            return self.expect("ARITHMETIC_OPERATOR")
-        elif self.check("LOGICAL_OPERATOR","dan"):
-            return self.expect("LOGICAL_OPERATOR","dan")
-        else:
-            raise ParseError(f"Expected multiplicative operator", self.current_token)
+                # Parse parameter list (kalo ada args)
+                self.consume(TokenKind.LPARENTHESIS)
+                if self.check(TokenKind.RPARENTHESIS):
+                    self.consume(TokenKind.RPARENTHESIS)
+                    value = self.close()
+                    state = _OPERATOR
+                else:
+                    self.open(NodeKind.PARAMETER_LIST)
+                    stack.append((_NEXT_ARGUMENT, relational, nots))
+                    relational, nots = False, 0
+                    self.open(NodeKind.EXPRESSION)
+                    self.open_simple_expression()
+                    state = _OPERAND
+
+    def open_simple_expression(self):
+        '''Buka <simple-expression> [sign] <term> <factor> baru di expression yang sedang terbuka'''
+        self.open(NodeKind.SIMPLE_EXPRESSION)
+        if self.check(TokenKind.ARITHMETIC_OPERATOR) and self.current_token.keyword in ADDITIVE_KEYWORDS:
+            self.consume(TokenKind.ARITHMETIC_OPERATOR)
+        self.open(NodeKind.TERM)
+        self.open(NodeKind.FACTOR)
 
     # Helper function
 
-    def is_relational_operator(self):
-        if self.current_token is None:
-            return False
-        return self.check("RELATIONAL_OPERATOR") and self.current_token.value in ["<", ">", "<=", ">=", "=", "<>"]
-
-    def is_additive_operator(self):
-        if self.current_token is None:
-            return False
-        return (self.check("ARITHMETIC_OPERATOR") and self.current_token.value in ["+", "-"]) or self.check("LOGICAL_OPERATOR", "atau")
-
-    def is_multiplicative_operator(self):
-        if self.current_token is None:
-            return False
-        return (self.check("ARITHMETIC_OPERATOR") and self.current_token.value in ["*", "/","bagi","mod"]) or \
-            self.check("LOGICAL_OPERATOR","dan")
-
     def lookahead_is_range(self):
         ''' detect range-type pattern <expr> .. <expr>, cuman dalem type-definition'''
 
@@ -678,7 +783,36 @@ class Parser:
             return False
 
         # hanya allowed: NUMBER, IDENTIFIER, LPAREN
-        if t1.type not in ("NUMBER", "IDENTIFIER", "LPARENTHESIS"):
+        if t1.kind not in (TokenKind.NUMBER, TokenKind.IDENTIFIER, TokenKind.LPARENTHESIS):
             return False
 
-        return t2.type == "RANGE_OPERATOR"
+        return t2.kind == TokenKind.RANGE_OPERATOR
+
+    # ========= Dispatch tables (FIRST set -> produksi) =========
+    STATEMENT_DISPATCH = build_dispatch(STATEMENT_FIRST, {
+        "<empty-statement>": parse_empty_statement,
+        "<if-statement>": parse_if_statement,
+        "<while-statement>": parse_while_statement,
+        "<for-statement>": parse_for_statement,
+        "<repeat-statement>": parse_repeat_statement,
+        "<compound-statement>": parse_compound_statement,
+        "<case-statement>": parse_case_statement,
+        "<identifier-statement>": parse_identifier_statement,
+        "<builtin-call>": parse_builtin_call_statement,
+    })
+
+    FACTOR_DISPATCH = build_dispatch(FACTOR_FIRST, {
+        "<literal>": _LITERAL,
+        "<not>": _NOT,
+        "<parenthesized>": _PARENTHESIZED,
+        "<identifier>": _IDENTIFIER,
+    })
+
+    TYPE_DISPATCH = build_dispatch(TYPE_FIRST, {
+        "<array-type>": parse_array_type,
+        "<record-type>": parse_record_type,
+        "<builtin-type>": parse_builtin_type,
+        "<custom-type>": parse_custom_type,
+    })
+
+    CASE_LABEL_DISPATCH = dict.fromkeys(LITERAL_FIRST | BOOLEAN_FIRST, True)
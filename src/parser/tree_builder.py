@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.lexer.token import Token
+
+class TreeBuilder(ABC):
+    '''Hook yang dipanggil Parser selama descent, jadi grammar cuma ada di Parser dan bentuk
+    hasilnya (ParseNode, ParseTree arena, atau AST langsung) ditentukan builder.
+
+    Event selalu nested seperti bentuk CST:
+      open(kind)           produksi mulai, kind = NodeKind
+      token(token, index)  terminal masuk ke produksi yang terbuka, index = posisi token di stream input
+      close()              produksi terakhir yang terbuka selesai, return nilai node tsb
+      result()             nilai root setelah parse selesai
+
+    Keempat method abstract: builder yang lupa salah satunya gagal waktu dibuat, bukan di tengah parse.
+    '''
+    @abstractmethod
+    def open(self, kind: int):
+        raise NotImplementedError
+
+    @abstractmethod
+    def token(self, token: Token, index: int):
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def result(self) -> Any:
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 from .nodes import *
 from src.lexer.token import Token
 from src.parser.parse_node import ParseNode
+from ..traversal import run_traversal
 
 class ASTError(Exception):
     def __init__(self, message, node=None):
@@ -18,43 +19,34 @@ class ASTBuilder:
     # Controller SDT
     # ---------------------------
     def build_node(self, node):
+        # builder yang butuh atribut child men-yield child-nya (x = yield child), lihat run_traversal
+        return run_traversal(node, self._build_step)
+
+    def _build_step(self, node):
         if isinstance(node, Token):
             return self.build_token(node)
         elif isinstance(node, ParseNode):
-            controller_map = {
-                "<program>": self.build_program_node,
-                "<program-header>": lambda n: None,
-                "<declaration-part>": self.build_declarations_node,
-                "<const-declaration>": self.build_const_decl_node,
-                "<var-declaration>": self.build_var_decl_node,
-                "<type-declaration>": self.build_type_declaration_node,
-                "<record-type>": self.build_record_type_node,
-                "<compound-statement>": self.build_block_node,
-                "<assignment-statement>": self.build_assign_node,
-                "<expression>": self.build_expression_node,
-                "<simple-expression>": self.build_simple_expression_node,
-                "<term>": self.build_term_node,
-                "<factor>": self.build_factor_node,
-                "<procedure-declaration>": self.build_procedure_decl_node,
-                "<function-declaration>": self.build_function_decl_node,
-                "<procedure/function-call>": self.build_procedure_function_call_node,
-                "<variable>": self.build_variable_node,
-                "<number>": self.build_number_node,
-                "<string-literal>": self.build_string_node,
-                "<if-statement>": self.build_if_node,
-                "<while-statement>": self.build_while_node,
-                "<for-statement>": self.build_for_node,
-                "<repeat-statement>": self.build_repeat_node,
-                "<case-statement>": self.build_case_node
-            }
-            builder = controller_map.get(node.type)
+            builder = self.CONTROLLERS.get(node.type)
             if builder:
-                return builder(node)
-            # fallback SDT: ambil atribut dari child
-            children_nodes = [self.build_node(c) for c in node.child if self.build_node(c)]
-            if len(children_nodes) == 1:
-                return children_nodes[0]
-            return BlockNode(children_nodes)
+                return builder(self, node)
+            return self.build_children(node)
+        return None
+
+    def build_children(self, node):
+        # fallback SDT: ambil atribut dari child (tiap child di-build sekali)
+        children_nodes = []
+        for child in node.child:
+            child_node = yield child
+            if child_node:
+                children_nodes.append(child_node)
+        if len(children_nodes) == 1:
+            return children_nodes[0]
+        return BlockNode(children_nodes)
+
+    def build_first(self, nodes):
+        # next((build(c) for c in nodes), None): cuma node pertama yang di-build
+        for node in nodes:
+            return (yield node)
         return None
 
     # ---------------------------
@@ -62,26 +54,32 @@ class ASTBuilder:
     # ---------------------------
     def build_token(self, token):
         if token.type == "NUMBER":
-            return NumNode(token.value)
+            return NumNode(token.value, token.literal)
         elif token.type in ["STRING_LITERAL", "CHAR_LITERAL"]:
-            return StringNode(token.value, is_char_literal=(token.type == "CHAR_LITERAL"))
+            return StringNode(token.value, is_char_literal=(token.type == "CHAR_LITERAL"), literal=token.literal)
         elif token.type == "IDENTIFIER":
             return VarNode(token.value)
         return None
 
     def build_number_node(self, node):
         token = next((t for t in node.child if isinstance(t, Token)), None)
-        return NumNode(token.value) if token else None
+        return NumNode(token.value, token.literal) if token else None
 
     def build_string_node(self, node):
         token = next((t for t in node.child if isinstance(t, Token)), None)
-        return StringNode(token.value, is_char_literal=(token.type == "CHAR_LITERAL")) if token else None
+        return StringNode(token.value, is_char_literal=(token.type == "CHAR_LITERAL"),
+                          literal=token.literal) if token else None
 
     def build_variable_node(self, node):
         base_token = next((t for t in node.child if isinstance(t, Token) and t.type == "IDENTIFIER"), None)
         if not base_token:
             return None
+        # tanpa field/index ga ada child yang perlu di-build, jadi ga perlu generator
+        if len(node.child) == 1:
+            return VarNode(base_token.value)
+        return self.build_variable_selectors(node, base_token)
 
+    def build_variable_selectors(self, node, base_token):
         current_node = VarNode(base_token.value)
         i = 0
         while i < len(node.child):
@@ -102,7 +100,7 @@ class ASTBuilder:
 
             # Array access -> [index]
             elif getattr(c, "type", None) == "<variable-index>":
-                expr_node = next((self.build_node(x) for x in c.child if getattr(x, "type", None) == "<expression>"), None)
+                expr_node = yield self.build_first(x for x in c.child if getattr(x, "type", None) == "<expression>")
                 if expr_node:
                     current_node = ArrayAccessNode(current_node, expr_node)
 
@@ -118,7 +116,7 @@ class ASTBuilder:
     def build_statement_list(self, nodes):
         statements = []
         for n in nodes:
-            node = self.build_node(n)
+            node = yield n
             if node:
                 if isinstance(node, BlockNode):
                     statements.extend(node.children)
@@ -140,17 +138,17 @@ class ASTBuilder:
                 if token:
                     prog_name = token.value
             elif c.type == "<declaration-part>":
-                decl_node = self.build_node(c)
+                decl_node = yield c
                 decls_attr = [decl_node] if decl_node else []
             elif c.type == "<compound-statement>":
-                block_attr = self.build_node(c)
+                block_attr = yield c
 
         return ProgramNode(prog_name, decls_attr, block_attr)
 
     def build_declarations_node(self, node):
         decls = []
         for c in node.child:
-            child_decl = self.build_node(c)
+            child_decl = yield c
             if child_decl:
                 if isinstance(child_decl, list):
                     decls.extend(child_decl)
@@ -172,7 +170,7 @@ class ASTBuilder:
                     j += 1
                 expr_node = None
                 if j < len(children) and children[j].type == "<expression>":
-                    expr_node = self.build_node(children[j])
+                    expr_node = yield children[j]
                 else:
                     expr_node = None
 
@@ -195,7 +193,7 @@ class ASTBuilder:
         type_nodes = [c for c in node.child if c.type == "<type>"]
 
         for id_node, type_node in zip(identifiers_nodes, type_nodes):
-            vartype = self.build_type_definition_node(type_node)
+            vartype = yield self.build_type_definition_node(type_node)
 
             for item in id_node.child:
                 if item.type == "IDENTIFIER":
@@ -216,30 +214,30 @@ class ASTBuilder:
         expr_nodes = [c for c in getattr(node, "child", []) if getattr(c, "type", None) == "<expression>"]
         range_op = next((c for c in getattr(node, "child", []) if isinstance(c, Token) and c.type == "RANGE_OPERATOR"), None)
         if len(expr_nodes) == 2 and range_op:
-            lower = self.build_node(expr_nodes[0])
-            upper = self.build_node(expr_nodes[1])
+            lower = yield expr_nodes[0]
+            upper = yield expr_nodes[1]
             return RangeTypeNode(lower, upper)
 
         # Tangani record / array / primitive seperti sebelumnya
         for c in getattr(node, "child", []):
             if getattr(c, "type", None) == "<record-type>":
-                return self.build_record_type_node(c)
+                return (yield self.build_record_type_node(c))
             if getattr(c, "type", None) == "<array-type>":
                 # sama seperti sebelumnya
                 bounds = []
                 range_node = next((x for x in c.child if getattr(x,"type",None)=="<range>"), None)
                 if range_node:
-                    lower = self.build_node(range_node.child[0])
-                    upper = self.build_node(range_node.child[2])
+                    lower = yield range_node.child[0]
+                    upper = yield range_node.child[2]
 
                     bounds.append((lower, upper))
                 base_type_node = next((x for x in c.child if getattr(x,"type",None)=="<type>"), None)
-                base_type = self.build_type_definition_node(base_type_node) if base_type_node else None
+                base_type = (yield self.build_type_definition_node(base_type_node)) if base_type_node else None
                 return ArrayTypeNode(base_type, bounds)
             if isinstance(c, Token) and c.type in ("IDENTIFIER","KEYWORD"):
                 return c.value
             # rekursif
-            res = self.build_type_definition_node(c)
+            res = yield self.build_type_definition_node(c)
             if res:
                 return res
 
@@ -255,7 +253,7 @@ class ASTBuilder:
                 identifier = node.child[i].value
                 if node.child[i+1].type == "RELATIONAL_OPERATOR" and node.child[i+1].value == "=":
                     type_def_node = node.child[i+2]
-                    type_def = self.build_type_definition_node(type_def_node)
+                    type_def = yield self.build_type_definition_node(type_def_node)
                     type_decl = TypeDeclarationNode(identifier, type_def)
                     type_decls.append(type_decl)
                     self.type_table[identifier] = type_def  # simpan di type table
@@ -274,7 +272,7 @@ class ASTBuilder:
                 ids = [t.value for t in getattr(id_list_node, "child", []) if isinstance(t, Token) and t.type == "IDENTIFIER"] if id_list_node else []
 
                 type_node = next((c for c in group.child if c.type == "<type>"), None)
-                field_type = self.build_type_definition_node(type_node) if type_node else None
+                field_type = (yield self.build_type_definition_node(type_node)) if type_node else None
 
                 for name in ids:
                     fields.append(RecordFieldNode(name, field_type))
@@ -285,7 +283,7 @@ class ASTBuilder:
         statements_nodes = [c for c in node.child if c.type not in ("KEYWORD",)]
         statements = []
         for statement in statements_nodes:
-            statement_node = self.build_node(statement)
+            statement_node = yield statement
             if isinstance(statement_node, BlockNode):
                 statements.extend(statement_node.children)
             elif statement_node:
@@ -302,7 +300,7 @@ class ASTBuilder:
         while i < len(node.child):
             c = node.child[i]
             if c.type == "<variable-index>":
-                expr_node = next((self.build_node(x) for x in c.child if x.type == "<expression>"), None)
+                expr_node = yield self.build_first(x for x in c.child if x.type == "<expression>")
                 current_node = ArrayAccessNode(current_node, expr_node)
             elif isinstance(c, Token) and c.type == "DOT":
                 i += 1
@@ -317,8 +315,8 @@ class ASTBuilder:
     # Assignment
     # ---------------------------
     def build_assign_node(self, node):
-        target_node = next((self.build_node(c) for c in node.child if c.type == "<variable>"), None)
-        value_node = next((self.build_node(c) for c in node.child if c.type == "<expression>"), None)
+        target_node = yield self.build_first(c for c in node.child if c.type == "<variable>")
+        value_node = yield self.build_first(c for c in node.child if c.type == "<expression>")
         if not target_node or not value_node:
             raise ASTError("Assignment statement incomplete", node)
         return AssignNode(target_node, value_node)
@@ -327,7 +325,10 @@ class ASTBuilder:
     # Expressions (SDT)
     # ---------------------------
     def build_expression_node(self, node):
-        simple_exprs = [self.build_simple_expression_node(c) for c in node.child if c.type == "<simple-expression>"]
+        simple_exprs = []
+        for c in node.child:
+            if c.type == "<simple-expression>":
+                simple_exprs.append((yield self.build_simple_expression_node(c)))
         ops = [c for c in node.child if isinstance(c, Token) and c.type in ("ARITHMETIC_OPERATOR", "RELATIONAL_OPERATOR")]
 
         if len(simple_exprs) == 2 and ops:
@@ -338,7 +339,10 @@ class ASTBuilder:
 
     def build_simple_expression_node(self, node):
         # 1. Ambil semua term dan operator
-        terms = [self.build_term_node(c) for c in node.child if c.type == "<term>"]
+        terms = []
+        for c in node.child:
+            if c.type == "<term>":
+                terms.append((yield self.build_term_node(c)))
         ops = [c for c in node.child if isinstance(c, Token) and c.type == "ARITHMETIC_OPERATOR"]
 
         if not terms:
@@ -384,7 +388,10 @@ class ASTBuilder:
         return current
 
     def build_term_node(self, node):
-        factors = [self.build_factor_node(c) for c in node.child if c.type == "<factor>"]
+        factors = []
+        for c in node.child:
+            if c.type == "<factor>":
+                factors.append((yield self.build_factor_node(c)))
         ops = [c for c in node.child if isinstance(c, Token) and c.type == "ARITHMETIC_OPERATOR"]
         if not ops:
             return factors[0] if factors else None
@@ -394,9 +401,17 @@ class ASTBuilder:
         return current
 
     def build_factor_node(self, node):
+        # Satu child (<variable>, call, angka, string): langsung fallback, ga perlu scan child
+        if len(node.child) == 1:
+            child = node.child[0]
+            if not isinstance(child, Token):
+                return (yield child)
+            if child.type in ("NUMBER", "STRING_LITERAL", "CHAR_LITERAL", "IDENTIFIER"):
+                return self.build_token(child)
+
         # Unary tidak
         if any(getattr(c, "value", "").lower() == "tidak" for c in node.child):
-            factor = next((self.build_factor_node(c) for c in node.child if getattr(c, "value", "").lower() != "tidak"), None)
+            factor = yield self.build_first(self.build_factor_node(c) for c in node.child if getattr(c, "value", "").lower() != "tidak")
             return UnaryOpNode("tidak", factor)
 
         # Boolean literal
@@ -407,19 +422,22 @@ class ASTBuilder:
         # Jika ada logical operator (dan/or)
         logical_ops = [t for t in node.child if isinstance(t, Token) and t.type == "LOGICAL_OPERATOR"]
         if logical_ops:
-            left = self.build_factor_node(node.child[0])
+            left = yield self.build_factor_node(node.child[0])
             for i, op in enumerate(logical_ops):
-                right = self.build_factor_node(node.child[i+1])
+                right = yield self.build_factor_node(node.child[i+1])
                 left = BinOpNode(left, op.value.lower(), right)
             return left
 
         # Parentheses
         if any(c.type == "LPARENTHESIS" for c in node.child):
-            expr = next((self.build_expression_node(c) for c in node.child if getattr(c,"type",None)=="<expression>"), None)
+            expr = yield self.build_first(self.build_expression_node(c) for c in node.child if getattr(c,"type",None)=="<expression>")
             return expr
 
-        # Default fallback
-        return self.build_node(node.child[0])
+        # Default fallback (token langsung di-build, ga perlu lewat stack)
+        child = node.child[0]
+        if isinstance(child, Token):
+            return self.build_token(child)
+        return (yield child)
 
     # ---------------------------
     # Function / Procedure
@@ -468,7 +486,7 @@ class ASTBuilder:
 
         # Block (isi prosedur)
         block_node = next((c for c in node.child if c.type in ("<block>", "<compound-statement>")), None)
-        block = self.build_node(block_node)
+        block = yield block_node
 
         return ProcedureDeclNode(name, params, block)
 
@@ -491,7 +509,7 @@ class ASTBuilder:
 
         # Function body (block)
         block_node = next((c for c in node.child if c.type in ("<block>", "<compound-statement>")), None)
-        block = self.build_node(block_node)
+        block = yield block_node
 
         return FunctionDeclNode(name, params, return_type, block)
 
@@ -504,7 +522,7 @@ class ASTBuilder:
         args = []
         if param_list_node:
             for expr_node in param_list_node.child:
-                built_expr = self.build_node(expr_node)
+                built_expr = yield expr_node
                 if built_expr:
                     args.append(built_expr)
 
@@ -520,7 +538,7 @@ class ASTBuilder:
         idx_selain_itu = next((i for i, c in enumerate(node.child) if c.type == 'KEYWORD' and c.value.lower() == 'selain_itu'), None)
 
         expr_node = next(c for c in node.child[idx_jika + 1: idx_maka] if c.type == "<expression>")
-        condition = self.build_node(expr_node)
+        condition = yield expr_node
 
         if idx_selain_itu:
             then_nodes = node.child[idx_maka + 1: idx_selain_itu]
@@ -529,13 +547,13 @@ class ASTBuilder:
             then_nodes = node.child[idx_maka + 1:]
             else_nodes = []
 
-        then_body = self.build_statement_list(then_nodes)
-        else_body = self.build_statement_list(else_nodes) if else_nodes else None
+        then_body = yield self.build_statement_list(then_nodes)
+        else_body = (yield self.build_statement_list(else_nodes)) if else_nodes else None
 
         return IfNode(condition=condition, then_block=then_body, else_block=else_body)
 
     def build_case_node(self, node):
-        expr_node = next((self.build_node(c) for c in node.child if getattr(c,"type",None)=="<expression>"), None)
+        expr_node = yield self.build_first(c for c in node.child if getattr(c,"type",None)=="<expression>")
 
         case_list_node = next((c for c in node.child if getattr(c,"type",None)=="<case-list>"), None)
         branches = []
@@ -546,7 +564,7 @@ class ASTBuilder:
             while i < len(children):
                 # ambil value case
                 value_token = children[i]
-                value_node = self.build_node(value_token) if hasattr(value_token, "type") else None
+                value_node = (yield value_token) if hasattr(value_token, "type") else None
                 i += 1
 
                 # skip COLON
@@ -559,7 +577,7 @@ class ASTBuilder:
                     stmt_nodes.append(children[i])
                     i += 1
 
-                stmt_node = self.build_statement_list(stmt_nodes)
+                stmt_node = yield self.build_statement_list(stmt_nodes)
                 branches.append(CaseBranchNode([value_node], stmt_node))
 
         return CaseNode(expr_node, branches)
@@ -571,38 +589,68 @@ class ASTBuilder:
         expr_node = next((c for c in node.child if c.type == "<expression>"), None)
         if not expr_node:
             raise ASTError("While statement missing condition", node)
-        condition = self.build_node(expr_node)
+        condition = yield expr_node
 
         body_candidates = [c for c in node.child if c.type not in ("KEYWORD", "<expression>")]
         if not body_candidates:
             raise ASTError("While statement missing body", node)
-        body = self.build_statement_list(body_candidates)
+        body = yield self.build_statement_list(body_candidates)
 
         return WhileNode(condition, body)
 
     def build_repeat_node(self, node):
-        body = next((self.build_node(c) for c in node.child if c.type == "<statement-list>"), None)
-        condition = next((self.build_node(c) for c in node.child if c.type in ("<expression>", "<factor>")), None)
+        body = yield self.build_first(c for c in node.child if c.type == "<statement-list>")
+        condition = yield self.build_first(c for c in node.child if c.type in ("<expression>", "<factor>"))
         if not body or not condition:
             raise ASTError("Repeat statement incomplete", node)
         return RepeatNode(body, condition)
 
     def build_for_node(self, node):
-        var_node = next((self.build_node(c) for c in node.child if c.type == "IDENTIFIER"), None)
-        start_expr = next((self.build_node(c) for c in node.child if c.type == "<expression>"), None)
+        var_node = yield self.build_first(c for c in node.child if c.type == "IDENTIFIER")
+        start_expr = yield self.build_first(c for c in node.child if c.type == "<expression>")
         direction_token = next((c for c in node.child if getattr(c, "value", "").lower() in ("ke", "turun_ke")), None)
         end_expr = None
         if direction_token:
             idx = node.child.index(direction_token)
             for c in node.child[idx+1:]:
                 if c.type == "<expression>":
-                    end_expr = self.build_node(c)
+                    end_expr = yield c
                     break
 
         lakukan_idx = next((i for i, c in enumerate(node.child) if getattr(c, "value", "").lower() == "lakukan"), None)
         body_nodes = node.child[lakukan_idx+1:] if lakukan_idx is not None else []
-        body_node = self.build_statement_list(body_nodes)
+        body_node = yield self.build_statement_list(body_nodes)
 
         direction = getattr(direction_token, "value", "ke").lower() if direction_token else "ke"
 
         return ForNode(var_node, start_expr, end_expr, direction, body_node)
+
+    # ---------------------------
+    # Controller SDT: tipe ParseNode -> builder, dibangun sekali per class
+    # ---------------------------
+    CONTROLLERS = {
+        "<program>": build_program_node,
+        "<program-header>": lambda self, node: None,
+        "<declaration-part>": build_declarations_node,
+        "<const-declaration>": build_const_decl_node,
+        "<var-declaration>": build_var_decl_node,
+        "<type-declaration>": build_type_declaration_node,
+        "<record-type>": build_record_type_node,
+        "<compound-statement>": build_block_node,
+        "<assignment-statement>": build_assign_node,
+        "<expression>": build_expression_node,
+        "<simple-expression>": build_simple_expression_node,
+        "<term>": build_term_node,
+        "<factor>": build_factor_node,
+        "<procedure-declaration>": build_procedure_decl_node,
+        "<function-declaration>": build_function_decl_node,
+        "<procedure/function-call>": build_procedure_function_call_node,
+        "<variable>": build_variable_node,
+        "<number>": build_number_node,
+        "<string-literal>": build_string_node,
+        "<if-statement>": build_if_node,
+        "<while-statement>": build_while_node,
+        "<for-statement>": build_for_node,
+        "<repeat-statement>": build_repeat_node,
+        "<case-statement>": build_case_node
+    }
@@ -1,8 +1,84 @@
+import io
+from collections.abc import MutableMapping
+from typing import Dict, Optional, Union
+
 from ..symbol.constants import TypeKind
+from .ast_printer import ASTPrinter
+
+# Tipe hasil dekorasi: TypeKind, 'predefined', atau dict info record dari symbol table
+DecoratedType = Union[int, str, dict]
+
+# Nama TypeKind di anotasi AST ("type:integer")
+TYPE_NAMES = {
+    TypeKind.NOTYPE: "void", TypeKind.INTEGER: "integer",
+    TypeKind.REAL: "real", TypeKind.BOOLEAN: "boolean",
+    TypeKind.CHAR: "char", TypeKind.STRING: "string",
+    TypeKind.ARRAY: "array", TypeKind.RECORD: "record",
+    "predefined": "predefined"
+}
+
+
+class NodeAttributes(MutableMapping):
+    '''View dict ke field dekorasi node, pengganti dict attr lama (node.attr['type'] = ...).
+    Key dipetakan ke field lewat DECORATIONS class node, field yang None dianggap key tidak ada.'''
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    def __getitem__(self, key):
+        field = self.node.DECORATIONS.get(key)
+        value = getattr(self.node, field) if field else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        field = self.node.DECORATIONS.get(key)
+        if field is None:
+            raise KeyError(f"'{key}' is not a decoration of {type(self.node).__name__}")
+        setattr(self.node, field, value)
+
+    def __delitem__(self, key):
+        self[key]  # KeyError kalau belum didekorasi
+        setattr(self.node, self.node.DECORATIONS[key], None)
+
+    def __iter__(self):
+        node = self.node
+        return (key for key, field in node.DECORATIONS.items() if getattr(node, field) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class ASTNode:
+    '''Node AST. Pakai __slots__ (tanpa __dict__ per node), hasil dekorasi semantic disimpan
+    di field bertipe, None = belum didekorasi'''
+    __slots__ = ("children", "type", "tab_index", "lev", "block_index")
+
+    # key attr lama -> nama field, subclass menambah dekorasi khusus node-nya
+    DECORATIONS: Dict[str, str] = {
+        "type": "type", "tab_index": "tab_index", "lev": "lev", "block_index": "block_index",
+    }
+
+    type: Optional[DecoratedType]
+    tab_index: Optional[int]
+    lev: Optional[int]
+    block_index: Optional[int]
+
     def __init__(self):
         self.children = []
-        self.attr = {}
+        self.type = None
+        self.tab_index = None
+        self.lev = None
+        self.block_index = None
+
+    @property
+    def attr(self) -> NodeAttributes:
+        return NodeAttributes(self)
 
     def add_child(self, child):
         self.children.append(child)
@@ -11,47 +87,25 @@ class ASTNode:
         return self._format_tree("", True)
 
     def _format_tree(self, prefix, is_last):
-        connector = "└─ " if is_last else "├─ "
-        annotation = self._get_annotation_str()
-
-        # Bersihkan repr dari newline
-        node_repr = repr(self).strip()
-        line = f"{prefix}{connector}{node_repr}{annotation}\n"
-
-        child_prefix = prefix + ("   " if is_last else "│  ")
-        valid_children = [c for c in self.children if c is not None]
-        count = len(valid_children)
-
-        for i, child in enumerate(valid_children):
-            if hasattr(child, '_format_tree'):
-                line += child._format_tree(child_prefix, i == count - 1)
-            else:
-                line += f"{child_prefix}{'└─ ' if i == count-1 else '├─ '}{str(child)}\n"
-        return line
+        out = io.StringIO()
+        ASTPrinter(out).print(self, prefix, is_last)
+        return out.getvalue()
 
     def _get_annotation_str(self):
         parts = []
-        type_map = {
-            TypeKind.NOTYPE: "void", TypeKind.INTEGER: "integer",
-            TypeKind.REAL: "real", TypeKind.BOOLEAN: "boolean",
-            TypeKind.CHAR: "char", TypeKind.STRING: "string",
-            TypeKind.ARRAY: "array", TypeKind.RECORD: "record",
-            "predefined": "predefined"
-        }
-
-        if self.attr.get('type') == 'predefined': parts.append("predefined")
+        if self.type == 'predefined': parts.append("predefined")
 
-        if 'tab_index' in self.attr and self.attr['tab_index'] is not None:
-            parts.append(f"tab_index:{self.attr['tab_index']}")
+        if self.tab_index is not None:
+            parts.append(f"tab_index:{self.tab_index}")
 
-        if 'block_index' in self.attr:
-            parts.append(f"block_index:{self.attr['block_index']}")
+        if self.block_index is not None:
+            parts.append(f"block_index:{self.block_index}")
 
-        if 'type' in self.attr and self.attr['type'] != 'predefined':
-            val = self.attr['type']
-            t_str = type_map.get(val, str(val)) if isinstance(val, int) else str(val)
+        if self.type is not None and self.type != 'predefined':
+            val = self.type
+            t_str = TYPE_NAMES.get(val, str(val)) if isinstance(val, int) else str(val)
             parts.append(f"type:{t_str}")
 
-        if 'lev' in self.attr: parts.append(f"lev:{self.attr['lev']}")
+        if self.lev is not None: parts.append(f"lev:{self.lev}")
 
         return " → " + ", ".join(parts) if parts else ""
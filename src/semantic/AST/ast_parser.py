@@ -0,0 +1,358 @@
+from .nodes import *
+from .ast_builder import ASTError
+from src.lexer.token import Token
+from src.lexer.token_kind import TokenKind
+from src.parser.node_kind import NodeKind
+from src.parser.parser import Parser
+from src.parser.tree_builder import TreeBuilder
+
+class ASTTreeBuilder(TreeBuilder):
+    '''Builder Parser yang langsung membangun AST sambil descent, tanpa parse tree (ParseNode) di tengah.
+
+    Tiap produksi di-reduce waktu close dari child-nya (token apa adanya, produksi sudah jadi nilai AST),
+    aturannya sama dengan ASTBuilder untuk node CST tsb, jadi hasilnya identik dengan
+    ASTBuilder(Parser(tokens).parse()).build(). Grammar tetap cuma ada di Parser.
+    '''
+    def __init__(self):
+        self.stack = []  # [kind, child...] tiap produksi yang sedang terbuka
+        self.root = None
+        self.type_table = {}
+        # ASTError ditunda sampai parsing selesai, ParseError tetap menang seperti di ASTBuilder
+        self.errors = []
+
+    def open(self, kind):
+        self.stack.append([kind])
+
+    def token(self, token, index):
+        self.stack[-1].append(token)
+
+    def close(self):
+        node = self.stack.pop()
+        kind = node[0]
+        if len(node) == 2 and kind in self.PASS_THROUGH and not isinstance(node[1], Token):
+            # <expression>/<simple-expression>/<term>/<factor> dengan satu operand = operand itu
+            value = node[1]
+        else:
+            value = self.REDUCERS[kind](self, node[1:])
+        if self.stack:
+            self.stack[-1].append(value)
+        else:
+            self.root = value
+        return value
+
+    def result(self):
+        if self.errors:
+            raise self.errors[0]
+        return self.root
+
+    # ========== Helper (aturan sama dengan ASTBuilder) ==========
+    def build_token(self, token):
+        '''Token terminal -> node (NUMBER, string/char literal, IDENTIFIER), selain itu None'''
+        kind = token.kind
+        if kind == TokenKind.NUMBER:
+            return NumNode(token.value, token.literal)
+        elif kind == TokenKind.STRING_LITERAL or kind == TokenKind.CHAR_LITERAL:
+            return StringNode(token.value, is_char_literal=(kind == TokenKind.CHAR_LITERAL), literal=token.literal)
+        elif kind == TokenKind.IDENTIFIER:
+            return VarNode(token.value)
+        return None
+
+    def collapse_block(self, children):
+        '''Fallback ASTBuilder.build_children: token & None dibuang, satu node -> node itu'''
+        nodes = [child for child in children if child and not isinstance(child, Token)]
+        if len(nodes) == 1:
+            return nodes[0]
+        return BlockNode(nodes)
+
+    def join_statements(self, nodes):
+        '''ASTBuilder.build_statement_list: BlockNode di-flatten, None kalau kosong'''
+        statements = []
+        for node in nodes:
+            if isinstance(node, BlockNode):
+                statements.extend(node.children)
+            elif node:
+                statements.append(node)
+        return BlockNode(statements) if len(statements) > 1 else (statements[0] if statements else None)
+
+    # ========== Program / Declarations / Block ==========
+    def reduce_program(self, children):
+        header, declarations, block, _ = children
+        return ProgramNode(header, [declarations] if declarations else [], block)
+
+    def reduce_program_header(self, children):
+        return children[1].value
+
+    def reduce_declaration_part(self, children):
+        declarations = []
+        for child in children:
+            if isinstance(child, list):
+                declarations.extend(child)
+            elif child:
+                declarations.append(child)
+        return DeclarationsNode(declarations)
+
+    def reduce_const_declaration(self, children):
+        # konstanta {IDENTIFIER = <expression> ;}
+        return [ConstDeclNode(children[i].value, children[i + 2]) for i in range(1, len(children), 4)]
+
+    def reduce_type_declaration(self, children):
+        # tipe {IDENTIFIER = <type-definition> ;}
+        type_decls = []
+        for i in range(1, len(children), 4):
+            name, type_def = children[i].value, children[i + 2]
+            type_decls.append(TypeDeclarationNode(name, type_def))
+            self.type_table[name] = type_def
+        return type_decls
+
+    def reduce_var_declaration(self, children):
+        # variabel {<identifier-list> : <type> ;}
+        return [VarDeclNode(name, children[i + 2]) for i in range(1, len(children), 4) for name in children[i]]
+
+    def reduce_procedure_declaration(self, children):
+        params = children[2] if isinstance(children[2], list) else []
+        return ProcedureDeclNode(children[1].value, params, children[-2])
+
+    def reduce_function_declaration(self, children):
+        params = children[2] if isinstance(children[2], list) else []
+        # return type cuma nama tipe (token), larik/rekaman -> None
+        return_type = children[-4]
+        return FunctionDeclNode(children[1].value, params, return_type if isinstance(return_type, str) else None,
+                                children[-2])
+
+    def reduce_formal_parameter_list(self, children):
+        params = []
+        for group in children:
+            if isinstance(group, tuple):
+                is_var, names, vartype = group
+                params.extend(ParamNode(name, vartype if isinstance(vartype, str) else None, is_var) for name in names)
+        return params
+
+    def reduce_parameter_group(self, children):
+        '''(is_var, nama-nama, tipe), dipakai formal parameter dan field rekaman'''
+        return len(children) == 4, children[-3], children[-1]
+
+    def reduce_identifier_list(self, children):
+        return [token.value for token in children if token.kind == TokenKind.IDENTIFIER]
+
+    # ========== Type ==========
+    def reduce_type_definition(self, children):
+        # <expression> .. <expression>
+        if len(children) == 3:
+            return RangeTypeNode(children[0], children[2])
+        return self.reduce_type(children)
+
+    def reduce_type(self, children):
+        '''Nama tipe (str), ArrayTypeNode, atau RecordTypeNode'''
+        child = children[0]
+        return child.value if isinstance(child, Token) else child
+
+    def reduce_array_type(self, children):
+        # larik [ <range> ] dari <type>
+        return ArrayTypeNode(children[5], [children[2]])
+
+    def reduce_record_type(self, children):
+        fields = []
+        for group in children:
+            if isinstance(group, tuple):
+                _, names, field_type = group
+                fields.extend(RecordFieldNode(name, field_type) for name in names)
+        return RecordTypeNode(fields)
+
+    def reduce_range(self, children):
+        return children[0], children[2]
+
+    # ========== Statements ==========
+    def reduce_compound_statement(self, children):
+        statement = children[1]
+        if isinstance(statement, BlockNode):
+            return BlockNode(list(statement.children))
+        return BlockNode([statement] if statement else [])
+
+    def reduce_empty_statement(self, children):
+        return BlockNode([])
+
+    def reduce_assignment_statement(self, children):
+        target, _, value = children
+        if not target or not value:
+            self.errors.append(ASTError("Assignment statement incomplete"))
+            return None
+        return AssignNode(target, value)
+
+    def reduce_if_statement(self, children):
+        # jika <expression> maka <statement> [selain_itu <statement>]
+        else_body = self.join_statements(children[5:]) if len(children) > 4 else None
+        return IfNode(condition=children[1], then_block=self.join_statements(children[3:4]), else_block=else_body)
+
+    def reduce_while_statement(self, children):
+        return WhileNode(children[1], self.join_statements(children[3:]))
+
+    def reduce_for_statement(self, children):
+        # untuk IDENTIFIER := <expression> ke|turun_ke <expression> lakukan <statement>
+        return ForNode(VarNode(children[1].value), children[3], children[5], children[4].value.lower(),
+                       self.join_statements(children[7:]))
+
+    def reduce_repeat_statement(self, children):
+        # ulangi <statement-list> sampai <expression>
+        body, condition = children[1], children[3]
+        if not body or not condition:
+            self.errors.append(ASTError("Repeat statement incomplete"))
+            return None
+        return RepeatNode(body, condition)
+
+    def reduce_case_statement(self, children):
+        return CaseNode(children[1], children[3])
+
+    def reduce_case_list(self, children):
+        '''ASTBuilder.build_case_node: satu branch per label, statement diambil sampai token NUMBER berikutnya'''
+        branches = []
+        i, count = 0, len(children)
+        while i < count:
+            item = children[i]
+            value = self.build_token(item) if isinstance(item, Token) else item
+            i += 1
+
+            if i < count and isinstance(children[i], Token) and children[i].kind == TokenKind.COLON:
+                i += 1
+
+            start = i
+            while i < count and not (isinstance(children[i], Token) and
+                                     children[i].kind in (TokenKind.NUMBER, TokenKind.IDENTIFIER)):
+                i += 1
+
+            body = self.join_statements(self.build_token(item) if isinstance(item, Token) else item
+                                        for item in children[start:i])
+            branches.append(CaseBranchNode([value], body))
+        return branches
+
+    def reduce_procedure_function_call(self, children):
+        name = children[0]
+        if name.kind != TokenKind.IDENTIFIER:
+            self.errors.append(ASTError("Procedure call missing name"))
+            return None
+        args = children[2] if isinstance(children[2], list) else []
+        return ProcedureFunctionCallNode(name.value, args)
+
+    def reduce_parameter_list(self, children):
+        return [child for child in children if child and not isinstance(child, Token)]
+
+    # ========== Expressions ==========
+    def reduce_expression(self, children):
+        # <simple-expression> [relop <simple-expression>]
+        if len(children) == 3:
+            return BinOpNode(children[0], children[1].value, children[2])
+        return children[0]
+
+    def reduce_simple_expression(self, children):
+        '''ASTBuilder.build_simple_expression_node: cuma operator ARITHMETIC yang dihitung,
+        "atau" dibuang tapi term-nya tetap ikut urutan'''
+        if len(children) == 1:
+            return children[0]
+        terms = [child for child in children if not isinstance(child, Token)]
+        ops = [child.value for child in children
+               if isinstance(child, Token) and child.kind == TokenKind.ARITHMETIC_OPERATOR]
+
+        first = children[0]
+        if isinstance(first, Token) and first.kind == TokenKind.ARITHMETIC_OPERATOR:
+            current = UnaryOpNode(ops[0], terms[0])
+            op_idx = 1
+        else:
+            current = terms[0]
+            op_idx = 0
+
+        for op, term in zip(ops[op_idx:], terms[1:]):
+            current = BinOpNode(current, op, term)
+        return current
+
+    def reduce_term(self, children):
+        '''ASTBuilder.build_term_node: operand ke-i+1 dipasangkan dengan operator ARITHMETIC ke-i'''
+        if len(children) == 1:
+            return children[0]
+        factors = [child for child in children if not isinstance(child, Token)]
+        ops = [child.value for child in children
+               if isinstance(child, Token) and child.kind == TokenKind.ARITHMETIC_OPERATOR]
+        current = factors[0]
+        for i, op in enumerate(ops):
+            current = BinOpNode(current, op, factors[i + 1])
+        return current
+
+    def reduce_factor(self, children):
+        first = children[0]
+        # <variable> atau call
+        if not isinstance(first, Token):
+            return first
+        if len(children) == 1:
+            if first.kind == TokenKind.KEYWORD and first.value.lower() in ("true", "false"):
+                return BooleanNode(first.value.lower() == "true")
+            return self.build_token(first)
+        # tidak <factor>
+        if first.value.lower() == "tidak":
+            return UnaryOpNode("tidak", children[1])
+        # ( <expression> )
+        return children[1]
+
+    def reduce_variable(self, children):
+        '''ASTBuilder.build_variable_selectors: .field -> RecordFieldNode, [index] -> ArrayAccessNode'''
+        current = VarNode(children[0].value)
+        i, count = 1, len(children)
+        while i < count:
+            child = children[i]
+            if not isinstance(child, Token):
+                if child:
+                    current = ArrayAccessNode(current, child)
+            elif child.kind == TokenKind.DOT:
+                i += 1
+                if i < count:
+                    current = RecordFieldNode(children[i].value, type_=None, parent=current)
+            i += 1
+        return current
+
+    def reduce_variable_index(self, children):
+        return children[1]
+
+    PASS_THROUGH = frozenset((NodeKind.EXPRESSION, NodeKind.SIMPLE_EXPRESSION, NodeKind.TERM, NodeKind.FACTOR))
+
+    # ========== Reducer per produksi (NodeKind), dibangun sekali per class ==========
+    REDUCERS = {
+        NodeKind.PROGRAM: reduce_program,
+        NodeKind.PROGRAM_HEADER: reduce_program_header,
+        NodeKind.DECLARATION_PART: reduce_declaration_part,
+        NodeKind.CONST_DECLARATION: reduce_const_declaration,
+        NodeKind.TYPE_DECLARATION: reduce_type_declaration,
+        NodeKind.VAR_DECLARATION: reduce_var_declaration,
+        NodeKind.PROCEDURE_DECLARATION: reduce_procedure_declaration,
+        NodeKind.FUNCTION_DECLARATION: reduce_function_declaration,
+        NodeKind.BLOCK: collapse_block,
+        NodeKind.FORMAL_PARAMETER_LIST: reduce_formal_parameter_list,
+        NodeKind.PARAMETER_GROUP: reduce_parameter_group,
+        NodeKind.IDENTIFIER_LIST: reduce_identifier_list,
+        NodeKind.TYPE_DEFINITION: reduce_type_definition,
+        NodeKind.TYPE: reduce_type,
+        NodeKind.ARRAY_TYPE: reduce_array_type,
+        NodeKind.RECORD_TYPE: reduce_record_type,
+        NodeKind.RANGE: reduce_range,
+        NodeKind.COMPOUND_STATEMENT: reduce_compound_statement,
+        NodeKind.STATEMENT_LIST: collapse_block,
+        NodeKind.EMPTY_STATEMENT: reduce_empty_statement,
+        NodeKind.ASSIGNMENT_STATEMENT: reduce_assignment_statement,
+        NodeKind.IF_STATEMENT: reduce_if_statement,
+        NodeKind.WHILE_STATEMENT: reduce_while_statement,
+        NodeKind.FOR_STATEMENT: reduce_for_statement,
+        NodeKind.REPEAT_STATEMENT: reduce_repeat_statement,
+        NodeKind.CASE_STATEMENT: reduce_case_statement,
+        NodeKind.CASE_LIST: reduce_case_list,
+        NodeKind.PROCEDURE_FUNCTION_CALL: reduce_procedure_function_call,
+        NodeKind.PARAMETER_LIST: reduce_parameter_list,
+        NodeKind.EXPRESSION: reduce_expression,
+        NodeKind.SIMPLE_EXPRESSION: reduce_simple_expression,
+        NodeKind.TERM: reduce_term,
+        NodeKind.FACTOR: reduce_factor,
+        NodeKind.VARIABLE: reduce_variable,
+        NodeKind.VARIABLE_INDEX: reduce_variable_index,
+    }
+
+
+class ASTParser(Parser):
+    '''Parser yang parse() langsung return ProgramNode (ASTTreeBuilder), parse tree cuma dibangun
+    kalau memang mau di-output (milestone-2)'''
+    def __init__(self, tokens, source=None):
+        super().__init__(tokens, source, ASTTreeBuilder())
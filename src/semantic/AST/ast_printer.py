@@ -0,0 +1,75 @@
+import json
+
+from .visitor import ASTVisitor
+
+class ASTPrinter(ASTVisitor):
+    '''Tulis AST (terdekorasi) ke file handle dalam format pohon str(node):
+    satu line per node, "└─ "/"├─ " + repr node + anotasi dekorasi.
+    Output langsung di-write per node, tanpa gabung string dan tanpa rekursi.'''
+    def __init__(self, fp):
+        self.write = fp.write
+        # (prefix, is_last) node yang akan dikunjungi, diisi parent sebelum yield child
+        self._position = ("", True)
+
+    def print(self, node, prefix="", is_last=True):
+        self._position = (prefix, is_last)
+        self.visit(node)
+
+    def generic_visit(self, node):
+        prefix, is_last = self._position
+        connector = "└─ " if is_last else "├─ "
+        # Bersihkan repr dari newline
+        self.write(f"{prefix}{connector}{repr(node).strip()}{node._get_annotation_str()}\n")
+
+        child_prefix = prefix + ("   " if is_last else "│  ")
+        valid_children = [c for c in node.children if c is not None]
+        last = len(valid_children) - 1
+        for i, child in enumerate(valid_children):
+            if hasattr(child, '_format_tree'):
+                self._position = (child_prefix, i == last)
+                yield child
+            else:
+                self.write(f"{child_prefix}{'└─ ' if i == last else '├─ '}{str(child)}\n")
+
+
+class ASTJsonLinesWriter(ASTVisitor):
+    '''Tulis AST (terdekorasi) sebagai JSON Lines, satu object per node urut preorder (sama dengan ASTPrinter):
+    {"id": 2, "parent": 1, "depth": 2, "node": "VarNode", "label": "target 'x'", "attr": {"type": 1, "tab_index": 32, "lev": 1}}
+    label = repr node (teks di ASTPrinter), attr = dekorasi yang terisi dengan key node.attr,
+    type tetap kode TypeKind. Child bukan ASTNode (mis. BooleanNode) ditulis dengan attr kosong.'''
+    def __init__(self, fp):
+        self.write = fp.write
+        self._encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        self._next_id = 0
+        # (id parent, depth) node yang akan dikunjungi
+        self._position = (None, 0)
+
+    def print(self, node):
+        self._position = (None, 0)
+        self.visit(node)
+
+    def _write_record(self, node_class, label, attr):
+        node_id = self._next_id
+        self._next_id += 1
+        parent, depth = self._position
+        self.write(self._encode({"id": node_id, "parent": parent, "depth": depth,
+                                 "node": node_class.__name__, "label": label, "attr": attr}) + "\n")
+        return node_id, depth
+
+    def generic_visit(self, node):
+        node_id, depth = self._write_record(node.__class__, repr(node).strip(), dict(node.attr))
+        for child in node.children:
+            if child is None:
+                continue
+            self._position = (node_id, depth + 1)
+            if hasattr(child, '_format_tree'):
+                yield child
+            else:
+                self._write_record(child.__class__, str(child), {})
+
+
+# --ast-format -> writer, semua punya print(node)
+AST_WRITERS = {
+    "text": ASTPrinter,
+    "jsonl": ASTJsonLinesWriter,
+}
@@ -1,6 +1,11 @@
 from .ast_node import ASTNode
 
+# Dekorasi field record ({nama field: tipe}), disimpan di field_types karena RecordTypeNode.fields sudah dipakai
+_RECORD_DECORATIONS = dict(ASTNode.DECORATIONS, fields="field_types")
+
 class ProgramNode(ASTNode):
+    __slots__ = ("name", "declarations", "block")
+
     def __init__(self, name, declarations=None, block=None):
         super().__init__()
         self.name = name
@@ -16,6 +21,8 @@ class ProgramNode(ASTNode):
         return f"ProgramNode(name: '{self.name}')"
 
 class BlockNode(ASTNode):
+    __slots__ = ("statements",)
+
     def __init__(self, statements=None):
         super().__init__()
         self.statements = statements or []
@@ -25,6 +32,8 @@ class BlockNode(ASTNode):
         return f"Block"
 
 class DeclarationsNode(ASTNode):
+    __slots__ = ("declarations",)
+
     def __init__(self, declarations=None):
         super().__init__()
         self.declarations = declarations or []
@@ -34,6 +43,8 @@ class DeclarationsNode(ASTNode):
         return "Declarations"
 
 class ConstDeclNode(ASTNode):
+    __slots__ = ("name", "consttype")
+
     def __init__(self, name, consttype):
         super().__init__()
         self.name = name
@@ -43,10 +54,14 @@ class ConstDeclNode(ASTNode):
         return f"ConstDecl(name='{self.name}')"
 
 class VarDeclNode(ASTNode):
+    __slots__ = ("name", "vartype", "field_types")
+    DECORATIONS = _RECORD_DECORATIONS
+
     def __init__(self, name, vartype):
         super().__init__()
         self.name = name
         self.vartype = vartype
+        self.field_types = None
         if isinstance(vartype, ASTNode):
             self.children.append(vartype)
 
@@ -54,6 +69,8 @@ class VarDeclNode(ASTNode):
         return f"VarDecl('{self.name}')"
 
 class TypeDeclarationNode(ASTNode):
+    __slots__ = ("name", "type_node")
+
     def __init__(self, name, type_node):
         super().__init__()
         self.name = name
@@ -64,6 +81,8 @@ class TypeDeclarationNode(ASTNode):
         return f"TypeDecl(name='{self.name}')"
 
 class AssignNode(ASTNode):
+    __slots__ = ("target", "value")
+
     def __init__(self, target, value):
         super().__init__()
         self.target = target
@@ -84,31 +103,43 @@ class AssignNode(ASTNode):
         return f"Assign('{t_str}' := {v_str})"
 
 class VarNode(ASTNode):
+    __slots__ = ("name", "field_types")
+    DECORATIONS = _RECORD_DECORATIONS
+
     def __init__(self, name):
         super().__init__()
         self.name = name
+        self.field_types = None
 
     def __repr__(self):
         return f"target '{self.name}'"
 
 class NumNode(ASTNode):
-    def __init__(self, value):
+    __slots__ = ("value", "literal")
+
+    def __init__(self, value, literal=None):
         super().__init__()
         self.value = value
+        self.literal = literal  # int/float hasil decode lexer, value tetap lexeme mentah
 
     def __repr__(self):
         return f"value {self.value}"
 
 class StringNode(ASTNode):
-    def __init__(self, value, is_char_literal=False):
+    __slots__ = ("value", "is_char_literal", "literal")
+
+    def __init__(self, value, is_char_literal=False, literal=None):
         super().__init__()
         self.value = value
         self.is_char_literal = is_char_literal
+        self.literal = literal  # isi string tanpa quote hasil decode lexer
 
     def __repr__(self):
         return f"String ({self.value})"
 
 class BooleanNode:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
@@ -117,6 +148,8 @@ class BooleanNode:
         return f"Boolean ({self.value})"
 
 class UnaryOpNode(ASTNode):
+    __slots__ = ("op", "operand")
+
     def __init__(self, op, operand):
         super().__init__()
         self.op = op
@@ -127,6 +160,8 @@ class UnaryOpNode(ASTNode):
         return f"UnaryOp(op='{self.op}')"
 
 class BinOpNode(ASTNode):
+    __slots__ = ("left", "op", "right")
+
     def __init__(self, left, op, right):
         super().__init__()
         self.left = left
@@ -138,6 +173,8 @@ class BinOpNode(ASTNode):
         return f"BinOp '{self.op}'"
 
 class ProcedureDeclNode(ASTNode):
+    __slots__ = ("name", "params", "block")
+
     def __init__(self, name, params, block):
         super().__init__()
         self.name = name
@@ -151,6 +188,8 @@ class ProcedureDeclNode(ASTNode):
         return f"ProcedureDecl(name='{self.name}')"
 
 class FunctionDeclNode(ASTNode):
+    __slots__ = ("name", "params", "return_type", "block")
+
     def __init__(self, name, params, return_type, block):
         super().__init__()
         self.name = name
@@ -165,6 +204,8 @@ class FunctionDeclNode(ASTNode):
         return f"FunctionDecl(name='{self.name}')"
 
 class ParamNode(ASTNode):
+    __slots__ = ("names", "type_node", "is_var")
+
     def __init__(self, names, type_node, is_var=False):
         super().__init__()
         self.names = names
@@ -175,6 +216,8 @@ class ParamNode(ASTNode):
         return f"Param(names='{self.names}', type='{self.type_node}', is_var={self.is_var})"
 
 class ProcedureFunctionCallNode(ASTNode):
+    __slots__ = ("name", "args")
+
     def __init__(self, name, args=None):
         super().__init__()
         self.name = name
@@ -185,6 +228,8 @@ class ProcedureFunctionCallNode(ASTNode):
         return f"ProcedureFunctionCall('{self.name}')"
 
 class IfNode(ASTNode):
+    __slots__ = ("condition", "then_block", "else_block")
+
     def __init__(self, condition, then_block, else_block=None):
         super().__init__()
         self.condition = condition
@@ -198,6 +243,8 @@ class IfNode(ASTNode):
         return "If Condition"
 
 class WhileNode(ASTNode):
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition, body):
         super().__init__()
         self.condition = condition
@@ -208,6 +255,8 @@ class WhileNode(ASTNode):
         return f"While Loop"
 
 class RepeatNode(ASTNode):
+    __slots__ = ("body", "condition")
+
     def __init__(self, body, condition):
         super().__init__()
         self.body = body
@@ -218,6 +267,8 @@ class RepeatNode(ASTNode):
         return f"Repeat Until"
 
 class ForNode(ASTNode):
+    __slots__ = ("var_node", "start_expr", "end_expr", "direction", "body")
+
     def __init__(self, var_node, start_expr, end_expr, direction, body):
         super().__init__()
         self.var_node = var_node
@@ -232,6 +283,8 @@ class ForNode(ASTNode):
         return f"For Loop"
 
 class CaseBranchNode(ASTNode):
+    __slots__ = ("constants", "statement")
+
     def __init__(self, constants, statement):
         super().__init__()
         self.constants = constants
@@ -244,6 +297,8 @@ class CaseBranchNode(ASTNode):
         return f"CaseBranch([{consts}] => {stmt_type})"
 
 class CaseNode(ASTNode):
+    __slots__ = ("expr_node", "branches")
+
     def __init__(self, expr_node, branches):
         super().__init__()
         self.expr_node = expr_node
@@ -256,14 +311,20 @@ class CaseNode(ASTNode):
         return f"Case(expr={expr_type}, branches={len(self.branches)})"
 
 class ArrayTypeNode(ASTNode):
+    __slots__ = ("base_type", "bounds", "array_info")
+    DECORATIONS = dict(ASTNode.DECORATIONS, array_info="array_info")
+
     def __init__(self, base_type, bounds):
         super().__init__()
         self.base_type = base_type
         self.bounds = bounds
+        self.array_info = None  # (tipe elemen, low, high)
     def __repr__(self):
         return f"ArrayType(base_type={self.base_type}, bounds={self.bounds})"
 
 class ArrayAccessNode(ASTNode):
+    __slots__ = ("array", "index")
+
     def __init__(self, array, index):
         super().__init__()
         self.array = array
@@ -287,30 +348,42 @@ class ArrayAccessNode(ASTNode):
 
 
 class RecordFieldNode(ASTNode):
+    __slots__ = ("name", "type_", "parent", "parent_type")
+    DECORATIONS = dict(ASTNode.DECORATIONS, parent_type="parent_type")
+
     def __init__(self, name, type_, parent=None):
         super().__init__()
         self.name = name
         self.type_ = type_
         self.parent = parent 
+        self.parent_type = None
         self.children.append(parent)
 
     def __repr__(self):
         return f"RecordField('{self.name}')"
 
 class RecordTypeNode(ASTNode):
+    __slots__ = ("fields", "field_types")
+    DECORATIONS = _RECORD_DECORATIONS
+
     def __init__(self, fields=None):
         super().__init__()
         self.fields = fields or []
+        self.field_types = None
         self.children.extend(self.fields)
 
     def __repr__(self):
         return f"RecordType(fields={self.fields})"
 
 class RangeTypeNode(ASTNode):
+    __slots__ = ("lower", "upper", "range")
+    DECORATIONS = dict(ASTNode.DECORATIONS, range="range")
+
     def __init__(self, lower, upper):
         super().__init__()
         self.lower = lower
         self.upper = upper
+        self.range = None  # (low, high)
         self.children.extend([lower, upper])
 
     def __repr__(self):
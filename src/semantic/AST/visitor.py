@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict
+
+from ..traversal import run_traversal
+
+class ASTVisitor:
+    '''Base visitor AST untuk semua pass (SemanticAnalyzer, ASTPrinter, dst).
+
+    visit(node) memanggil visit_<NamaClass>(node), dicari di MRO class node dengan fallback
+    generic_visit. Handler di-resolve sekali per (class visitor, class node) lalu di-cache, jadi
+    ga ada getattr/f-string per node. Handler yang butuh hasil child men-yield child-nya
+    (x = yield child) dan dijalankan lewat run_traversal, tanpa rekursi Python.
+    '''
+    # class node -> function handler (unbound), tiap subclass punya cache sendiri
+    _handlers: Dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = {}
+
+    def visit(self, node) -> Any:
+        return run_traversal(node, self.dispatch)
+
+    def dispatch(self, node) -> Any:
+        '''Satu langkah kunjungan: panggil handler node, child-nya dijalankan oleh visit'''
+        handler = self._handlers.get(node.__class__)
+        if handler is None:
+            handler = self._resolve_handler(node.__class__)
+        return handler(self, node)
+
+    @classmethod
+    def _resolve_handler(cls, node_class: type) -> Callable:
+        for klass in node_class.__mro__:
+            handler = getattr(cls, f'visit_{klass.__name__}', None)
+            if handler is not None:
+                break
+        else:
+            # node tanpa children (mis. BooleanNode, None) ga punya apa-apa untuk dikunjungi
+            handler = cls.generic_visit if hasattr(node_class, 'children') else cls.leaf_visit
+        cls._handlers[node_class] = handler
+        return handler
+
+    def generic_visit(self, node):
+        for child in node.children:
+            if child:
+                yield child
+
+    def leaf_visit(self, node):
+        return None
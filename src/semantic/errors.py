@@ -13,6 +13,12 @@ class SemanticError(Exception):
             return f"Semantic error at line {self.line}: {self.message}"
         return f"Semantic error: {self.message}"
 
+    def render(self, source):
+        '''Format dengan satu line konteks dari SourceFile (kalau line diketahui)'''
+        if not self.line or source is None:
+            return self.format_message()
+        return source.render("SemanticError", self.message, self.line, self.column or 1)
+
 class UndeclaredIdentifierError(SemanticError):
 # Dilempar ketika sebuah identifier digunakan tetapi belum dideklarasikan
     def __init__(self, identifier, line=None, column=None):
@@ -8,8 +8,9 @@ from .errors import (
     ArgumentTypeError, InvalidAssignmentError, MissingReturnError
 )
 from .AST.nodes import *
+from .AST.visitor import ASTVisitor
 
-class SemanticAnalyzer:
+class SemanticAnalyzer(ASTVisitor):
 
     def __init__(self):
         self.symbol_table = SymbolTable()
@@ -38,16 +39,6 @@ class SemanticAnalyzer:
     def report_error(self, error):
         self.errors.append(error)
 
-    def visit(self, node):
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
-    def generic_visit(self, node):
-        for child in getattr(node, 'children', []):
-            if child:
-                self.visit(child)
-
     # ========== Struktur Program ==========
 
     def visit_ProgramNode(self, node):
@@ -55,36 +46,36 @@ class SemanticAnalyzer:
         if node.name:
             prog_idx = self.symbol_table.add_program_name(node.name)
             # Dekorasi node
-            node.attr['tab_index'] = prog_idx
-            node.attr['type'] = TypeKind.NOTYPE
-            node.attr['lev'] = 0
+            node.tab_index = prog_idx
+            node.type = TypeKind.NOTYPE
+            node.lev = 0
 
         # Kunjungi bagian deklarasi
         if node.declarations:
             for decl in node.declarations:
-                self.visit(decl)
+                yield decl
 
         # Kunjungi blok utama - enter scope untuk compound statement
         if node.block:
             block_idx = self.symbol_table.enter_scope()
             # Dekorasi block node
-            node.block.attr['block_index'] = block_idx
-            node.block.attr['lev'] = self.symbol_table.current_level
+            node.block.block_index = block_idx
+            node.block.lev = self.symbol_table.current_level
 
-            self.visit(node.block)
+            yield node.block
             self.symbol_table.exit_scope()
 
     def visit_BlockNode(self, node):
         """Kunjungi blok (compound statement)"""
         for statement in node.statements:
             if statement:
-                self.visit(statement)
+                yield statement
 
     def visit_DeclarationsNode(self, node):
         """Kunjungi node deklarasi"""
         for decl in node.declarations:
             if decl:
-                self.visit(decl)
+                yield decl
 
     # ========== Deklarasi ==========
 
@@ -100,7 +91,7 @@ class SemanticAnalyzer:
         type_kind = TypeKind.NOTYPE
         if node.consttype:
             # Kunjungi ekspresi untuk memperoleh tipenya
-            type_kind = self.visit(node.consttype)
+            type_kind = yield node.consttype
 
         # Tambahkan ke tabel simbol
         self.symbol_table.add_constant(node.name, type_kind, None)
@@ -118,9 +109,9 @@ class SemanticAnalyzer:
             type_kind = TypeKind.RECORD
 
             var_idx = self.symbol_table.add_variable(node.name, type_kind)
-            node.attr['tab_index'] = var_idx
-            node.attr['type'] = type_kind
-            node.attr['lev'] = self.symbol_table.current_level
+            node.tab_index = var_idx
+            node.type = type_kind
+            node.lev = self.symbol_table.current_level
 
             # isi fields
             fields = {}
@@ -137,7 +128,7 @@ class SemanticAnalyzer:
                             fields[f.name] = TypeKind.NOTYPE
                     else:
                         fields[f.name] = ft
-            node.attr['fields'] = fields
+            node.field_types = fields
             self.symbol_table.tab[var_idx]['fields'] = fields
             return
 
@@ -148,25 +139,25 @@ class SemanticAnalyzer:
             if hasattr(node.vartype, 'bounds') and node.vartype.bounds:
                 b = node.vartype.bounds[0]
                 if isinstance(b, tuple) and len(b) == 2:
-                    low = int(getattr(b[0], 'value', 1))
-                    high = int(getattr(b[1], 'value', 10))
+                    low = self._int_value(b[0], 1)
+                    high = self._int_value(b[1], 10)
 
             var_idx = self.symbol_table.add_variable(node.name, TypeKind.ARRAY)
             atab_idx = self.symbol_table.add_array_info(
                 xtyp=TypeKind.ARRAY, etyp=base_type, low=low, high=high, elsz=1
             )
             self.symbol_table.tab[var_idx]['ref'] = atab_idx
-            node.attr['tab_index'] = var_idx
-            node.attr['type'] = TypeKind.ARRAY
-            node.attr['lev'] = self.symbol_table.current_level
+            node.tab_index = var_idx
+            node.type = TypeKind.ARRAY
+            node.lev = self.symbol_table.current_level
             return
 
         # Tipe sederhana
         type_kind = self._get_type_kind(node.vartype)
         var_idx = self.symbol_table.add_variable(node.name, type_kind)
-        node.attr['tab_index'] = var_idx
-        node.attr['type'] = type_kind
-        node.attr['lev'] = self.symbol_table.current_level
+        node.tab_index = var_idx
+        node.type = type_kind
+        node.lev = self.symbol_table.current_level
 
     def visit_TypeDeclarationNode(self, node):
         """Kunjungi deklarasi tipe"""
@@ -184,8 +175,8 @@ class SemanticAnalyzer:
 
         # Jika ini RecordTypeNode, simpan field info ke symbol table entry
         if isinstance(node.type_node, RecordTypeNode):
-            # _resolve_type_node sudah mengisi node.type_node.attr['fields']
-            field_info = node.type_node.attr.get('fields', {})
+            # _resolve_type_node sudah mengisi node.type_node.field_types
+            field_info = node.type_node.field_types or {}
             if type_idx is not None and 0 <= type_idx < len(self.symbol_table.tab):
                 self.symbol_table.tab[type_idx]['fields'] = field_info
 
@@ -211,11 +202,11 @@ class SemanticAnalyzer:
         # Tambahkan parameter
         if node.params:
             for param in node.params:
-                self.visit(param)
+                yield param
 
         # Kunjungi badan prosedur
         if node.block:
-            self.visit(node.block)
+            yield node.block
 
         # Keluar dari scope prosedur
         self.symbol_table.exit_scope()
@@ -251,11 +242,11 @@ class SemanticAnalyzer:
         # Tambahkan parameter
         if node.params:
             for param in node.params:
-                self.visit(param)
+                yield param
 
         # Kunjungi badan fungsi
         if node.block:
-            self.visit(node.block)
+            yield node.block
 
         # Keluar dari scope fungsi
         self.symbol_table.exit_scope()
@@ -275,8 +266,8 @@ class SemanticAnalyzer:
 
     def visit_AssignNode(self, node):
         """Kunjungi pernyataan assignment"""
-        target_type = self.visit(node.target)
-        value_type = self.visit(node.value)
+        target_type = yield node.target
+        value_type = yield node.value
 
         # cek kesesuaian tipe
         try:
@@ -284,13 +275,13 @@ class SemanticAnalyzer:
         except SemanticError as e:
             self.report_error(e)
 
-        node.attr['type'] = TypeKind.NOTYPE
+        node.type = TypeKind.NOTYPE
 
 
     def visit_IfNode(self, node):
         """Kunjungi pernyataan if"""
         # Periksa kondisi bertipe boolean
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         try:
             self.type_checker.check_condition(condition_type, "if statement")
         except SemanticError as e:
@@ -298,16 +289,16 @@ class SemanticAnalyzer:
 
         # Kunjungi blok then
         if node.then_block:
-            self.visit(node.then_block)
+            yield node.then_block
 
         # Kunjungi blok else jika ada
         if node.else_block:
-            self.visit(node.else_block)
+            yield node.else_block
 
     def visit_WhileNode(self, node):
         """Kunjungi pernyataan while"""
         # Periksa kondisi bertipe boolean
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         try:
             self.type_checker.check_condition(condition_type, "while statement")
         except SemanticError as e:
@@ -315,16 +306,16 @@ class SemanticAnalyzer:
 
         # Kunjungi badan
         if node.body:
-            self.visit(node.body)
+            yield node.body
 
     def visit_RepeatNode(self, node):
         """Kunjungi pernyataan repeat-until"""
         # Kunjungi badan terlebih dahulu
         if node.body:
-            self.visit(node.body)
+            yield node.body
 
         # Periksa kondisi bertipe boolean
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         try:
             self.type_checker.check_condition(condition_type, "repeat-until statement")
         except SemanticError as e:
@@ -341,8 +332,8 @@ class SemanticAnalyzer:
         var_type = var_symbol['type']
 
         # Ambil tipe ekspresi awal dan akhir
-        start_type = self.visit(node.start_expr)
-        end_type = self.visit(node.end_expr)
+        start_type = yield node.start_expr
+        end_type = yield node.end_expr
 
         # Periksa batas kompatibel
         try:
@@ -352,7 +343,7 @@ class SemanticAnalyzer:
 
         # Kunjungi badan
         if node.body:
-            self.visit(node.body)
+            yield node.body
 
     def visit_ProcedureFunctionCallNode(self, node):
         """Kunjungi pemanggilan prosedur/fungsi"""
@@ -363,7 +354,7 @@ class SemanticAnalyzer:
             # Built-in menerima argumen apa pun, lewati pemeriksaan rinci
             if node.args:
                 for arg in node.args:
-                    self.visit(arg)
+                    yield arg
 
             # Cek apakah builtin sudah ada di symbol table
             symbol = self.symbol_table.lookup(call_name)
@@ -378,8 +369,8 @@ class SemanticAnalyzer:
                         tab_idx = idx
                         break
 
-            node.attr['tab_index'] = tab_idx
-            node.attr['type'] = 'predefined'
+            node.tab_index = tab_idx
+            node.type = 'predefined'
             return TypeKind.NOTYPE
 
         # Cari entri prosedur/fungsi
@@ -406,7 +397,7 @@ class SemanticAnalyzer:
         # Periksa tipe argumen
         if node.args:
             for i, (arg, expected_param) in enumerate(zip(node.args, expected_params)):
-                arg_type = self.visit(arg)
+                arg_type = yield arg
                 expected_type = expected_param['type']
 
                 if not self.type_checker.is_compatible(expected_type, arg_type):
@@ -426,15 +417,15 @@ class SemanticAnalyzer:
 
     def visit_BinOpNode(self, node):
         """Kunjungi operasi biner"""
-        left_type = self.visit(node.left)
-        right_type = self.visit(node.right)
+        left_type = yield node.left
+        right_type = yield node.right
 
         try:
             result_type = self.type_checker.get_result_type(
                 node.op, left_type, right_type
             )
             # Dekorasi node
-            node.attr['type'] = result_type
+            node.type = result_type
             return result_type
         except SemanticError as e:
             self.report_error(e)
@@ -442,7 +433,7 @@ class SemanticAnalyzer:
 
     def visit_UnaryOpNode(self, node):
         """Kunjungi operasi unary"""
-        operand_type = self.visit(node.operand)
+        operand_type = yield node.operand
 
         try:
             result_type = self.type_checker.check_unary_operation(node.op, operand_type)
@@ -464,13 +455,13 @@ class SemanticAnalyzer:
                 tab_idx = idx
                 break
 
-        node.attr['tab_index'] = tab_idx
-        node.attr['type'] = symbol['type']
-        node.attr['lev'] = symbol.get('lev', 0)
+        node.tab_index = tab_idx
+        node.type = symbol['type']
+        node.lev = symbol.get('lev', 0)
 
         # Copy fields dari symbol table (untuk record)
         if 'fields' in symbol:
-            node.attr['fields'] = symbol['fields']  # <<< ini penting
+            node.field_types = symbol['fields']  # <<< ini penting
 
         return symbol['type']
 
@@ -491,7 +482,7 @@ class SemanticAnalyzer:
                 return TypeKind.NOTYPE
 
             # Periksa tipe indeks
-            index_type = self.visit(node.index)
+            index_type = yield node.index
             if index_type != TypeKind.INTEGER:
                 try:
                     self.type_checker.check_array_index(index_type)
@@ -511,7 +502,7 @@ class SemanticAnalyzer:
 
     def visit_RecordFieldNode(self, node):
         """Kunjungi field record, mendukung nested record & array"""
-        parent_type = self.visit(node.parent)  # tipe dari record parent
+        parent_type = yield node.parent  # tipe dari record parent
         if parent_type == TypeKind.NOTYPE:
             return TypeKind.NOTYPE
 
@@ -530,8 +521,8 @@ class SemanticAnalyzer:
             return TypeKind.NOTYPE
 
         # dekorasi node
-        node.attr['type'] = field_type
-        node.attr['parent_type'] = parent_type
+        node.type = field_type
+        node.parent_type = parent_type
         return field_type
 
 
@@ -555,31 +546,34 @@ class SemanticAnalyzer:
 
     def visit_NumNode(self, node):
         """Kunjungi literal angka"""
-        # Periksa apakah integer atau real
-        if isinstance(node.value, int) or '.' not in str(node.value):
-            node.attr['type'] = TypeKind.INTEGER
+        # Periksa apakah integer atau real (literal sudah di-decode lexer, lexeme cuma fallback)
+        literal = getattr(node, 'literal', None)
+        if isinstance(literal, int) or (literal is None and '.' not in str(node.value)):
+            node.type = TypeKind.INTEGER
             return TypeKind.INTEGER
-        node.attr['type'] = TypeKind.REAL
+        node.type = TypeKind.REAL
         return TypeKind.REAL
 
     def visit_StringNode(self, node):
         """Kunjungi literal string"""
         # Cek literal char dari lexer/AST builder
         if getattr(node, 'is_char_literal', False):
-            node.attr['type'] = TypeKind.CHAR
+            node.type = TypeKind.CHAR
             return TypeKind.CHAR
 
-        literal_value = node.value if isinstance(node.value, str) else ''
-        stripped_value = literal_value
-
-        if len(literal_value) >= 2 and literal_value[0] == "'" and literal_value[-1] == "'":
-            stripped_value = literal_value[1:-1]
+        stripped_value = getattr(node, 'literal', None)
+        if stripped_value is None:
+            # Node dibuat tanpa token lexer, buang quote dari lexeme
+            literal_value = node.value if isinstance(node.value, str) else ''
+            stripped_value = literal_value
+            if len(literal_value) >= 2 and literal_value[0] == "'" and literal_value[-1] == "'":
+                stripped_value = literal_value[1:-1]
 
         if len(stripped_value) == 1:
-            node.attr['type'] = TypeKind.CHAR
+            node.type = TypeKind.CHAR
             return TypeKind.CHAR
 
-        node.attr['type'] = TypeKind.STRING
+        node.type = TypeKind.STRING
         return TypeKind.STRING
 
     def visit_BooleanNode(self, node):
@@ -588,6 +582,13 @@ class SemanticAnalyzer:
 
     # ========== Metode Bantu ==========
 
+    def _int_value(self, node, default):
+        """Nilai integer batas array, pakai literal hasil decode lexer kalau ada"""
+        literal = getattr(node, 'literal', None)
+        if isinstance(literal, int):
+            return literal
+        return int(getattr(node, 'value', default))
+
     def _get_type_kind(self, type_str):
         """Konversikan string tipe menjadi konstanta TypeKind"""
         type_map = {
@@ -628,7 +629,7 @@ class SemanticAnalyzer:
         if isinstance(type_node, RangeTypeNode):
             low = type_node.lower.value
             high = type_node.upper.value
-            type_node.attr['range'] = (low, high)
+            type_node.range = (low, high)
             return TypeKind.INTEGER   # Pascal subrange dianggap integer
 
         # ArrayTypeNode
@@ -638,7 +639,7 @@ class SemanticAnalyzer:
             bound = type_node.bounds[0]
             low = bound[0].value
             high = bound[1].value
-            type_node.attr['array_info'] = (base_type, low, high)
+            type_node.array_info = (base_type, low, high)
             return TypeKind.ARRAY
 
         # RecordTypeNode
@@ -646,7 +647,7 @@ class SemanticAnalyzer:
             fields = {}
             for f in type_node.fields:
                 fields[f.name] = self._get_type_kind(f.type_)
-            type_node.attr['fields'] = fields
+            type_node.field_types = fields
             return TypeKind.RECORD
 
         # primitive / identifier type
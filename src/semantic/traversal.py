@@ -0,0 +1,55 @@
+from types import GeneratorType
+from typing import Any, Callable
+
+
+def run_traversal(node: Any, step: Callable[[Any], Any]) -> Any:
+    '''Jalankan traversal "rekursif" tanpa rekursi Python, return hasil step(node).
+
+    step(node) boleh return nilai biasa, atau generator yang men-yield:
+      - node child   -> dikunjungi lewat step, hasilnya dikirim balik ke generator (send)
+      - generator    -> dijalankan sebagai sub-call, return value-nya dikirim balik
+    Jadi `x = self.visit(child)` di visitor ditulis `x = yield child`. Frame generator disimpan
+    di stack eksplisit, urutan kunjungan & side effect sama dengan versi rekursif, tapi kedalaman
+    tree ga dibatasi recursion limit. Exception dilempar ke frame parent (throw) seperti biasa.
+    '''
+    stack = []
+    push, pop = stack.append, stack.pop
+    error = None
+    try:
+        result = step(node)
+    except Exception as exc:
+        result, error = None, exc
+    while True:
+        if type(result) is GeneratorType:
+            frame = result
+            push(frame)
+            result = None
+        elif stack:
+            frame = stack[-1]
+        elif error is not None:
+            raise error
+        else:
+            return result
+
+        try:
+            if error is None:
+                child = frame.send(result)
+            else:
+                exc, error = error, None
+                child = frame.throw(exc)
+        except StopIteration as stop:
+            pop()
+            result = stop.value
+            continue
+        except Exception as exc:
+            pop()
+            result, error = None, exc
+            continue
+
+        if type(child) is GeneratorType:
+            result = child
+            continue
+        try:
+            result = step(child)
+        except Exception as exc:
+            result, error = None, exc
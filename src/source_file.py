@@ -0,0 +1,67 @@
+import re
+from array import array
+from bisect import bisect_right
+from typing import Optional, Tuple, Union
+
+class SourceFile:
+    '''Source text + tabel offset awal tiap line, dibangun sekali dan dipakai bareng
+    oleh lexer, parser, dan semantic error buat render diagnostic.
+
+    Line di sini line fisik (dipisah '\\n', termasuk newline di dalam string literal), jadi
+    lookup line & konversi offset <-> (line, column) cukup O(log n).
+    '''
+    def __init__(self, text: str, path: Optional[str] = None):
+        self.text = text
+        self.path = path
+        self._line_starts: Optional[array] = None
+
+    @staticmethod
+    def of(source: Union["SourceFile", str, None]) -> Optional["SourceFile"]:
+        '''Terima SourceFile atau string mentah (dibungkus), None tetap None'''
+        if source is None or isinstance(source, SourceFile):
+            return source
+        return SourceFile(source)
+
+    @property
+    def line_starts(self) -> array:
+        '''line_starts[n - 1] = offset awal line n, plus sentinel len(text) + 1 di akhir'''
+        if self._line_starts is None:
+            # offset setelah tiap '\n', tanpa bikin list string per line
+            starts = array('q', [0])
+            starts.extend(match.end() for match in re.finditer('\n', self.text))
+            starts.append(len(self.text) + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts) - 1
+
+    def line_text(self, line: int) -> str:
+        '''Isi line ke-line tanpa '\\n', string kosong kalau di luar range'''
+        if not 0 < line <= self.line_count:
+            return ""
+        starts = self.line_starts
+        return self.text[starts[line - 1]:starts[line] - 1]
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        '''offset -> (line, column), keduanya mulai dari 1'''
+        line = bisect_right(self.line_starts, offset, 0, self.line_count)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def offset(self, line: int, column: int) -> int:
+        '''(line, column) -> offset'''
+        return self.line_starts[line - 1] + column - 1
+
+    def render(self, label: str, message: str, line: int, column: int) -> str:
+        '''Format diagnostic dengan satu line konteks dan caret di column error'''
+        line_number_str = str(line)
+        padding = " " * len(line_number_str)
+        caret_padding = " " * max(0, column - 1)
+        return (
+            f"{label}: {message}\n"
+            f"  --> (line {line}, column {column})\n"
+            f" {padding} |\n"
+            f" {line_number_str} | {self.line_text(line).rstrip()}\n"
+            f" {padding} | {caret_padding}^"
+        )
@@ -2,6 +2,9 @@ import json
 import io
 
 from src.lexer.token import Token
+from src.lexer.token_buffer import TokenBuffer
+from src.lexer.token_kind import TokenKind
+from src.semantic.AST.ast_printer import AST_WRITERS, ASTPrinter
 from src.semantic.symbol.symbol_table import *
 
 def read_file(path):
@@ -16,6 +19,11 @@ def read_json(path: str):
 
 def format_tokens(tokens):
     '''Format tokens output berdasarkan spek'''
+    if isinstance(tokens, TokenBuffer):
+        # langsung dari kolom (= type_of/value_of per token), tanpa bikin object Token
+        names, source = TokenKind.NAMES, tokens.source
+        return "\n".join(f"{names[kind]}({source[start:start + length]})"
+                         for kind, start, length in zip(tokens.kinds, tokens.starts, tokens.lengths))
     return "\n".join(f"{token.type}({token.value})" for token in tokens)
 
 def symbol_table_to_str(symbol_table):
@@ -32,27 +40,47 @@ def symbol_table_to_str(symbol_table):
     return result
 
 def write_file(output, output_path):
-    '''Write formatted token ke output path'''
+    '''Write output ke output path, output = string atau writer(fp) yang nulis langsung ke file'''
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(output)
-        
-def format_output(ast_root, root, tokens, dir_output, symbol_table=None):
-    '''Output helper'''
-    output = ""
+        if callable(output):
+            output(f)
+        else:
+            f.write(output)
+
+def format_output(ast_root, root, tokens, dir_output, symbol_table=None, fp=None, ast_format="text"):
+    '''Output helper, kalau fp dikasih output di-stream ke fp (return None) dan bukan dirangkai jadi string.
+    ast_format "jsonl": output milestone-3 cuma decorated AST dalam JSON Lines (lihat ASTJsonLinesWriter)'''
+    if fp is None:
+        buffer = io.StringIO()
+        format_output(ast_root, root, tokens, dir_output, symbol_table, buffer, ast_format)
+        return buffer.getvalue()
+
     if int(dir_output[-1:]) == 1:
-        output = format_tokens(tokens)
+        fp.write(format_tokens(tokens))
     elif int(dir_output[-1:]) == 2:
-        output = str(root)
+        root.write_tree(fp)
     elif int(dir_output[-1:]) == 3:
-        output = ""
+        if ast_format != "text":
+            AST_WRITERS[ast_format](fp).print(ast_root)
+            return
         if symbol_table: 
-            output += "============================= SEMANTIC ANALYSIS + SYMBOL TABLE =============================\n\n"
-            output += symbol_table + "\n"
-            output += "================================= DECORATED AST =================================\n\n"
-        output += str(ast_root)
+            fp.write("============================= SEMANTIC ANALYSIS + SYMBOL TABLE =============================\n\n")
+            fp.write(symbol_table + "\n")
+            fp.write("================================= DECORATED AST =================================\n\n")
+        ASTPrinter(fp).print(ast_root)
 
-    return output
+def parse_args(argv):
+    '''Pisahkan argumen posisi dan opsi --key=value'''
+    args = []
+    options = {}
+    for arg in argv:
+        if arg.startswith("--"):
+            key, _, value = arg[2:].partition("=")
+            options[key] = value
+        else:
+            args.append(arg)
+    return args, options
 
 def print_usage():
     '''Usage for input error'''
-    print("Usage: python main.py <milestone-x/input/source_file.pas>")
\ No newline at end of file
+    print("Usage: python main.py <milestone-x/input/source_file.pas> [--lexer=dfa|regex|generated] [--jobs=N] [--dfa-report] [--ast-format=text|jsonl] [--no-echo]")
\ No newline at end of file
@@ -0,0 +1,8 @@
+program fail_precedence;
+variabel
+  a: integer;
+mulai
+  a := ;
+  tulis('halo');
+  a := a # 1;
+selesai.
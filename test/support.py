@@ -0,0 +1,96 @@
+'''Helper bersama untuk test python di folder ini.
+
+Jalankan dari root repo: python -m pytest test  atau  python -m unittest discover -s test
+'''
+import io
+import os
+import subprocess
+import sys
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+TEST_DIR = ROOT / "test"
+CONFIG_DIR = ROOT / "src" / "config"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.config_cache import ConfigCache
+from src.dfa.dfa_engine import DFAEngine
+from src.lexer.backends import create_lexer, DEFAULT_BACKEND
+
+@lru_cache(maxsize=None)
+def compiled_config():
+    return ConfigCache.load(str(CONFIG_DIR / "states.json"), str(CONFIG_DIR / "transitions.json"),
+                            str(CONFIG_DIR / "token_maps.json"))
+
+def make_lexer(backend=DEFAULT_BACKEND):
+    config = compiled_config()
+    return create_lexer(DFAEngine(config.dfa_config), config.lexer_config, backend, config)
+
+def fixtures(*milestones):
+    '''Path semua input .pas milestone yang diminta, urut nama'''
+    paths = []
+    for milestone in milestones:
+        for folder in sorted((TEST_DIR / milestone).glob("input*")):
+            paths.extend(sorted(folder.glob("*.pas")))
+    return paths
+
+DEEP_HEADER = "program Deep;\n\nvariabel\n  x: integer;\n  flag: boolean;\n\nmulai\n  flag := true;\n"
+
+def deep_statement(n):
+    '''n x "jika flag maka selama flag lakukan mulai" bersarang'''
+    return (DEEP_HEADER + "  jika flag maka selama flag lakukan mulai\n" * n + "  x := 1\n"
+            + "  selesai\n" * n + "selesai.\n")
+
+def deep_expression(n, innermost="x"):
+    '''n x "(1 + " di assignment integer dan n x "tidak (" di assignment boolean'''
+    return (DEEP_HEADER + "  x := " + "(1 + " * n + innermost + ")" * n + ";\n"
+            + "  flag := " + "tidak (" * n + "flag" + ")" * n + "\nselesai.\n")
+
+def read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+@contextmanager
+def milestone_outputs(source_arg):
+    '''File output milestone (output.txt / output.jsonl) dikosongkan selama blok lalu dikembalikan
+    ke kondisi sebelum test. Yield fungsi yang membaca output yang ditulis compiler (None kalau ga ada)'''
+    milestone = source_arg.replace("\\", "/").split("/")[0]
+    output_dir = TEST_DIR / milestone / "output"
+    outputs = [output_dir / "output.txt", output_dir / "output.jsonl"]
+    saved = {path: path.read_bytes() for path in outputs if path.exists()}
+    try:
+        for path in saved:
+            path.unlink()
+        yield lambda: next((read(path) for path in outputs if path.exists()), None)
+    finally:
+        for path in outputs:
+            if path in saved:
+                path.write_bytes(saved[path])
+            elif path.exists():
+                path.unlink()
+
+def run_compiler(source_arg, *options):
+    '''Jalankan main.py seperti dari CLI, return (returncode, stdout, isi file output)'''
+    with milestone_outputs(source_arg) as written:
+        result = subprocess.run([sys.executable, str(ROOT / "main.py"), source_arg, *options],
+                                cwd=ROOT, capture_output=True, text=True, encoding="utf-8",
+                                env={**os.environ, "PYTHONIOENCODING": "utf-8"})
+        return result.returncode, result.stdout, written()
+
+def run_compiler_in_process(source_arg, *options):
+    '''Sama dengan run_compiler tapi compiler() dipanggil di process ini, jadi bisa di-mock/di-spy'''
+    from src.compiler import compiler
+    stdout = io.StringIO()
+    with milestone_outputs(source_arg) as written, redirect_stdout(stdout), \
+            mock.patch.object(sys, "argv", [str(ROOT / "main.py"), source_arg, *options]):
+        try:
+            compiler()
+            code = 0
+        except SystemExit as e:
+            code = e.code
+        return code, stdout.getvalue(), written()
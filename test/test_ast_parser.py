@@ -0,0 +1,214 @@
+import random
+import unittest
+
+from support import fixtures, make_lexer, read
+from src.lexer.lexical_error import LexicalError
+from src.parser.parse_error import ParseError
+from src.parser.parser import Parser
+from src.semantic.AST.ast_builder import ASTBuilder, ASTError
+from src.semantic.AST.ast_parser import ASTParser
+
+
+def dump(value, seen=None):
+    '''Bentuk AST yang bisa dibandingkan: nama class + semua slot/atribut, rekursif.
+    Node yang sudah pernah di-dump (mis. operand di children sekaligus left/right) jadi referensi'''
+    if seen is None:
+        seen = {}
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, [dump(item, seen) for item in value]
+    if not hasattr(value, "__slots__") and not hasattr(value, "__dict__"):
+        return repr(value)
+    if id(value) in seen:
+        return "ref", seen[id(value)]
+    seen[id(value)] = len(seen)
+    fields = {}
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(value, name):
+                fields[name] = getattr(value, name)
+    fields.update(getattr(value, "__dict__", {}))
+    return type(value).__name__, [(name, dump(fields[name], seen)) for name in sorted(fields)]
+
+
+def outcome(parse):
+    try:
+        return dump(parse())
+    except (ParseError, ASTError) as e:
+        return type(e).__name__, str(e)
+
+
+class ProgramGenerator:
+    '''Program Pascal-S acak (seeded) yang memakai semua produksi grammar'''
+    RELOPS = ["=", "<>", "<", "<=", ">", ">="]
+    ADDOPS = ["+", "-", "atau"]
+    MULOPS = ["*", "/", "bagi", "mod", "dan"]
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def name(self):
+        return self.rng.choice(["a", "b", "x", "y", "total", "r", "arr", "writeln", "f"])
+
+    def variable(self, depth):
+        text = self.name()
+        for _ in range(self.rng.randint(0, 2) if depth < 1 else 0):
+            if self.rng.random() < 0.5:
+                text += "." + self.name()
+            else:
+                text += f"[{self.expression(depth + 1)}]"
+        return text
+
+    def factor(self, depth):
+        choice = self.rng.randrange(9 if depth < 1 else 5)
+        if choice == 0:
+            return str(self.rng.randint(0, 99))
+        if choice == 1:
+            return self.rng.choice(["'c'", "'teks'", "3.14", "true", "false"])
+        if choice in (2, 3, 4):
+            return self.variable(depth)
+        if choice == 5:
+            return "tidak " + self.factor(depth + 1)
+        if choice == 6:
+            return f"({self.expression(depth + 1)})"
+        args = ", ".join(self.expression(depth + 1) for _ in range(self.rng.randint(0, 3)))
+        return f"{self.name()}({args})"
+
+    def term(self, depth):
+        text = self.factor(depth)
+        for _ in range(self.rng.randint(0, 1)):
+            text += f" {self.rng.choice(self.MULOPS)} {self.factor(depth)}"
+        return text
+
+    def simple_expression(self, depth):
+        text = self.rng.choice(["", "", "-", "+"]) + self.term(depth)
+        for _ in range(self.rng.randint(0, 1)):
+            text += f" {self.rng.choice(self.ADDOPS)} {self.term(depth)}"
+        return text
+
+    def expression(self, depth=0):
+        text = self.simple_expression(depth)
+        if self.rng.random() < 0.3:
+            text += f" {self.rng.choice(self.RELOPS)} {self.simple_expression(depth)}"
+        return text
+
+    def statement(self, depth):
+        choice = self.rng.randrange(1, 10 if depth < 3 else 3)
+        if choice == 1:
+            return f"{self.variable(depth)} := {self.expression()}"
+        if choice == 2:
+            return f"{self.name()}({self.expression()})"
+        if choice == 3:
+            text = f"jika {self.expression()} maka {self.statement(depth + 1)}"
+            if self.rng.random() < 0.5:
+                text += f" selain_itu {self.statement(depth + 1)}"
+            return text
+        if choice == 4:
+            return f"selama {self.expression()} lakukan {self.statement(depth + 1)}"
+        if choice == 5:
+            direction = self.rng.choice(["ke", "turun_ke"])
+            return f"untuk {self.name()} := {self.expression()} {direction} {self.expression()} lakukan {self.statement(depth + 1)}"
+        if choice == 6:
+            return f"ulangi {self.statements(depth + 1)} sampai {self.expression()}"
+        if choice == 7:
+            branches = []
+            for _ in range(self.rng.randint(1, 3)):
+                labels = ", ".join(self.rng.choice(["1", "2", "'c'", "true"]) for _ in range(self.rng.randint(1, 2)))
+                branches.append(f"{labels}: {self.statement(depth + 1)}")
+            # case-list ga punya penutup, jadi kasus dibungkus compound supaya statement sesudahnya tetap valid
+            return f"mulai kasus {self.expression()} dari " + "; ".join(branches) + " selesai"
+        return self.compound(depth + 1)
+
+    def statements(self, depth):
+        return "; ".join(self.statement(depth) for _ in range(self.rng.randint(1, 3)))
+
+    def compound(self, depth=0):
+        # <empty-statement> cuma boleh sebelum ";" atau "selesai"
+        choice = self.rng.randrange(6)
+        if choice == 0:
+            return "mulai selesai"
+        return f"mulai {self.statements(depth)}{';' if choice == 1 else ''} selesai"
+
+    def type(self, depth=0):
+        choice = self.rng.randrange(5 if depth < 2 else 3)
+        if choice == 0:
+            return self.rng.choice(["integer", "real", "boolean", "char"])
+        if choice in (1, 2):
+            return self.name()
+        if choice == 3:
+            return f"larik [{self.expression()} .. {self.expression()}] dari {self.type(depth + 1)}"
+        fields = "; ".join(f"{self.name()}: {self.type(depth + 1)}" for _ in range(self.rng.randint(1, 3)))
+        return f"rekaman {fields} selesai"
+
+    def parameters(self):
+        if self.rng.random() < 0.3:
+            return ""
+        groups = []
+        for _ in range(self.rng.randint(1, 3)):
+            prefix = "variabel " if self.rng.random() < 0.3 else ""
+            groups.append(f"{prefix}{self.name()}, {self.name()}: {self.type()}")
+        return "(" + "; ".join(groups) + ")"
+
+    def declarations(self, depth=0):
+        parts = []
+        if self.rng.random() < 0.5:
+            parts.append("konstanta " + " ".join(f"{self.name()} = {self.expression()};" for _ in range(2)))
+        if self.rng.random() < 0.5:
+            definition = self.rng.choice([f"{self.rng.randint(0, 9)} .. {self.rng.randint(10, 99)}", self.type()])
+            parts.append(f"tipe {self.name()} = {definition}; {self.name()} = {self.type()};")
+        if self.rng.random() < 0.8:
+            parts.append("variabel " + " ".join(f"{self.name()}, {self.name()}: {self.type()};" for _ in range(2)))
+        for _ in range(self.rng.randint(0, 2) if depth < 1 else 0):
+            if self.rng.random() < 0.5:
+                header = f"prosedur {self.name()}{self.parameters()};"
+            else:
+                header = f"fungsi {self.name()}{self.parameters()}: {self.type()};"
+            parts.append(f"{header} {self.declarations(depth + 1)} {self.compound()};")
+        return " ".join(parts)
+
+    def program(self):
+        return f"program {self.name()}; {self.declarations()} {self.compound()}."
+
+
+class ASTParserEquivalenceTest(unittest.TestCase):
+    '''Grammar cuma ada di Parser: ASTParser (builder AST langsung) harus identik dengan
+    ASTBuilder di atas parse tree, termasuk ParseError/ASTError untuk input yang rusak'''
+    def setUp(self):
+        self.lexer = make_lexer()
+
+    def assert_equivalent(self, tokens):
+        expected = outcome(lambda: ASTBuilder(Parser(iter(tokens)).parse()).build())
+        actual = outcome(lambda: ASTParser(iter(tokens)).parse())
+        # assertEqual biasa nge-diff seluruh dump AST, terlalu lambat untuk program besar
+        self.assertTrue(actual == expected, f"ASTParser: {str(actual)[:300]}\nASTBuilder: {str(expected)[:300]}")
+
+    def test_fixtures(self):
+        for path in fixtures("milestone-2", "milestone-3"):
+            with self.subTest(path=path.name):
+                try:
+                    tokens = self.lexer.tokenize(read(path))
+                except LexicalError:
+                    continue
+                self.assert_equivalent(tokens)
+
+    def test_generated_programs(self):
+        for seed in range(200):
+            source = ProgramGenerator(seed).program()
+            with self.subTest(seed=seed):
+                self.assert_equivalent(self.lexer.tokenize(source))
+
+    def test_broken_programs(self):
+        rng = random.Random(0)
+        for seed in range(200):
+            tokens = self.lexer.tokenize(ProgramGenerator(seed).program())
+            for _ in range(rng.randint(1, 3)):
+                i = rng.randrange(len(tokens))
+                if rng.random() < 0.5:
+                    del tokens[i]
+                else:
+                    tokens.insert(i, tokens[rng.randrange(len(tokens))])
+            with self.subTest(seed=seed):
+                self.assert_equivalent(tokens)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import TEST_DIR, deep_expression, deep_statement, run_compiler, run_compiler_in_process
+from src import compiler
+from src.lexer.token_buffer import TokenBuffer
+from src.semantic.errors import SemanticError, UndeclaredIdentifierError
+
+
+class ErrorPrecedenceTest(unittest.TestCase):
+    '''Parser narik token dari lexer sambil jalan, tapi LexicalError tetap menang atas syntax error
+    yang posisinya lebih awal (sama seperti lex seluruh file dulu baru parse)'''
+    def test_lexical_error_wins_over_earlier_syntax_error(self):
+        for milestone in ("milestone-2", "milestone-3"):
+            with self.subTest(milestone=milestone):
+                code, stdout, _ = run_compiler(f"{milestone}/input/input-fail-lexical.pas")
+                self.assertEqual(code, 1)
+                self.assertIn("LexicalError: Invalid character: '#'", stdout)
+                self.assertIn("(line 7, column 10)", stdout)
+                self.assertNotIn("SyntaxError", stdout)
+
+
+class Milestone2TokenBufferTest(unittest.TestCase):
+    '''Milestone-2 lex ke satu TokenBuffer yang dipakai Parser dan ParseTreeBuilder, builder ga masuk mode collect'''
+    def test_parser_and_tree_share_buffer(self):
+        builders = []
+        def spy(tokens=None, builder_class=compiler.ParseTreeBuilder):
+            builders.append(builder_class(tokens))
+            return builders[-1]
+        with mock.patch.object(compiler, "ParseTreeBuilder", side_effect=spy) as builder_class, \
+                mock.patch.object(compiler, "Parser", wraps=compiler.Parser) as parser_class:
+            code, stdout, written = run_compiler_in_process("milestone-2/input/input-1.pas", "--no-echo")
+        self.assertEqual(code, 0, stdout)
+        self.assertTrue(written)
+        (buffer, *_), _ = parser_class.call_args
+        self.assertIsInstance(buffer, TokenBuffer)
+        builder_class.assert_called_once_with(buffer)
+        self.assertFalse(builders[0].collect)
+        self.assertIs(builders[0].tree.tokens, buffer)
+
+
+class SemanticErrorOutputTest(unittest.TestCase):
+    '''Semantic error yang punya posisi dicetak dengan line konteks dari source (SemanticError.render)'''
+    SOURCE = "milestone-3/input/input-1.pas"
+
+    def test_reported_errors_are_rendered(self):
+        errors = [UndeclaredIdentifierError("c", 7, 8), SemanticError("tanpa posisi")]
+        with mock.patch.object(compiler.SemanticAnalyzer, "analyze", return_value=(False, errors)):
+            code, stdout, _ = run_compiler_in_process(self.SOURCE, "--no-echo")
+        self.assertEqual(code, 1)
+        self.assertIn("  - SemanticError: Undeclared identifier 'c'\n"
+                      "      --> (line 7, column 8)\n"
+                      "       |\n"
+                      "     7 |   b := a + 10;\n"
+                      "       |        ^\n", stdout)
+        self.assertIn("  - Semantic error: tanpa posisi\n", stdout)
+
+    def test_raised_error_is_rendered(self):
+        with mock.patch.object(compiler.SemanticAnalyzer, "analyze", side_effect=UndeclaredIdentifierError("b", 8, 25)):
+            code, stdout, _ = run_compiler_in_process(self.SOURCE, "--no-echo")
+        self.assertEqual(code, 1)
+        self.assertIn("[Semantic Error] SemanticError: Undeclared identifier 'b'\n  --> (line 8, column 25)", stdout)
+        self.assertIn(" 8 |   writeln('Result = ', b);\n", stdout)
+
+
+class DeepNestingTest(unittest.TestCase):
+    '''Parser, AST, semantic, dan writer jalan tanpa rekursi: nesting DEPTH level (jauh di atas recursion
+    limit) tetap lolos end-to-end. Program dibangkitkan di test, ditulis sementara ke milestone-3/input.
+    Output jsonl + --no-echo karena tree teks lebarnya kuadratik terhadap kedalaman'''
+    DEPTH = 20000
+
+    def compile_deep(self, source):
+        with tempfile.NamedTemporaryFile("w", suffix=".pas", dir=TEST_DIR / "milestone-3" / "input",
+                                         encoding="utf-8", delete=False) as f:
+            f.write(source)
+        self.addCleanup(os.remove, f.name)
+        code, stdout, written = run_compiler(f"milestone-3/input/{Path(f.name).name}", "--ast-format=jsonl", "--no-echo")
+        self.assertEqual(code, 0, stdout)
+        self.assertIn("[OK] Semantic analysis passed!", stdout)
+        records = [json.loads(line) for line in written.splitlines()]
+        return [record["node"] for record in records], max(record["depth"] for record in records)
+
+    def test_deep_statement_nesting(self):
+        nodes, depth = self.compile_deep(deep_statement(self.DEPTH))
+        self.assertEqual(nodes.count("IfNode"), self.DEPTH)
+        self.assertEqual(nodes.count("WhileNode"), self.DEPTH)
+        self.assertGreater(depth, 2 * self.DEPTH)
+
+    def test_deep_expression_nesting(self):
+        nodes, depth = self.compile_deep(deep_expression(self.DEPTH))
+        self.assertEqual(nodes.count("BinOpNode"), self.DEPTH)
+        self.assertEqual(nodes.count("UnaryOpNode"), self.DEPTH)
+        self.assertGreater(depth, self.DEPTH)
+
+
+if __name__ == "__main__":
+    unittest.main()
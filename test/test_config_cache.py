@@ -0,0 +1,46 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import CONFIG_DIR
+from src.config_cache import ConfigCache, CompiledConfig
+
+CONFIG_FILES = ("states.json", "transitions.json", "token_maps.json")
+
+
+class ConfigCacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.paths = tuple(str(CONFIG_DIR / name) for name in CONFIG_FILES)
+
+    def test_generator_modules_are_part_of_key(self):
+        sources = {Path(path).name for path in ConfigCache.generator_sources()}
+        for module in ("regex_lexer.py", "generated_lexer.py", "dfa_minimizer.py", "dfa_config.py",
+                       "lexer_config.py", "config_cache.py"):
+            self.assertIn(module, sources)
+
+    def test_changed_generator_source_changes_key(self):
+        generator = self.tmp / "generator.py"
+        generator.write_text("def generate(): return 1\n")
+        with mock.patch.object(ConfigCache, "generator_sources", return_value=(str(generator),)):
+            before = ConfigCache.key(self.paths)
+            generator.write_text("def generate(): return 2\n")
+            self.assertNotEqual(ConfigCache.key(self.paths), before)
+
+    def test_stale_cache_is_rebuilt(self):
+        cache_dir = str(self.tmp / "cache")
+        compiled = ConfigCache.load(*self.paths, cache_dir=cache_dir)
+        self.assertIsInstance(compiled, CompiledConfig)
+        with mock.patch.object(ConfigCache, "key", return_value="generator berubah"), \
+             mock.patch.object(ConfigCache, "build", wraps=ConfigCache.build) as build:
+            ConfigCache.load(*self.paths, cache_dir=cache_dir)
+            self.assertEqual(build.call_count, 1)
+            ConfigCache.load(*self.paths, cache_dir=cache_dir)
+            self.assertEqual(build.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import unittest
+
+from support import deep_expression, deep_statement, make_lexer
+from src.parser.parser import Parser
+from src.semantic.AST.ast_builder import ASTBuilder
+from src.semantic.errors import InvalidOperationError
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+
+DEPTH = 20000
+
+
+def ast_shape(root):
+    '''(kedalaman maksimum, jumlah node per nama class) AST, tanpa rekursi'''
+    depth, counts, stack = 0, {}, [(root, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        name = type(node).__name__
+        counts[name] = counts.get(name, 0) + 1
+        stack.extend((child, level + 1) for child in getattr(node, "children", ()) if child is not None)
+    return depth, counts
+
+
+class DeepNestingTest(unittest.TestCase):
+    '''ASTBuilder dan SemanticAnalyzer masing-masing dites di kedalaman jauh di atas recursion limit'''
+    @classmethod
+    def setUpClass(cls):
+        cls.lexer = make_lexer()
+
+    def setUp(self):
+        self.assertGreater(DEPTH, 10 * sys.getrecursionlimit())
+
+    def build(self, source):
+        return ASTBuilder(Parser(self.lexer.tokenize_buffer(source)).parse()).build()
+
+
+class ASTBuilderDepthTest(DeepNestingTest):
+    def test_deep_statement_nesting(self):
+        depth, counts = ast_shape(self.build(deep_statement(DEPTH)))
+        self.assertEqual(counts["IfNode"], DEPTH)
+        self.assertEqual(counts["WhileNode"], DEPTH)
+        self.assertGreater(depth, 2 * DEPTH)
+
+    def test_deep_expression_nesting(self):
+        depth, counts = ast_shape(self.build(deep_expression(DEPTH)))
+        self.assertEqual(counts["BinOpNode"], DEPTH)
+        self.assertEqual(counts["UnaryOpNode"], DEPTH)
+        self.assertGreater(depth, DEPTH)
+
+
+class SemanticAnalyzerDepthTest(DeepNestingTest):
+    def test_deep_statement_nesting(self):
+        success, errors = SemanticAnalyzer().analyze(self.build(deep_statement(DEPTH)))
+        self.assertTrue(success, errors[:3])
+
+    def test_deep_expression_nesting(self):
+        success, errors = SemanticAnalyzer().analyze(self.build(deep_expression(DEPTH)))
+        self.assertTrue(success, errors[:3])
+
+    def test_error_at_the_bottom_is_reported(self):
+        # operand paling dalam boolean: error pertama harus dari "1 + flag" di dasar nesting
+        success, errors = SemanticAnalyzer().analyze(self.build(deep_expression(DEPTH, innermost="flag")))
+        self.assertFalse(success)
+        self.assertIsInstance(errors[0], InvalidOperationError)
+        self.assertIn("integer and boolean", str(errors[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from itertools import product
+
+import support  # noqa: F401  (root repo ke sys.path)
+from src.dfa.dfa_config import ANY, DIGIT, LETTER, DFAConfig, DFAConfigLoader
+from src.dfa.dfa_engine import DFAEngine
+from src.dfa.dfa_minimizer import DFAMinimizer
+
+# DFA kecil buatan tangan:
+# - ID1/ID2: identifier, sama-sama IDENTIFIER dan transisinya setara -> digabung
+# - LT/GT: tanpa transisi keluar tapi token type beda -> tidak boleh digabung
+# - NUM: angka, DOT: "1." setengah jalan ke REAL
+# - DEAD: "#..." ga pernah sampai final -> dilaporkan, tapi tetap disimpan
+# - LOST: ga bisa dicapai dari START -> dibuang
+TRANSITIONS = {
+    "START": {LETTER: "ID1", DIGIT: "NUM", "<": "LT", ">": "GT", "#": "DEAD"},
+    "ID1": {LETTER: "ID2", DIGIT: "ID2"},
+    "ID2": {LETTER: "ID1", DIGIT: "ID1"},
+    "NUM": {DIGIT: "NUM", ".": "DOT"},
+    "DOT": {DIGIT: "REAL"},
+    "REAL": {DIGIT: "REAL"},
+    "DEAD": {ANY: "DEAD"},
+    "LOST": {"x": "ID1"},
+}
+TOKEN_TYPES = {"ID1": "IDENTIFIER", "ID2": "IDENTIFIER", "NUM": "NUMBER", "REAL": "NUMBER",
+               "LT": "LESS", "GT": "GREATER"}
+
+
+def make_config(transitions=TRANSITIONS, final_states=frozenset(TOKEN_TYPES)):
+    states = set(transitions) | {target for mapping in transitions.values() for target in mapping.values()}
+    return DFAConfig("START", set(final_states), states, transitions,
+                     DFAConfigLoader.compile("START", set(final_states), states, transitions))
+
+
+def longest_match(config, token_map, text, index):
+    '''(end, token type) dari longest match, token type None kalau ga ada final state'''
+    end, final = DFAEngine(config).run(text, index)
+    return end, None if final is None else token_map[config.compiled.state_names[final]]
+
+
+class DFAMinimizerTest(unittest.TestCase):
+    def setUp(self):
+        self.config = make_config()
+        self.minimized, self.report = DFAMinimizer.minimize(self.config, dict(TOKEN_TYPES, GHOST="NUMBER"))
+
+    def test_report(self):
+        self.assertEqual(self.report.merged, {"ID1": ("ID2",)})
+        self.assertEqual(self.report.unreachable, ("LOST",))
+        self.assertEqual(self.report.dead, ("DEAD",))
+        self.assertEqual(self.report.unused_token_states, ("GHOST",))
+        self.assertEqual(self.report.states_before, 10)
+        # ID2 digabung, LOST dibuang
+        self.assertEqual(self.report.states_after, 8)
+        self.assertEqual(self.minimized.compiled.state_names[0], "START")
+        self.assertNotIn("LOST", self.minimized.states)
+        self.assertIn("DEAD", self.minimized.states)
+
+    def test_final_states_with_different_token_types_are_kept_apart(self):
+        names = self.minimized.compiled.state_names
+        self.assertIn("LT", names)
+        self.assertIn("GT", names)
+        # NUM dan REAL sama-sama NUMBER tapi transisinya beda ("." cuma dari NUM)
+        self.assertIn("NUM", names)
+        self.assertIn("REAL", names)
+
+    def test_longest_match_unchanged(self):
+        alphabet = "a1<>#.x "
+        texts = ["".join(chars) for n in range(1, 4) for chars in product(alphabet, repeat=n)]
+        texts += ["abc12 < 3.14 > #x", "12.5.6", "1..2", "a1b2c3d4"]
+        for text in texts:
+            for index in range(len(text)):
+                self.assertEqual(longest_match(self.minimized, TOKEN_TYPES, text, index),
+                                 longest_match(self.config, TOKEN_TYPES, text, index), (text, index))
+
+    def test_final_state_without_token_type(self):
+        token_map = {state: kind for state, kind in TOKEN_TYPES.items() if state != "GT"}
+        with self.assertRaisesRegex(ValueError, "without token type in state_token_map: GT"):
+            DFAMinimizer.minimize(self.config, token_map)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import io
+import unittest
+from unittest import mock
+
+from support import fixtures, make_lexer, read, run_compiler_in_process
+from src.dfa.dfa_engine import DFAEngine
+from src.lexer import backends
+from src.lexer.backends import LEXER_BACKENDS, DEFAULT_BACKEND
+from src.lexer.lexical_error import LexicalError
+from src.utils import format_tokens
+
+# Kasus pinggir: "0..9" = NUMBER(0.) DOT NUMBER(9), string/komentar ga ketutup, karakter invalid, non-ASCII
+EDGE_CASES = [
+    "", "   \t  ", "\n\n", "0..9", "1..", "1.", "3.14.15", "a..b", "x:=1.5e3;",
+    "'abc", "x := 'ab\n  y := 1;", "''", "'it''s'", "x := 'é';",
+    "{ komentar", "(* komentar", "a @ b", "#", "\"dq\"", "a\r\nb", "é := 1",
+    "program p;\nvariabel x: integer;\nmulai\n  x := 1 +\t2;\n\n  tulis(x, 'selesai')\nselesai.",
+    "MULAI Selesai mulai", "x:=-1;y:=+2*(3-4) mod 5 bagi 6",
+]
+
+def lex(lexer, text, streaming=False):
+    '''Token list, atau (line, column, message) kalau LexicalError'''
+    try:
+        if streaming:
+            # chunk kecil biar token sering kepotong di batas chunk
+            return list(lexer.iter_tokens(io.StringIO(text), chunk_size=7))
+        return lexer.tokenize(text)
+    except LexicalError as e:
+        return ("LexicalError", e.line, e.column, e.message)
+
+
+class LexerBackendEquivalenceTest(unittest.TestCase):
+    '''Semua backend (dfa, regex, generated) dan iter_tokens harus menghasilkan token stream yang sama'''
+    @classmethod
+    def setUpClass(cls):
+        cls.lexers = {backend: make_lexer(backend) for backend in LEXER_BACKENDS}
+        cls.reference = cls.lexers[DEFAULT_BACKEND]
+
+    def assert_same_tokens(self, text, label):
+        expected = lex(self.reference, text)
+        for backend, lexer in self.lexers.items():
+            with self.subTest(label, backend=backend):
+                self.assertEqual(lex(lexer, text), expected)
+        for backend, lexer in self.lexers.items():
+            with self.subTest(label, backend=backend, streaming=True):
+                self.assertEqual(lex(lexer, text, streaming=True), expected)
+
+    def test_fixtures(self):
+        for path in fixtures("milestone-1", "milestone-2", "milestone-3"):
+            self.assert_same_tokens(read(path), path.name)
+
+    def test_edge_cases(self):
+        for text in EDGE_CASES:
+            self.assert_same_tokens(text, repr(text))
+
+    def test_token_list_matches_buffer(self):
+        # tokenize bikin list Token langsung, harus sama dengan TokenBuffer (termasuk output milestone-1)
+        texts = [read(path) for path in fixtures("milestone-1", "milestone-2", "milestone-3")] + EDGE_CASES
+        for backend, lexer in self.lexers.items():
+            for text in texts:
+                with self.subTest(text=text[:40], backend=backend):
+                    try:
+                        buffer = lexer.tokenize_buffer(text)
+                    except LexicalError:
+                        continue
+                    tokens = lexer.tokenize(text)
+                    self.assertEqual(tokens, list(buffer))
+                    self.assertEqual([token.literal for token in tokens],
+                                     [buffer.literal_of(index) for index in range(len(buffer))])
+                    self.assertEqual(format_tokens(buffer), format_tokens(tokens))
+
+    def test_range_after_number(self):
+        tokens = self.reference.tokenize("0..9")
+        self.assertEqual([(t.type, t.value) for t in tokens], [("NUMBER", "0."), ("DOT", "."), ("NUMBER", "9")])
+
+    def test_engine_run_matches_next_state(self):
+        # run pakai rows + skip self-loop, harus sama dengan jalan per karakter lewat next_state
+        engine = self.reference.dfa
+        def walk(text, index):
+            state, last_final = engine.compiled.start, None
+            while index < len(text):
+                state = engine.next_state(state, text[index])
+                if state < 0:
+                    break
+                if engine.is_accepting(state):
+                    last_final = state
+                index += 1
+            return index, last_final
+        for text in EDGE_CASES + ["nama_panjang_sekali123 'isi string\npanjang' 12345.678 é_ü 'é'"]:
+            for index in range(len(text)):
+                with self.subTest(text=text, index=index):
+                    self.assertEqual(engine.run(text, index), walk(text, index))
+
+    def test_errors_are_reported(self):
+        for text in ("'abc", "{ komentar", "a @ b"):
+            with self.subTest(text=text):
+                self.assertEqual(lex(self.reference, text)[0], "LexicalError")
+
+
+class BackendSelectionTest(unittest.TestCase):
+    '''--lexer=... harus benar-benar dipakai di semua milestone, termasuk iter_tokens (milestone-2/3)'''
+    def compile_with_spies(self, source_arg, backend):
+        '''Jalankan compiler, return jumlah panggilan (DFAEngine.run, scanner backend)'''
+        counts = {"dfa": 0, "backend": 0}
+        engine_run = DFAEngine.run
+
+        def counted_run(engine, text, index):
+            counts["dfa"] += 1
+            return engine_run(engine, text, index)
+
+        def spied_create_lexer(*args, **kwargs):
+            lexer = backends.create_lexer(*args, **kwargs)
+            if backend == "regex":
+                pattern = lexer.pattern
+                def counted_match(text, index):
+                    counts["backend"] += 1
+                    return pattern.match(text, index)
+                def counted_finditer(text, index):
+                    counts["backend"] += 1
+                    return pattern.finditer(text, index)
+                lexer.pattern = mock.Mock(wraps=pattern, match=counted_match, finditer=counted_finditer,
+                                          pattern=pattern.pattern)
+            elif backend == "generated":
+                scan = lexer.scan
+                def counted_scan(text, index):
+                    counts["backend"] += 1
+                    return scan(text, index)
+                lexer.scan = counted_scan
+            return lexer
+
+        with mock.patch.object(DFAEngine, "run", counted_run), \
+                mock.patch("src.compiler.create_lexer", spied_create_lexer):
+            code, stdout, _ = run_compiler_in_process(source_arg, f"--lexer={backend}", "--no-echo")
+        self.assertEqual(code, 0, stdout)
+        return counts
+
+    def test_backend_scanner_is_used(self):
+        for milestone in ("milestone-1", "milestone-2", "milestone-3"):
+            source_arg = f"{milestone}/input/input-1.pas"
+            with self.subTest(milestone=milestone, backend="dfa"):
+                self.assertGreater(self.compile_with_spies(source_arg, "dfa")["dfa"], 0)
+            with self.subTest(milestone=milestone, backend="generated"):
+                counts = self.compile_with_spies(source_arg, "generated")
+                self.assertGreater(counts["backend"], 0)
+                self.assertEqual(counts["dfa"], 0)
+            with self.subTest(milestone=milestone, backend="regex"):
+                # milestone-1/2 lex seluruh text lewat finditer, milestone-3 per token lewat match
+                counts = self.compile_with_spies(source_arg, "regex")
+                self.assertGreater(counts["backend"], 0)
+                self.assertEqual(counts["dfa"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
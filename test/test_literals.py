@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+from support import make_lexer
+from src.lexer import token, token_buffer
+from src.lexer.literals import decode_literal
+from src.lexer.token_kind import TokenKind
+
+
+class DecodeLiteralTest(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(decode_literal(TokenKind.NUMBER, "42"), 42)
+        self.assertIsInstance(decode_literal(TokenKind.NUMBER, "42"), int)
+        self.assertEqual(decode_literal(TokenKind.NUMBER, "1.5"), 1.5)
+        # "1." = NUMBER sebelum ".." di range, tetap float
+        self.assertEqual(decode_literal(TokenKind.NUMBER, "1."), 1.0)
+        self.assertIsInstance(decode_literal(TokenKind.NUMBER, "1."), float)
+
+    def test_exponent_is_not_one_number(self):
+        # Grammar ga punya eksponen: "1e3" = NUMBER(1) IDENTIFIER(e3), decode cuma lihat lexeme NUMBER-nya
+        tokens = make_lexer().tokenize("1e3")
+        self.assertEqual([(t.type, t.value, t.literal) for t in tokens],
+                         [("NUMBER", "1", 1), ("IDENTIFIER", "e3", None)])
+
+    def test_strings_and_chars_are_unquoted(self):
+        self.assertEqual(decode_literal(TokenKind.STRING_LITERAL, "'halo dunia'"), "halo dunia")
+        self.assertEqual(decode_literal(TokenKind.STRING_LITERAL, "''"), "")
+        self.assertEqual(decode_literal(TokenKind.STRING_LITERAL, "'a\nb'"), "a\nb")
+        self.assertEqual(decode_literal(TokenKind.CHAR_LITERAL, "'c'"), "c")
+
+    def test_undecodable_returns_none(self):
+        # DFA menerima "3.14.15", int/float ga bisa
+        self.assertIsNone(decode_literal(TokenKind.NUMBER, "3.14.15"))
+        self.assertIsNone(decode_literal(TokenKind.IDENTIFIER, "x"))
+        self.assertIsNone(decode_literal(TokenKind.KEYWORD, "mulai"))
+
+
+class LazyLiteralTest(unittest.TestCase):
+    '''Literal baru di-decode waktu dibaca, bukan waktu token dibuat/di-iterate'''
+    TEXT = "x := 12 + 1.5; s := 'teks'; c := 'c'"
+
+    def setUp(self):
+        self.lexer = make_lexer()
+        self.token_decode = mock.patch.object(token, "decode_literal", wraps=token.decode_literal).start()
+        self.buffer_decode = mock.patch.object(token_buffer, "decode_literal", wraps=token_buffer.decode_literal).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_tokenize_and_iteration_do_not_decode(self):
+        tokens = self.lexer.tokenize(self.TEXT)
+        buffer = self.lexer.tokenize_buffer(self.TEXT)
+        listed = list(buffer)
+        self.assertEqual(self.token_decode.call_count + self.buffer_decode.call_count, 0)
+        self.assertEqual([t.literal for t in tokens if t.literal is not None], [12, 1.5, "teks", "c"])
+        self.assertEqual(listed[2].literal, 12)
+
+    def test_buffer_caches_decoded_literal(self):
+        buffer = self.lexer.tokenize_buffer(self.TEXT)
+        self.assertEqual(buffer.literal_of(4), 1.5)
+        self.assertEqual(buffer.literal_of(4), 1.5)
+        self.assertEqual(self.buffer_decode.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from unittest import mock
+
+from support import fixtures, make_lexer, read
+from src.lexer import parallel
+from src.lexer.backends import LEXER_BACKENDS
+from src.lexer.lexical_error import LexicalError
+from src.lexer.parallel import split_chunks, tokenize_parallel
+
+
+def columns(lex):
+    '''Semua kolom TokenBuffer + line_starts, atau (line, column, message) kalau LexicalError'''
+    try:
+        buffer = lex()
+    except LexicalError as e:
+        return ("LexicalError", e.line, e.column, e.message)
+    return (list(buffer.kinds), list(buffer.keywords), list(buffer.starts), list(buffer.lengths),
+            list(buffer.lines), list(buffer.line_starts))
+
+
+def program(rng, lines):
+    '''Program acak dengan string literal multi-line yang sering nyebrang batas chunk'''
+    parts = ["program p;", "variabel x: integer;", "mulai"]
+    for i in range(lines):
+        choice = rng.randrange(4)
+        if choice == 0:
+            parts.append(f"  x := x + {i} * (x - 1);")
+        elif choice == 1:
+            parts.append(f"  writeln('baris {i}\n  masih string\n\n  ''{i}');")
+        elif choice == 2:
+            parts.append(f"  jika x > {i} maka x := 0\t;")
+        else:
+            parts.append("")
+    return "\n".join(parts + ["selesai."])
+
+
+class TokenizeParallelTest(unittest.TestCase):
+    '''tokenize_parallel (pool + merge chunk) harus identik dengan tokenize_buffer: token, line_starts,
+    dan LexicalError pertama. Threshold diturunkan ke 0 dan chunk dibuat kecil biar pool & merge jalan'''
+    @classmethod
+    def setUpClass(cls):
+        cls.lexers = {backend: make_lexer(backend) for backend in LEXER_BACKENDS}
+        patcher = mock.patch.object(parallel, "PARALLEL_THRESHOLD", 0)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def assert_same(self, text, label, chunks=(3, 8)):
+        for backend, lexer in self.lexers.items():
+            expected = columns(lambda: lexer.tokenize_buffer(text))
+            for count in chunks:
+                with self.subTest(label, backend=backend, chunks=count):
+                    self.assertEqual(columns(lambda: tokenize_parallel(lexer, text, 2, count)), expected)
+
+    def test_split_chunks_start_after_newline(self):
+        text = "a\nbb\n\nccc\nd"
+        bounds = split_chunks(text, 4)
+        self.assertEqual(bounds[0], 0)
+        for bound in bounds[1:]:
+            self.assertEqual(text[bound - 1], "\n")
+
+    def test_fixtures(self):
+        for path in fixtures("milestone-2", "milestone-3"):
+            self.assert_same(read(path), path.name, chunks=(5,))
+
+    def test_multiline_strings_across_chunks(self):
+        rng = random.Random(0)
+        for seed in range(3):
+            self.assert_same(program(rng, 40), f"seed={seed}")
+        # satu string literal yang isinya newline semua: tiap batas chunk jatuh di dalam string
+        self.assert_same("x := '" + "\n" * 30 + "';\ny := 1", "string of newlines")
+
+    def test_first_error_location(self):
+        rng = random.Random(1)
+        text = program(rng, 40)
+        lines = text.split("\n")
+        # char invalid di chunk belakang, dan "'" yang ga ketutup (error di posisi quote, bukan di chunk berikutnya)
+        lines[30] += " @"
+        self.assert_same("\n".join(lines), "invalid char")
+        lines[10] += " x := 'ga ketutup"
+        self.assert_same("\n".join(lines), "unterminated string")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import io
+import unittest
+
+from support import fixtures, make_lexer, read
+from test_ast_parser import ProgramGenerator
+from src.lexer.lexical_error import LexicalError
+from src.parser.parse_error import ParseError
+from src.parser.parse_node import ParseNode, ParseNodeBuilder
+from src.parser.parse_tree import ParseTreeBuilder, ParseTreeVisitor
+from src.parser.parser import Parser
+from src.parser.tree_builder import TreeBuilder
+from src.semantic.AST.ast_parser import ASTTreeBuilder
+
+
+def node_leaves(node):
+    '''Token leaf ParseNode urut source (stack, tree fixture bisa dalam)'''
+    stack, leaves = [node], []
+    while stack:
+        current = stack.pop()
+        if isinstance(current, ParseNode):
+            stack.extend(reversed(current.child))
+        else:
+            leaves.append(current)
+    return leaves
+
+
+class EventCounter(ParseTreeVisitor):
+    def __init__(self):
+        self.events = []
+
+    def visit_if_statement(self, tree, node):
+        self.events.append(("visit", node))
+
+    def leave_if_statement(self, tree, node):
+        self.events.append(("leave", node))
+
+    def visit_token(self, tree, node):
+        self.events.append(("token", node))
+
+
+class ParseTreeBuilderTest(unittest.TestCase):
+    '''ParseTree dari ParseTreeBuilder harus sama dengan ParseNode dari Parser biasa,
+    baik token dari TokenBuffer (leaf = index Parser) maupun streaming (token dikumpulkan builder)'''
+    def setUp(self):
+        self.lexer = make_lexer()
+
+    def assert_same_tree(self, source):
+        tokens = self.lexer.tokenize(source)
+        try:
+            expected = Parser(iter(tokens)).parse()
+        except ParseError:
+            return
+        buffer = self.lexer.tokenize_buffer(source)
+        for tree in (Parser(iter(tokens), builder=ParseTreeBuilder()).parse(),
+                     Parser(buffer, builder=ParseTreeBuilder(buffer)).parse()):
+            written = io.StringIO()
+            tree.write_tree(written)
+            self.assertEqual(written.getvalue(), str(expected))
+            self.assertEqual(str(tree.to_node()), str(expected))
+            self.assertEqual([(token.type, token.value) for token in map(tree.tokens.__getitem__, tree.leaves())],
+                             [(token.type, token.value) for token in node_leaves(expected)])
+
+    def test_fixtures(self):
+        for path in fixtures("milestone-2", "milestone-3"):
+            with self.subTest(path=path.name):
+                try:
+                    self.assert_same_tree(read(path))
+                except LexicalError:
+                    continue
+
+    def test_generated_programs(self):
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                self.assert_same_tree(ProgramGenerator(seed).program())
+
+    def test_navigation(self):
+        source = "program p; mulai jika a maka jika b maka x := 1 selain_itu x := 2 selesai."
+        tree = Parser(iter(self.lexer.tokenize(source)), builder=ParseTreeBuilder()).parse()
+        self.assertEqual(tree.type_of(0), "<program>")
+        self.assertEqual(tree.end(0), len(tree))
+        self.assertEqual([tree.type_of(child) for child in tree.children(0)],
+                         ["<program-header>", "<declaration-part>", "<compound-statement>", "DOT"])
+        depths = dict(tree.walk())
+        for node, depth in tree.walk():
+            for child in tree.children(node):
+                self.assertEqual(depths[child], depth + 1)
+
+        counter = EventCounter()
+        counter.visit(tree)
+        ifs = [node for node, _ in tree.walk() if tree.type_of(node) == "<if-statement>"]
+        outer, inner = ifs
+        events = counter.events
+        # if dalam dikunjungi dan ditinggalkan di dalam if luar, token di antaranya urut source
+        self.assertLess(events.index(("visit", outer)), events.index(("visit", inner)))
+        self.assertLess(events.index(("leave", inner)), events.index(("leave", outer)))
+        self.assertEqual(sum(kind == "token" for kind, _ in events), len(list(tree.leaves())))
+
+
+
+class TreeBuilderTest(unittest.TestCase):
+    def test_builder_missing_a_method_cannot_be_created(self):
+        class NoResult(TreeBuilder):
+            def open(self, kind): pass
+            def token(self, token, index): pass
+            def close(self): pass
+
+        with self.assertRaisesRegex(TypeError, "result"):
+            NoResult()
+        with self.assertRaises(TypeError):
+            TreeBuilder()
+
+    def test_shipped_builders_are_complete(self):
+        for builder_class in (ParseNodeBuilder, ParseTreeBuilder, ASTTreeBuilder):
+            with self.subTest(builder=builder_class.__name__):
+                self.assertIsInstance(builder_class(), TreeBuilder)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from support import fixtures, make_lexer, read
+from src.lexer.backends import LEXER_BACKENDS
+from src.lexer.lexical_error import LexicalError
+
+# Potongan yang disisipkan: quote (buka/tutup string), newline, token pendek & panjang, char invalid.
+# Bahasa ini ga punya komentar, "{" dan "(*" ikut sebagai char invalid / operator biasa
+SNIPPETS = ["", " ", "\n", "\n\n  ", "'", "''", "'a\nb'", "x", "mulai", "123", "1.", "..", ":=",
+            "@", "{ c }", "(* c *)", "tulis('hai');\n", "'teks panjang\n\n'", "\t"]
+
+BASE = """program relex;
+variabel
+  x, y: integer;
+  s: char;
+mulai
+  x := 10;
+  writeln('string satu', x);
+  s := 'c';
+  writeln('multi
+line
+string', y);
+  jika x > 1.5 maka y := x * 2 selain_itu y := 0;
+  selama x > 0 lakukan x := x - 1
+selesai.
+"""
+
+
+def outcome(lex):
+    '''Semua kolom + line_starts, atau (line, column, message) kalau LexicalError'''
+    try:
+        buffer = lex()
+    except LexicalError as e:
+        return ("LexicalError", e.line, e.column, e.message)
+    return (list(buffer.kinds), list(buffer.keywords), list(buffer.starts), list(buffer.lengths),
+            list(buffer.lines), list(buffer.line_starts))
+
+
+class RelexTest(unittest.TestCase):
+    '''relex(old, edit) harus identik dengan tokenize_buffer(text baru), termasuk LexicalError'''
+    @classmethod
+    def setUpClass(cls):
+        cls.lexers = {backend: make_lexer(backend) for backend in LEXER_BACKENDS}
+
+    def assert_relex(self, lexer, text, start, end, replacement):
+        old = lexer.tokenize_buffer(text)
+        new_text = text[:start] + replacement + text[end:]
+        expected = outcome(lambda: lexer.tokenize_buffer(new_text))
+        actual = outcome(lambda: lexer.relex(old, text, (start, end), replacement))
+        self.assertEqual(actual, expected, f"edit {start}:{end} -> {replacement!r}")
+        return expected
+
+    def test_random_edits(self):
+        rng = random.Random(0)
+        texts = [BASE] + [read(path) for path in fixtures("milestone-3") if "fail" not in path.name]
+        for backend, lexer in self.lexers.items():
+            for n in range(150):
+                text = rng.choice(texts)
+                start = rng.randrange(len(text) + 1)
+                end = min(len(text), start + rng.choice([0, 0, 1, 2, 5, 20]))
+                with self.subTest(backend=backend, n=n):
+                    self.assert_relex(lexer, text, start, end, rng.choice(SNIPPETS))
+
+    def test_edits_inside_and_across_strings(self):
+        lexer = self.lexers["dfa"]
+        multi = BASE.index("'multi")
+        closing = BASE.index("string'") + len("string")
+        cases = [
+            (multi + 3, multi + 3, "X"),          # di dalam string multi-line
+            (multi + 6, multi + 7, ""),           # hapus newline di dalam string
+            (multi + 3, multi + 3, "\n\n"),       # tambah newline di dalam string
+            (multi, multi + 1, ""),               # hapus quote pembuka
+            (closing, closing + 1, ""),           # hapus quote penutup: string nyambung ke bawah
+            (multi + 2, closing + 3, "'"),        # edit nyebrang batas string
+            (0, len(BASE), BASE),                 # ganti semua
+            (len(BASE), len(BASE), "\nx"),        # append di akhir
+        ]
+        for start, end, replacement in cases:
+            with self.subTest(start=start, end=end, replacement=replacement):
+                self.assert_relex(lexer, BASE, start, end, replacement)
+
+    def test_newline_edits_shift_lines(self):
+        lexer = self.lexers["dfa"]
+        at = BASE.index("  x := 10;")
+        for replacement in ("\n", "\n\n\n", ""):
+            with self.subTest(replacement=replacement):
+                columns = self.assert_relex(lexer, BASE, at - 1, at, replacement)
+                self.assertNotEqual(columns[0], "LexicalError")
+
+    def test_edit_introducing_lexical_error(self):
+        lexer = self.lexers["dfa"]
+        at = BASE.index("y := x * 2")
+        for replacement in ("@", "'tanpa penutup", "x # y"):
+            with self.subTest(replacement=replacement):
+                result = self.assert_relex(lexer, BASE, at, at, replacement)
+                self.assertEqual(result[0], "LexicalError")
+
+    def test_invalid_edit_range(self):
+        lexer = self.lexers["dfa"]
+        old = lexer.tokenize_buffer(BASE)
+        with self.assertRaises(ValueError):
+            lexer.relex(old, BASE, (5, 2), "")
+        with self.assertRaises(ValueError):
+            lexer.relex(old, BASE, (0, len(BASE) + 1), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from src.semantic.errors import SemanticError, UndeclaredIdentifierError
+from src.source_file import SourceFile
+
+TEXTS = ["", "a", "\n", "\n\n", "satu\ndua\n", "satu\ndua\ntiga tanpa newline", "x := 'multi\nline';\r\ny := 1"]
+
+
+class SourceFileTest(unittest.TestCase):
+    def test_line_starts(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                lines = text.split("\n")
+                starts = SourceFile(text).line_starts
+                self.assertEqual(len(starts), len(lines) + 1)
+                self.assertEqual(starts[-1], len(text) + 1)
+                for n, line in enumerate(lines, 1):
+                    self.assertEqual(SourceFile(text).line_text(n), line)
+
+    def test_offset_position_round_trip(self):
+        for text in TEXTS:
+            source = SourceFile(text)
+            # termasuk len(text): posisi EOF di akhir line terakhir (tanpa newline pun)
+            for offset in range(len(text) + 1):
+                with self.subTest(text=text, offset=offset):
+                    line, column = source.position(offset)
+                    self.assertEqual(source.offset(line, column), offset)
+                    self.assertEqual(text[source.offset(line, 1):offset].count("\n"), 0)
+
+    def test_last_line_without_trailing_newline(self):
+        source = SourceFile("satu\ndua\ntiga")
+        self.assertEqual(source.line_count, 3)
+        self.assertEqual(source.position(len("satu\ndua\n")), (3, 1))
+        self.assertEqual(source.position(len(source.text)), (3, 5))
+        self.assertEqual(source.line_text(3), "tiga")
+        self.assertEqual(source.line_text(4), "")
+
+    def test_render(self):
+        source = SourceFile("program p;\nmulai\n  x := y\nselesai.")
+        self.assertEqual(source.render("SemanticError", "pesan", 3, 8),
+                         "SemanticError: pesan\n"
+                         "  --> (line 3, column 8)\n"
+                         "   |\n"
+                         " 3 |   x := y\n"
+                         "   |        ^")
+        rendered = source.render("ParseError", "pesan", 4, 9)
+        self.assertIn(" 4 | selesai.\n", rendered)
+        self.assertTrue(rendered.endswith("|         ^"))
+
+
+class SemanticErrorRenderTest(unittest.TestCase):
+    def test_render_with_position(self):
+        source = SourceFile("mulai\n  x := y\nselesai.")
+        error = UndeclaredIdentifierError("y", 2, 8)
+        self.assertEqual(error.render(source),
+                         source.render("SemanticError", "Undeclared identifier 'y'", 2, 8))
+
+    def test_render_without_position_is_message(self):
+        source = SourceFile("mulai\nselesai.")
+        error = SemanticError("pesan")
+        self.assertEqual(error.render(source), str(error))
+        self.assertEqual(UndeclaredIdentifierError("y", 2).render(None), str(UndeclaredIdentifierError("y", 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()